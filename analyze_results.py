@@ -0,0 +1,232 @@
+"""
+실행 기록 기반 가격/순위 분석
+
+coupang-auto.py 의 결과 기록(results.jsonl) 또는 --format parquet 로 저장한 결과 디렉터리를 읽어
+키워드별 가격 분포, 실행 간 가격 변동, 순위 변동을 계산한다.
+가격 문자열은 normalize_prices 로 한 번에 정수로 변환하고, 이후 계산은 모두 pandas 그룹 연산이라
+수백만 행의 기록도 몇 초 안에 처리한다.
+
+사용법:
+    python analyze_results.py results.jsonl
+    python analyze_results.py results --keyword 미니선풍기 --top 30
+    python analyze_results.py results.jsonl results --since 2026-01-01 --output-dir reports
+"""
+import argparse
+import glob
+import os
+import time
+
+import pandas as pd
+
+from coupang_products import ResultSink, normalize_prices, product_keys
+
+HISTORY_COLUMNS = ['run_id', 'keyword', 'rank', 'name', 'price', 'product_url', 'short_url', 'status', 'created_at']
+
+
+def read_history_file(path):
+    """
+    결과 기록(JSON Lines) 또는 Parquet 파일/디렉터리 읽기
+
+    Returns:
+        pd.DataFrame: 기록 (가격은 아직 정규화하지 않음)
+    """
+    if os.path.isdir(path):
+        # 결과 디렉터리에는 엑셀/CSV 도 함께 있으므로 Parquet 파일만 읽음
+        files = sorted(glob.glob(os.path.join(path, '*.parquet')))
+        return pd.concat([pd.read_parquet(file) for file in files], ignore_index=True) if files else pd.DataFrame()
+    if path.endswith('.parquet'):
+        return pd.read_parquet(path)
+
+    try:
+        frame = pd.read_json(path, lines=True, dtype=False)
+    except ValueError:
+        # 중단되어 마지막 줄이 잘린 기록은 한 줄씩 읽어 깨진 줄을 건너뜀
+        frame = pd.DataFrame.from_records(list(ResultSink.read(path)))
+
+    # 상태 필드가 없던 이전 형식 기록
+    if 'recorded_at' in frame:
+        created_at = frame['created_at'] if 'created_at' in frame else pd.Series(pd.NA, index=frame.index, dtype='object')
+        frame['created_at'] = created_at.fillna(frame['recorded_at'])
+    if 'status' not in frame and 'short_url' in frame:
+        frame['status'] = frame['short_url'].fillna('').str.startswith('http').map({True: 'SUCCESS', False: 'FAILED'})
+    return frame
+
+
+def load_history(paths, keyword=None, since=None):
+    """
+    여러 기록을 합쳐 분석용으로 정리
+
+    - 가격: price_text(없으면 price)를 normalize_prices 로 일괄 변환
+    - product_key: 추적 파라미터가 달라도 같은 상품이면 같은 키
+    - run_order: 실행 시작 시각 순서, run_seq: 키워드 안에서의 실행 순번
+
+    Returns:
+        pd.DataFrame: 정리된 기록
+    """
+    frames = [read_history_file(path) for path in paths]
+    history = pd.concat(frames, ignore_index=True, sort=False)
+    for column in HISTORY_COLUMNS:
+        if column not in history:
+            history[column] = pd.NA
+
+    if keyword:
+        history = history[history['keyword'] == keyword]
+    history = history.copy()
+    history['created_at'] = pd.to_datetime(history['created_at'], errors='coerce')
+    if since:
+        history = history[history['created_at'] >= pd.Timestamp(since)].copy()
+
+    source = history['price']
+    if 'price_text' in history:
+        source = history['price_text'].where(history['price_text'].fillna('') != '', history['price'])
+    if pd.api.types.is_numeric_dtype(source):
+        history['price'] = source.astype('Int64')
+    else:
+        history['price'] = normalize_prices(source)
+    history['rank'] = pd.to_numeric(history['rank'], errors='coerce').astype('Int64')
+    history['status'] = history['status'].astype('string')
+
+    # 식별자가 없는 URL 은 URL 자체를 키로 사용
+    urls = history['product_url'].fillna('')
+    history['product_key'] = product_keys(urls).fillna(urls)
+
+    # 같은 실행에서 같은 상품이 여러 번 기록되면(재시도 등) 마지막 기록 사용
+    history = history.drop_duplicates(['run_id', 'keyword', 'product_key'], keep='last')
+
+    run_started = history.groupby('run_id')['created_at'].transform('min')
+    history['run_order'] = run_started.rank(method='dense').astype('Int64')
+    history['run_seq'] = history.groupby('keyword')['run_order'].rank(method='dense').astype('Int64')
+    return history.reset_index(drop=True)
+
+
+def price_distribution(history):
+    """
+    키워드별 가격 분포 (가격이 있는 상품 기준)
+
+    Returns:
+        pd.DataFrame: 키워드별 실행 수, 상품 수, 성공률, 가격 최소/사분위/최대/평균
+    """
+    grouped = history.groupby('keyword')
+    summary = pd.DataFrame({
+        'runs': grouped['run_id'].nunique(),
+        'products': grouped['product_key'].nunique(),
+        'success_rate': history['status'].eq('SUCCESS').groupby(history['keyword']).mean().round(3)
+    })
+    priced = history.dropna(subset=['price'])
+    prices = priced['price'].astype('float64').groupby(priced['keyword'])
+    quantiles = prices.quantile([0.0, 0.25, 0.5, 0.75, 1.0]).unstack()
+    quantiles.columns = ['min', 'p25', 'median', 'p75', 'max']
+    summary = summary.join(quantiles)
+    summary['mean'] = prices.mean().round(0)
+    return summary.sort_values('products', ascending=False)
+
+
+def with_previous_run(history):
+    """
+    같은 키워드의 직전 실행 기록(가격/순위)을 붙인 기록
+
+    직전 실행에 없던 상품은 prev_* 가 비어 있다 (새로 진입).
+    """
+    ordered = history.sort_values(['keyword', 'product_key', 'run_seq'])
+    grouped = ordered.groupby(['keyword', 'product_key'], sort=False)
+    ordered['prev_run_seq'] = grouped['run_seq'].shift()
+    ordered['prev_price'] = grouped['price'].shift()
+    ordered['prev_rank'] = grouped['rank'].shift()
+
+    consecutive = ordered['prev_run_seq'] == ordered['run_seq'] - 1
+    ordered.loc[~consecutive.fillna(False), ['prev_price', 'prev_rank']] = pd.NA
+    return ordered
+
+
+def price_changes(compared):
+    """
+    직전 실행 대비 가격이 바뀐 상품
+
+    Returns:
+        pd.DataFrame: 변동 금액/비율 포함 (변동률 절댓값 내림차순)
+    """
+    changed = compared.dropna(subset=['price', 'prev_price'])
+    changed = changed[changed['price'] != changed['prev_price']].copy()
+    changed['change'] = changed['price'] - changed['prev_price']
+    changed['change_pct'] = (changed['change'].astype('float64') / changed['prev_price'].astype('float64') * 100).round(1)
+    changed = changed.reindex(changed['change_pct'].abs().sort_values(ascending=False).index)
+    return changed[['keyword', 'run_id', 'rank', 'name', 'prev_price', 'price', 'change', 'change_pct']]
+
+
+def rank_movement(compared):
+    """
+    직전 실행 대비 순위 변동 (양수면 상승)
+
+    Returns:
+        tuple: (순위가 바뀐 상품 DataFrame, 키워드별 요약 DataFrame)
+    """
+    latest = compared[compared['run_seq'] == compared.groupby('keyword')['run_seq'].transform('max')].copy()
+    latest['movement'] = latest['prev_rank'] - latest['rank']
+
+    moved = latest.dropna(subset=['movement'])
+    moved = moved[moved['movement'] != 0]
+    moved = moved.reindex(moved['movement'].abs().sort_values(ascending=False).index)
+
+    keywords = latest['keyword']
+    summary = pd.DataFrame({
+        'products': latest.groupby('keyword')['product_key'].nunique(),
+        'new_entries': latest['prev_rank'].isna().groupby(keywords).sum(),
+        'moved_up': (latest['movement'] > 0).fillna(False).groupby(keywords).sum(),
+        'moved_down': (latest['movement'] < 0).fillna(False).groupby(keywords).sum()
+    })
+    return moved[['keyword', 'run_id', 'name', 'prev_rank', 'rank', 'movement']], summary
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="실행 기록 기반 가격/순위 분석")
+    parser.add_argument("paths", nargs="+", help="결과 기록(results.jsonl) 또는 Parquet 파일/디렉터리")
+    parser.add_argument("-k", "--keyword", help="분석할 키워드 (없으면 전체)")
+    parser.add_argument("--since", help="이 날짜 이후 기록만 분석 (예: 2026-01-01)")
+    parser.add_argument("--top", type=int, default=20, help="변동 상품 출력 수")
+    parser.add_argument("--output-dir", help="분석 표를 CSV 로 저장할 디렉터리")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    start = time.perf_counter()
+    history = load_history(args.paths, keyword=args.keyword, since=args.since)
+    if history.empty:
+        print("분석할 기록이 없습니다.")
+        return
+
+    distribution = price_distribution(history)
+    compared = with_previous_run(history)
+    changes = price_changes(compared)
+    moved, movement_summary = rank_movement(compared)
+    elapsed = time.perf_counter() - start
+
+    print(f"\n=== 실행 기록 분석: {len(history):,}행, 실행 {history['run_id'].nunique()}개, "
+          f"키워드 {history['keyword'].nunique()}개 ({elapsed:.2f}s) ===")
+    with pd.option_context('display.max_columns', None, 'display.width', 160):
+        print("\n[키워드별 가격 분포]")
+        print(distribution.to_string())
+        print(f"\n[직전 실행 대비 가격 변동] {len(changes):,}건 (상위 {args.top}건)")
+        print(changes.head(args.top).to_string(index=False))
+        print("\n[최근 실행 순위 변동 요약]")
+        print(movement_summary.to_string())
+        print(f"\n[최근 실행 순위 변동] {len(moved):,}건 (상위 {args.top}건)")
+        print(moved.head(args.top).to_string(index=False))
+
+    if args.output_dir:
+        os.makedirs(args.output_dir, exist_ok=True)
+        tables = {
+            'price_distribution': distribution,
+            'price_changes': changes,
+            'rank_movement_summary': movement_summary,
+            'rank_movement': moved
+        }
+        for name, table in tables.items():
+            table.to_csv(os.path.join(args.output_dir, f"{name}.csv"), encoding='utf-8-sig',
+                         index=name in ('price_distribution', 'rank_movement_summary'))
+        print(f"\n분석 표 저장: {args.output_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""
+모의 사이트 기반 처리량 벤치마크
+
+mock_partners_site.py 의 로컬 모의 워크스페이스를 띄우고 headless Chrome 으로
+키워드 검색부터 TOP-N 단축 URL 생성까지 실제 실행 경로를 그대로 돌린다.
+분당 처리 상품 수, 상품당 WebDriver 명령 수, 소요 시간, 정확도(모의 사이트가 정한 단축 URL 과 일치)를
+출력하고 결과 파일(JSON Lines)에 추가해 버전 간 비교할 수 있게 한다.
+
+사용법:
+    python benchmark.py -n 10 --label baseline
+    python benchmark.py -n 10 --lean --http-shorten --label lean-http
+"""
+import argparse
+import importlib.util
+import json
+import os
+import subprocess
+import time
+from datetime import datetime
+
+from mock_partners_site import MockPartnersServer
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def load_automation_module(path=os.path.join(SCRIPT_DIR, "coupang-auto.py")):
+    """파일 이름에 하이픈이 있어 import 할 수 없는 coupang-auto.py 를 모듈로 로드"""
+    spec = importlib.util.spec_from_file_location("coupang_auto", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def git_revision():
+    """현재 커밋 (변경 사항이 있으면 -dirty), git 이 없으면 None"""
+    try:
+        revision = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=SCRIPT_DIR,
+                                  capture_output=True, text=True, check=True).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=SCRIPT_DIR,
+                               capture_output=True, text=True, check=True).stdout.strip()
+        return f"{revision}-dirty" if dirty else revision
+    except Exception:
+        return None
+
+
+def run_benchmark(args):
+    """
+    모의 사이트에서 TOP-N 실행 한 번 측정
+
+    Returns:
+        dict: 측정 결과
+    """
+    module = load_automation_module()
+    server = MockPartnersServer(render_delay=args.render_delay, search_delay=args.search_delay,
+                                api_delay=args.api_delay, product_count=max(args.count, 20)).start()
+    expected = {product['product_url']: product['short_url'] for product in server.search(args.keyword)}
+    automation = None
+
+    try:
+        startup_start = time.perf_counter()
+        automation = module.CoupangPartnersWebAutomation(
+            headless=not args.headed,
+            selector_cache_path=None,
+            session_path=None,
+            short_url_cache_path=None,
+            direct_link_generation=not args.no_direct_link,
+            http_shortening=args.http_shorten,
+            lean_profile=args.lean,
+            profile_commands=True,
+            base_url=server.base_url
+        )
+        startup_seconds = time.perf_counter() - startup_start
+
+        commands_before = automation.command_profiler.total_commands
+        run_start = time.perf_counter()
+        if not automation.navigate_to_affiliate_ws():
+            raise RuntimeError("모의 워크스페이스를 열 수 없습니다.")
+        products = automation.search_products_and_get_short_urls(args.keyword, args.count) or []
+        wall_seconds = time.perf_counter() - run_start
+        commands = automation.command_profiler.total_commands - commands_before
+
+        correct = sum(1 for product in products
+                      if product.ok and product.short_url == expected.get(product.product_url))
+
+        return {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'label': args.label,
+            'revision': git_revision(),
+            'options': {
+                'count': args.count,
+                'lean': args.lean,
+                'http_shorten': args.http_shorten,
+                'direct_link': not args.no_direct_link,
+                'render_delay': args.render_delay,
+                'search_delay': args.search_delay,
+                'api_delay': args.api_delay
+            },
+            'products': len(products),
+            'correct': correct,
+            'startup_seconds': round(startup_seconds, 3),
+            'wall_seconds': round(wall_seconds, 3),
+            'products_per_min': round(len(products) / wall_seconds * 60, 2) if wall_seconds else 0.0,
+            'commands': commands,
+            'commands_per_product': round(commands / len(products), 1) if products else None,
+            'shorten_api_calls': server.shorten_calls,
+            'phases': automation.tracer.summary()
+        }
+    finally:
+        if automation:
+            automation.close()
+        server.stop()
+
+
+def save_result(result, path):
+    """결과를 JSON Lines 파일에 추가"""
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(result, ensure_ascii=False) + "\n")
+
+
+def load_results(path):
+    """저장된 결과 목록"""
+    if not os.path.exists(path):
+        return []
+    with open(path, 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def print_comparison(results, last=10):
+    """최근 결과 비교표 출력"""
+    print(f"\n=== 최근 벤치마크 {min(last, len(results))}개 ===")
+    print(f"{'시각':<20} {'라벨':<16} {'커밋':<14} {'상품':>4} {'정확':>4} {'상품/분':>8} {'명령/상품':>9} {'소요(s)':>8}")
+    for result in results[-last:]:
+        print(f"{result['timestamp']:<20} {(result.get('label') or '-')[:16]:<16} "
+              f"{(result.get('revision') or '-'):<14} {result['products']:>4} {result['correct']:>4} "
+              f"{result['products_per_min']:>8.1f} {result['commands_per_product'] or 0:>9.1f} "
+              f"{result['wall_seconds']:>8.2f}")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="모의 사이트 기반 처리량 벤치마크")
+    parser.add_argument("-n", "--count", type=int, default=10, help="처리할 상품 수 (TOP-N)")
+    parser.add_argument("-k", "--keyword", default="미니선풍기", help="검색 키워드")
+    parser.add_argument("--label", help="결과 비교용 라벨")
+    parser.add_argument("--output", default="benchmark_results.jsonl", help="결과를 추가할 JSON Lines 파일")
+    parser.add_argument("--render-delay", type=float, default=0.2, help="모의 화면 렌더링 지연(초)")
+    parser.add_argument("--search-delay", type=float, default=0.3, help="모의 검색 API 지연(초)")
+    parser.add_argument("--api-delay", type=float, default=0.1, help="모의 단축 URL API 지연(초)")
+    parser.add_argument("--lean", action="store_true", help="경량 브라우저 프로필 사용")
+    parser.add_argument("--http-shorten", action="store_true", help="단축 URL API 캡처 후 HTTP로 직접 단축")
+    parser.add_argument("--no-direct-link", action="store_true", help="링크 생성 페이지 직접 이동 사용 안 함")
+    parser.add_argument("--headed", action="store_true", help="브라우저 창을 띄워서 실행")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    result = run_benchmark(args)
+
+    print("\n=== 벤치마크 결과 ===")
+    print(f"  상품: {result['products']}개 (정확 {result['correct']}개)")
+    print(f"  소요 시간: {result['wall_seconds']:.2f}s (브라우저 시작 {result['startup_seconds']:.2f}s 제외)")
+    print(f"  처리량: {result['products_per_min']:.1f} 상품/분")
+    print(f"  WebDriver 명령: {result['commands']}회 (상품당 {result['commands_per_product']})")
+
+    save_result(result, args.output)
+    print(f"\n결과 저장: {args.output}")
+    print_comparison(load_results(args.output))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,38 +1,1889 @@
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.common.action_chains import ActionChains
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
 import time
+import os
+import sys
+import math
 import csv
 import json
-import pandas as pd
+import re
+import queue
+import sqlite3
+import argparse
+import threading
+import uuid
+import functools
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from urllib.parse import parse_qs, urlparse
+from urllib.parse import urlparse
 import openpyxl
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.utils import get_column_letter
+from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, NamedStyle
+
+from coupang_products import (
+    EXPORT_TIME_FORMAT, PRODUCT_ID_PARAMS, Product, ProductStatus, ResultSink,
+    count_statuses, find_short_url, format_status_counts, parse_product_url, parse_product_urls,
+    product_identity_key, products_from_items
+)
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+except ImportError:
+    requests = None
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+try:
+    from lxml import html as lxml_html
+    from lxml.cssselect import CSSSelector
+except ImportError:
+    lxml_html = None
+
+# 검색 결과 상품 카드 셀렉터 (우선순위 순)
+# 상품 카드에만 붙는 셀렉터: 검색 결과 렌더링 확인(count_result_cards)에도 사용
+RESULT_CARD_SELECTORS = [
+    "[data-testid='product-item']",
+    ".product-item",
+    ".search-product",
+    ".ant-card",
+    ".product-card",
+    ".search-result-item"
+]
+
+# 메뉴/컨테이너 등 다른 요소에도 걸리는 넓은 셀렉터: 카드를 찾는 마지막 폴백으로만 사용
+LOOSE_CARD_SELECTORS = [
+    "[class*='product']",
+    "[class*='item']",
+    "[class*='card']",
+    ".ant-list-item",
+    ".list-item",
+    "[class*='result']",
+    ".ant-row .ant-col"
+]
+
+PRODUCT_CARD_SELECTORS = RESULT_CARD_SELECTORS + LOOSE_CARD_SELECTORS
+
+PRODUCT_NAME_SELECTORS = [
+    ".product-name", 
+    "[data-testid='product-name']", 
+    "h3", "h4", ".title",
+    ".ant-card-meta-title",
+    "[class*='title']",
+    "[class*='name']",
+    "a[href*='product']",
+    "span",
+    "div"
+]
+
+PRODUCT_LINK_SELECTORS = [
+    "a[href*='product']",
+    "a[href*='item']", 
+    "a"
+]
+
+PRODUCT_PRICE_SELECTORS = [
+    ".price", 
+    "[data-testid='price']", 
+    ".product-price",
+    "[class*='price']",
+    ".cost", ".amount"
+]
+
+# 상품 카드 수집 함수 (BATCH_EXTRACT_PRODUCTS_JS, CARD_INDEX_JS, COUNT_RESULT_CARDS_JS 공통)
+# 셀렉터 순서대로 확인해 화면에 보이고 텍스트(10자 초과)/링크/이미지가 있는 카드가
+# 하나라도 있는 첫 셀렉터의 카드를 돌려준다. 세 스크립트가 같은 카드 집합과 순번을 보게 된다.
+CARD_COLLECT_JS = r"""
+function isVisible(el) {
+    if (!el.getClientRects().length) { return false; }
+    var style = window.getComputedStyle(el);
+    return style.visibility !== 'hidden' && style.display !== 'none';
+}
+function collectCards(selectors) {
+    for (var s = 0; s < selectors.length; s++) {
+        var found, cards = [];
+        try { found = document.querySelectorAll(selectors[s]); } catch (e) { continue; }
+        for (var i = 0; i < found.length; i++) {
+            var el = found[i];
+            if (!isVisible(el)) { continue; }
+            if ((el.innerText || '').trim().length > 10 || el.getElementsByTagName('a').length || el.getElementsByTagName('img').length) {
+                cards.push(el);
+            }
+        }
+        if (cards.length) { return {cards: cards, selector: selectors[s]}; }
+    }
+    return {cards: [], selector: null};
+}
+"""
+
+# 상품 카드 일괄 추출 스크립트
+# extract_single_product_info 의 셀렉터 폴백 규칙을 브라우저 안에서 그대로 수행하여
+# 카드 전체를 한 번의 execute_script 로 가져온다.
+# 찾은 카드에는 data-cpa-card 순번을 붙여 두어 이후 호버 단계에서 다시 찾지 않게 한다. (CARD_INDEX_JS)
+BATCH_EXTRACT_PRODUCTS_JS = CARD_COLLECT_JS + r"""
+var cardSelectors = arguments[0], nameSelectors = arguments[1],
+    linkSelectors = arguments[2], priceSelectors = arguments[3],
+    count = arguments[4];
+
+function textOf(el) { return (el.innerText || '').trim(); }
+function hasAny(text, words) {
+    for (var i = 0; i < words.length; i++) {
+        if (text.indexOf(words[i]) !== -1) { return true; }
+    }
+    return false;
+}
+
+var collected = collectCards(cardSelectors);
+var cards = collected.cards, matchedSelector = collected.selector;
+
+var stamped = document.querySelectorAll('[data-cpa-card]');
+for (var i = 0; i < stamped.length; i++) { stamped[i].removeAttribute('data-cpa-card'); }
+for (var i = 0; i < cards.length; i++) { cards[i].setAttribute('data-cpa-card', i); }
+
+var products = [];
+for (var c = 0; c < cards.length && c < count; c++) {
+    var card = cards[c], full = textOf(card), name = '';
+
+    // 상품명: 전체 텍스트 첫 줄 -> 상품명 셀렉터 순
+    var firstLine = full.split('\n')[0].trim();
+    if (firstLine.length > 5 && !hasAny(firstLine, ['%', '원', '₩', '할인'])) {
+        name = firstLine;
+    }
+    for (var n = 0; n < nameSelectors.length && !name; n++) {
+        var nameEls = card.querySelectorAll(nameSelectors[n]);
+        for (var k = 0; k < nameEls.length && k < 3; k++) {
+            var t = textOf(nameEls[k]);
+            if (t.length > 10 && !hasAny(t, ['%', '원', '₩', '할인', '쿠폰'])) {
+                name = t.split('\n')[0];
+                break;
+            }
+        }
+    }
+    if (!name) { continue; }
+
+    // 상품 URL
+    var productUrl = '';
+    for (var l = 0; l < linkSelectors.length && !productUrl; l++) {
+        var links = card.querySelectorAll(linkSelectors[l]);
+        for (var k = 0; k < links.length; k++) {
+            var href = links[k].href || '';
+            if (href && (href.indexOf('product') !== -1 || href.indexOf('item') !== -1 || href.indexOf('coupang.com') !== -1)) {
+                productUrl = href;
+                break;
+            }
+        }
+    }
+
+    // 가격
+    var price = '';
+    for (var p = 0; p < priceSelectors.length && !price; p++) {
+        var priceEls = card.querySelectorAll(priceSelectors[p]);
+        for (var k = 0; k < priceEls.length; k++) {
+            var pt = textOf(priceEls[k]);
+            if (pt && (hasAny(pt, ['원', '₩', ',']) || /\d/.test(pt))) {
+                price = pt;
+                break;
+            }
+        }
+    }
+    if (!price) {
+        var m = (card.innerText || '').match(/[\d,]+원|₩[\d,]+|[\d,]+\s*원/);
+        if (m) { price = m[0]; }
+    }
+
+    // 이미지 URL
+    var imageUrl = '';
+    var imgs = card.getElementsByTagName('img');
+    for (var k = 0; k < imgs.length; k++) {
+        var src = imgs[k].src || imgs[k].getAttribute('data-src') || '';
+        if (src) { imageUrl = src; break; }
+    }
+
+    products.push({
+        rank: c + 1,
+        name: name,
+        price: price,
+        product_url: productUrl,
+        image_url: imageUrl
+    });
+}
+return {selector: matchedSelector, total: cards.length, products: products};
+"""
+
+# 셀렉터 폴백 목록 일괄 확인 스크립트
+# CSS 와 //로 시작하는 XPath 셀렉터를 순서대로 적용하면서 표시/활성 여부와 텍스트/클래스/속성 조건을
+# 브라우저 안에서 검사하고 처음 일치한 요소를 반환한다. (find_first_element)
+FIND_FIRST_ELEMENT_JS = r"""
+var selectors = arguments[0], options = arguments[1];
+
+function isVisible(el) {
+    if (!el.getClientRects().length) { return false; }
+    var style = window.getComputedStyle(el);
+    return style.visibility !== 'hidden' && style.display !== 'none';
+}
+function fieldValue(el, field) {
+    if (field === 'text') { return ((el.innerText || el.textContent || '') + ' ' + (el.value || '')).toLowerCase(); }
+    if (field === 'class') { return (el.getAttribute('class') || '').toLowerCase(); }
+    return (el.getAttribute(field) || '').toLowerCase();
+}
+function matches(el) {
+    if (options.visible && !isVisible(el)) { return false; }
+    if (options.enabled && (el.disabled || el.getAttribute('aria-disabled') === 'true')) { return false; }
+    var alternatives = options.anyOf || [];
+    if (!alternatives.length) { return true; }
+    for (var a = 0; a < alternatives.length; a++) {
+        var ok = true;
+        for (var field in alternatives[a]) {
+            var value = fieldValue(el, field), words = alternatives[a][field];
+            for (var w = 0; w < words.length && ok; w++) {
+                ok = value.indexOf(words[w].toLowerCase()) !== -1;
+            }
+        }
+        if (ok) { return true; }
+    }
+    return false;
+}
+function query(selector) {
+    if (selector.indexOf('//') === 0 || selector.indexOf('(//') === 0) {
+        var snapshot = document.evaluate(selector, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        var nodes = [];
+        for (var i = 0; i < snapshot.snapshotLength; i++) { nodes.push(snapshot.snapshotItem(i)); }
+        return nodes;
+    }
+    return document.querySelectorAll(selector);
+}
+
+for (var s = 0; s < selectors.length; s++) {
+    var elements;
+    try { elements = query(selectors[s]); } catch (e) { continue; }
+    for (var i = 0; i < elements.length; i++) {
+        if (elements[i].nodeType === 1 && matches(elements[i])) {
+            return {element: elements[i], selector: selectors[s]};
+        }
+    }
+}
+return null;
+"""
+
+# 상품 카드 색인 조회 스크립트
+# data-cpa-card 순번이 붙은 카드가 화면에 있으면 바로 반환하고, 없으면(재렌더링, 새 검색 등)
+# 셀렉터 순서대로 유효한 카드를 다시 찾아 순번을 새로 붙인다. 조회 한 번이 왕복 한 번이다.
+# 카드 선택은 BATCH_EXTRACT_PRODUCTS_JS 와 같은 collectCards 를 써서
+# 색인을 다시 만들어도 상품의 rank - 1 이 같은 카드를 가리킨다.
+CARD_INDEX_JS = CARD_COLLECT_JS + r"""
+var selectors = arguments[0], index = arguments[1];
+
+var existing = document.querySelector('[data-cpa-card="' + index + '"]');
+if (existing && isVisible(existing)) {
+    return {element: existing, rebuilt: false, selector: null, total: null};
+}
+
+var stamped = document.querySelectorAll('[data-cpa-card]');
+for (var i = 0; i < stamped.length; i++) { stamped[i].removeAttribute('data-cpa-card'); }
+
+var collected = collectCards(selectors);
+var cards = collected.cards, matched = collected.selector;
+for (var i = 0; i < cards.length; i++) { cards[i].setAttribute('data-cpa-card', i); }
+return {element: cards[index] || null, rebuilt: true, selector: matched, total: cards.length};
+"""
+
+# 검색 결과에 렌더링된 상품 카드 수 (collectCards 기준이라 빈 결과 컨테이너나 메뉴 항목은 세지 않음)
+COUNT_RESULT_CARDS_JS = CARD_COLLECT_JS + r"""
+return collectCards(arguments[0]).cards.length;
+"""
+
+# 링크 생성 페이지의 단축 URL 표시 영역
+SHORTEN_URL_INPUT_SELECTORS = [
+    ".shorten-url-wrapper > div.unselectable-input.shorten-url-input.large",
+    ".shorten-url-wrapper .unselectable-input.shorten-url-input",
+    ".shorten-url-wrapper .shorten-url-input"
+]
+
+# 단축 URL 표시 영역에서 link.coupang.com URL 읽기 (textContent 우선, 없으면 value)
+READ_SHORT_URL_JS = r"""
+var selectors = arguments[0];
+var pattern = /https:\/\/link\.coupang\.com\/[^\s"'<>]+/;
+for (var s = 0; s < selectors.length; s++) {
+    var els = document.querySelectorAll(selectors[s]);
+    for (var i = 0; i < els.length; i++) {
+        var m = ((els[i].textContent || '') + ' ' + (els[i].value || '')).match(pattern);
+        if (m) { return {url: m[0], selector: selectors[s]}; }
+    }
+}
+return null;
+"""
+
+# 단축 URL이 표시될 때까지 MutationObserver 로 기다렸다가 반환 (execute_async_script 용)
+# input 의 value 속성 변경은 DOM 변경으로 잡히지 않으므로 짧은 간격 확인도 함께 한다.
+OBSERVE_SHORT_URL_JS = r"""
+var selectors = arguments[0], timeoutMs = arguments[1], done = arguments[arguments.length - 1];
+var pattern = /https:\/\/link\.coupang\.com\/[^\s"'<>]+/;
+function read() {
+    for (var s = 0; s < selectors.length; s++) {
+        var els = document.querySelectorAll(selectors[s]);
+        for (var i = 0; i < els.length; i++) {
+            var m = ((els[i].textContent || '') + ' ' + (els[i].value || '')).match(pattern);
+            if (m) { return {url: m[0], selector: selectors[s]}; }
+        }
+    }
+    return null;
+}
+var found = read();
+if (found) { done(found); return; }
+var finished = false, observer, interval, timer;
+function finish(result) {
+    if (finished) { return; }
+    finished = true;
+    observer.disconnect();
+    clearInterval(interval);
+    clearTimeout(timer);
+    done(result);
+}
+observer = new MutationObserver(function () { var r = read(); if (r) { finish(r); } });
+observer.observe(document.body, {childList: true, subtree: true, characterData: true, attributes: true});
+interval = setInterval(function () { var r = read(); if (r) { finish(r); } }, 100);
+timer = setTimeout(function () { finish(null); }, timeoutMs);
+"""
+
+# 단축 URL 생성/복사 버튼 판정 조건 (find_first_element any_of)
+SHORTEN_BUTTON_MATCH = [
+    {'class': ['shorten-url-controls']}, {'text': ['단축']}, {'text': ['짧은']}, {'text': ['복사']}
+]
+
+# 조건 대기에 사용하는 셀렉터
+LINK_GENERATION_READY_CSS = ".shorten-url-wrapper, button[class*='shorten-url-controls']"
+SEARCH_INPUT_WAIT_CSS = ".ant-input.ant-input-lg, input[placeholder*='검색'], input[placeholder*='상품'], .search-input, #search-input"
+LOGIN_FORM_WAIT_CSS = "input[type='email'], input[type='password'], input[name='email'], input[name='loginId'], input[name='username']"
+HOVER_BUTTON_WAIT_CSS = "button[class*='btn-generate-link'], button[class*='hover-btn']"
+
+# 결과 엑셀 컬럼 (순서대로) 과 너비
+EXCEL_COLUMNS = ['상품명', '가격', '원본URL', '단축URL', '이미지URL', '생성일시', '단축URL상태']
+EXCEL_COLUMN_WIDTHS = {
+    '상품명': 40, '가격': 15, '원본URL': 50, '단축URL': 50, '이미지URL': 50, '생성일시': 20, '단축URL상태': 12
+}
+
+# 분석용 결과 파일(Parquet/CSV/JSON Lines) 공통 스키마 (필드, 형식) - 모든 형식이 같은 순서를 사용
+EXPORT_SCHEMA = [
+    ('run_id', 'string'),
+    ('keyword', 'string'),
+    ('rank', 'int'),
+    ('name', 'string'),
+    ('price', 'int'),
+    ('product_url', 'string'),
+    ('short_url', 'string'),
+    ('image_url', 'string'),
+    ('deep_link', 'string'),
+    ('created_at', 'timestamp'),
+    ('status', 'status'),
+    ('error', 'string'),
+]
+
+# 경량 프로필에서 차단할 리소스 (CDP Network.setBlockedURLs 패턴)
+LEAN_BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*.mp4", "*.webm", "*.mp3", "*.m3u8",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*facebook.net*", "*facebook.com/tr*", "*connect.facebook*",
+    "*criteo.*", "*hotjar.com*", "*clarity.ms*", "*analytics.tiktok.com*",
+]
+
+# 경량 프로필 Chrome 옵션 (불필요한 백그라운드 작업/메모리 사용 억제)
+LEAN_CHROME_ARGS = [
+    "--blink-settings=imagesEnabled=false",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-features=Translate,MediaRouter,OptimizationHints,AutofillServerCommunication",
+    "--metrics-recording-only",
+    "--mute-audio",
+    "--no-first-run",
+    "--renderer-process-limit=2",
+    "--disk-cache-size=33554432",
+]
+
+LEAN_CHROME_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.managed_default_content_settings.media_stream": 2,
+    "profile.default_content_setting_values.notifications": 2,
+}
+
+# 페이지 로드 시간과 직전 측정 이후 로드된 리소스 수/전송량 (측정 후 리소스 타이밍 초기화)
+PAGE_LOAD_METRICS_JS = """
+var nav = performance.getEntriesByType('navigation')[0];
+var resources = performance.getEntriesByType('resource');
+var transferred = 0;
+for (var i = 0; i < resources.length; i++) { transferred += resources[i].transferSize || 0; }
+performance.clearResourceTimings();
+return {
+    url: location.href,
+    load_ms: nav ? nav.loadEventEnd - nav.startTime : null,
+    dom_ms: nav ? nav.domContentLoadedEventEnd - nav.startTime : null,
+    resources: resources.length,
+    transfer_bytes: transferred + (nav ? nav.transferSize || 0 : 0)
+};
+"""
+
+
+class WaitEngine:
+    """
+    조건 기반 대기 엔진
+    
+    고정 sleep 대신 실제 페이지 상태(URL, 요소 존재/표시, 텍스트 채워짐 등)를
+    polling 하면서 기다리고, 각 대기가 실제로 걸린 시간을 기록한다.
+    """
+
+    def __init__(self, driver, timeout=10, poll_frequency=0.1):
+        """
+        Args:
+            driver: Selenium WebDriver
+            timeout (float): 기본 최대 대기 시간(초)
+            poll_frequency (float): 조건 확인 간격(초)
+        """
+        self.driver = driver
+        self.timeout = timeout
+        self.poll_frequency = poll_frequency
+        self.records = []
+
+    def until(self, condition, label, timeout=None, poll_frequency=None, raise_on_timeout=False):
+        """
+        condition(driver) 가 참 값을 반환할 때까지 대기
+        
+        Args:
+            condition (callable): driver 를 받아 값을 반환하는 함수 (예외는 미충족으로 처리)
+            label (str): 대기 이름 (통계 집계용)
+            timeout (float): 최대 대기 시간(초), None 이면 기본값
+            poll_frequency (float): 조건 확인 간격(초), None 이면 기본값
+            raise_on_timeout (bool): 시간 초과 시 TimeoutException 을 던질지 여부
+        
+        Returns:
+            condition 의 반환값 (시간 초과 시 None)
+        """
+        timeout = self.timeout if timeout is None else timeout
+        poll_frequency = self.poll_frequency if poll_frequency is None else poll_frequency
+        
+        start = time.perf_counter()
+        deadline = start + timeout
+        while True:
+            try:
+                value = condition(self.driver)
+            except Exception:
+                value = None
+            
+            if value:
+                self._record(label, time.perf_counter() - start, True, timeout)
+                return value
+            
+            if time.perf_counter() >= deadline:
+                break
+            time.sleep(poll_frequency)
+        
+        self._record(label, time.perf_counter() - start, False, timeout)
+        if raise_on_timeout:
+            raise TimeoutException(f"대기 시간 초과: {label} ({timeout}초)")
+        return None
+
+    def pause(self, seconds, label):
+        """
+        조건 없이 고정 시간 대기 (서버 부하 방지용 간격 등)
+        
+        Args:
+            seconds (float): 대기 시간(초)
+            label (str): 대기 이름
+        """
+        start = time.perf_counter()
+        if seconds > 0:
+            time.sleep(seconds)
+        self._record(label, time.perf_counter() - start, True, seconds)
+
+    def url_contains(self, text, label, timeout=None):
+        """현재 URL 에 text 가 포함될 때까지 대기"""
+        return self.until(lambda driver: text in driver.current_url, label, timeout)
+
+    def url_not_contains(self, text, label, timeout=None):
+        """현재 URL 에 text 가 없어질 때까지 대기"""
+        return self.until(lambda driver: text not in driver.current_url, label, timeout)
+
+    def document_ready(self, label, timeout=None):
+        """document.readyState 가 complete 가 될 때까지 대기"""
+        return self.until(
+            lambda driver: driver.execute_script("return document.readyState") == "complete",
+            label, timeout
+        )
+
+    def element_present(self, selector, label, timeout=None):
+        """셀렉터(CSS 또는 //로 시작하는 XPath)에 해당하는 요소가 DOM 에 생길 때까지 대기"""
+        by = By.XPATH if selector.startswith("//") else By.CSS_SELECTOR
+        return self.until(lambda driver: driver.find_elements(by, selector), label, timeout)
+
+    def element_visible(self, selector, label, timeout=None):
+        """셀렉터에 해당하는 요소 중 하나가 화면에 표시될 때까지 대기"""
+        by = By.XPATH if selector.startswith("//") else By.CSS_SELECTOR
+        
+        def visible_element(driver):
+            for element in driver.find_elements(by, selector):
+                if element.is_displayed():
+                    return element
+            return None
+        
+        return self.until(visible_element, label, timeout)
+
+    def text_contains(self, selector, text, label, timeout=None):
+        """
+        셀렉터에 해당하는 요소의 textContent/value 에 text 가 채워질 때까지 대기
+        
+        Returns:
+            str: 채워진 텍스트 (시간 초과 시 None)
+        """
+        script = (
+            "var els = document.querySelectorAll(arguments[0]);"
+            "for (var i = 0; i < els.length; i++) {"
+            "  var v = (els[i].textContent || '').trim() || els[i].value || '';"
+            "  if (v.indexOf(arguments[1]) !== -1) { return v; }"
+            "}"
+            "return null;"
+        )
+        return self.until(lambda driver: driver.execute_script(script, selector, text), label, timeout)
+
+    def _record(self, label, seconds, ok, timeout):
+        self.records.append({
+            'label': label,
+            'seconds': seconds,
+            'ok': ok,
+            'timeout': timeout
+        })
+
+    def summary(self):
+        """
+        대기 이름별 통계
+        
+        Returns:
+            dict: {label: {'count', 'total', 'avg', 'max', 'timeouts'}}
+        """
+        stats = {}
+        for record in self.records:
+            stat = stats.setdefault(record['label'], {
+                'count': 0, 'total': 0.0, 'avg': 0.0, 'max': 0.0, 'timeouts': 0
+            })
+            stat['count'] += 1
+            stat['total'] += record['seconds']
+            stat['max'] = max(stat['max'], record['seconds'])
+            if not record['ok']:
+                stat['timeouts'] += 1
+        
+        for stat in stats.values():
+            stat['avg'] = stat['total'] / stat['count']
+        
+        return stats
+
+    def print_summary(self):
+        """대기 통계 출력"""
+        stats = self.summary()
+        if not stats:
+            return
+        
+        print("\n=== 대기 시간 통계 ===")
+        for label, stat in sorted(stats.items(), key=lambda item: -item[1]['total']):
+            print(f"  {label}: {stat['count']}회, 합계 {stat['total']:.2f}s, "
+                  f"평균 {stat['avg']:.2f}s, 최대 {stat['max']:.2f}s, 시간초과 {stat['timeouts']}회")
+
+
+class PhaseTracer:
+    """
+    단계(phase)별 실행 구간 기록기
+    
+    로그인, 검색, 상품별 호버/링크 생성/단축 같은 단계를 구간(span)으로 기록하고
+    keyword/rank 태그와 함께 단계별 p50/p95/max 요약과 Chrome trace-event 파일로 내보낸다.
+    """
+
+    def __init__(self):
+        self.records = []
+        self.tags = {}
+
+    def set_tags(self, **tags):
+        """이후 시작되는 구간에 붙일 태그 설정 (None 값은 태그 제거)"""
+        for key, value in tags.items():
+            if value is None:
+                self.tags.pop(key, None)
+            else:
+                self.tags[key] = value
+
+    @contextmanager
+    def span(self, phase, **tags):
+        """
+        with 블록 실행 시간을 phase 구간으로 기록
+        
+        Args:
+            phase (str): 단계 이름
+            **tags: 현재 태그에 추가할 태그
+        """
+        record = {
+            'phase': phase,
+            'tags': {**self.tags, **tags},
+            'start': time.perf_counter(),
+            'thread': threading.get_ident(),
+            'ok': True
+        }
+        try:
+            yield record
+        except Exception:
+            record['ok'] = False
+            raise
+        finally:
+            record['seconds'] = time.perf_counter() - record['start']
+            self.records.append(record)
+
+    @staticmethod
+    def percentile(values, pct):
+        """nearest-rank 백분위수"""
+        ordered = sorted(values)
+        if not ordered:
+            return 0.0
+        return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+    @classmethod
+    def combine(cls, tracers):
+        """여러 기록기(워커별)의 구간을 합친 기록기 반환"""
+        combined = cls()
+        for tracer in tracers:
+            combined.records.extend(tracer.records)
+        combined.records.sort(key=lambda record: record['start'])
+        return combined
+
+    def summary(self):
+        """
+        단계별 통계
+        
+        Returns:
+            dict: {phase: {'count', 'total', 'p50', 'p95', 'max', 'errors'}}
+        """
+        grouped = {}
+        for record in self.records:
+            grouped.setdefault(record['phase'], []).append(record)
+        
+        stats = {}
+        for phase, records in grouped.items():
+            seconds = [record['seconds'] for record in records]
+            stats[phase] = {
+                'count': len(seconds),
+                'total': sum(seconds),
+                'p50': self.percentile(seconds, 50),
+                'p95': self.percentile(seconds, 95),
+                'max': max(seconds),
+                'errors': sum(1 for record in records if not record['ok'])
+            }
+        return stats
+
+    def save_summary(self, path):
+        """단계별 통계를 JSON 파일로 저장"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.summary(), f, ensure_ascii=False, indent=2)
+        print(f"단계별 시간 요약 저장: {path}")
+
+    def save_trace(self, path):
+        """
+        Chrome trace-event 형식으로 저장 (chrome://tracing 또는 Perfetto 에서 열기)
+        
+        Args:
+            path (str): 저장할 JSON 파일 경로
+        """
+        origin = min((record['start'] for record in self.records), default=0.0)
+        events = [{
+            'name': record['phase'],
+            'cat': 'phase',
+            'ph': 'X',
+            'ts': round((record['start'] - origin) * 1e6),
+            'dur': round(record['seconds'] * 1e6),
+            'pid': os.getpid(),
+            'tid': record['thread'],
+            'args': {**record['tags'], 'ok': record['ok']}
+        } for record in self.records]
+        
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f, ensure_ascii=False)
+        print(f"trace 파일 저장: {path}")
+
+    def print_summary(self):
+        """단계별 시간 통계 출력"""
+        stats = self.summary()
+        if not stats:
+            return
+        
+        print("\n=== 단계별 실행 시간 ===")
+        for phase, stat in sorted(stats.items(), key=lambda item: -item[1]['total']):
+            print(f"  {phase}: {stat['count']}회, 합계 {stat['total']:.2f}s, p50 {stat['p50']:.2f}s, "
+                  f"p95 {stat['p95']:.2f}s, 최대 {stat['max']:.2f}s, 오류 {stat['errors']}회")
+
+
+def traced(phase):
+    """메서드 실행을 self.tracer 의 phase 구간으로 기록하는 데코레이터"""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with self.tracer.span(phase):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class WebDriverCommandProfiler:
+    """
+    WebDriver 명령(chromedriver 왕복) 계수기
+    
+    드라이버 인스턴스의 execute 를 감싸서 find_elements, is_displayed, get_attribute, .text 같은
+    명령 하나하나를 명령 종류와 호출 위치(이 스크립트의 함수:줄)별로 세고 지연 시간을 기록한다.
+    WebElement 의 명령도 부모 드라이버의 execute 를 거치므로 함께 집계된다.
+    """
+
+    def __init__(self, driver):
+        """
+        Args:
+            driver: Selenium WebDriver (execute 가 이 인스턴스에서만 교체됨)
+        """
+        self.driver = driver
+        self.by_command = {}
+        self.by_caller = {}
+        self._original_execute = driver.execute
+        driver.execute = self._execute
+
+    def _execute(self, driver_command, params=None):
+        start = time.perf_counter()
+        try:
+            return self._original_execute(driver_command, params)
+        finally:
+            seconds = time.perf_counter() - start
+            self._add(self.by_command, driver_command, seconds)
+            self._add(self.by_caller, self._caller(), seconds)
+
+    @staticmethod
+    def _add(stats, key, seconds):
+        stat = stats.setdefault(key, {'count': 0, 'total': 0.0, 'max': 0.0})
+        stat['count'] += 1
+        stat['total'] += seconds
+        stat['max'] = max(stat['max'], seconds)
+
+    @staticmethod
+    def _caller():
+        """이 스크립트 안에서 명령을 보낸 가장 가까운 함수와 줄 번호"""
+        frame = sys._getframe(2)
+        while frame is not None:
+            code = frame.f_code
+            if code.co_filename == __file__ and code.co_name not in ('_execute', 'wrapper'):
+                return f"{code.co_name}:{frame.f_lineno}"
+            frame = frame.f_back
+        return "<external>"
+
+    @property
+    def total_commands(self):
+        return sum(stat['count'] for stat in self.by_command.values())
+
+    def detach(self):
+        """원래 execute 복원"""
+        self.driver.__dict__.pop('execute', None)
+
+    @classmethod
+    def merge(cls, profilers):
+        """
+        여러 워커의 집계를 합친 통계
+        
+        Returns:
+            tuple: (by_command, by_caller)
+        """
+        by_command, by_caller = {}, {}
+        for profiler in profilers:
+            for target, source in ((by_command, profiler.by_command), (by_caller, profiler.by_caller)):
+                for key, stat in source.items():
+                    merged = target.setdefault(key, {'count': 0, 'total': 0.0, 'max': 0.0})
+                    merged['count'] += stat['count']
+                    merged['total'] += stat['total']
+                    merged['max'] = max(merged['max'], stat['max'])
+        return by_command, by_caller
+
+    @staticmethod
+    def print_stats(by_command, by_caller, product_count=0, top=15):
+        """
+        명령 집계 출력
+        
+        Args:
+            by_command (dict): 명령 종류별 통계
+            by_caller (dict): 호출 위치별 통계
+            product_count (int): 처리한 상품 수 (상품당 명령 수 계산용)
+            top (int): 출력할 상위 호출 위치 수
+        """
+        total = sum(stat['count'] for stat in by_command.values())
+        if not total:
+            return
+        
+        total_seconds = sum(stat['total'] for stat in by_command.values())
+        print("\n=== WebDriver 명령 통계 ===")
+        print(f"  총 {total}회, 합계 {total_seconds:.2f}s, 평균 {total_seconds / total * 1000:.1f}ms")
+        if product_count:
+            print(f"  상품당 {total / product_count:.1f}회, {total_seconds / product_count:.2f}s")
+        
+        print("  [명령 종류별]")
+        for command, stat in sorted(by_command.items(), key=lambda item: -item[1]['count']):
+            print(f"    {command}: {stat['count']}회, 합계 {stat['total']:.2f}s, "
+                  f"평균 {stat['total'] / stat['count'] * 1000:.1f}ms, 최대 {stat['max'] * 1000:.0f}ms")
+        
+        print(f"  [호출 위치 상위 {top}개]")
+        for caller, stat in sorted(by_caller.items(), key=lambda item: -item[1]['count'])[:top]:
+            print(f"    {caller}: {stat['count']}회, 합계 {stat['total']:.2f}s")
+
+    def print_summary(self, product_count=0, top=15):
+        """이 드라이버의 명령 집계 출력"""
+        self.print_stats(self.by_command, self.by_caller, product_count, top)
+
+
+class SelectorResolver:
+    """
+    역할별 셀렉터 학습 캐시
+    
+    "search_input", "product_card" 같은 요소 역할마다 마지막으로 성공한 셀렉터를
+    폴백 목록의 맨 앞으로 올리고, 셀렉터별 성공/실패 횟수를 기록한다.
+    순위는 JSON 파일로 저장되어 다음 실행이 학습된 순서로 시작한다.
+    다른 요소에도 걸리는 넓은 셀렉터는 fallback_only 로 지정해 통계만 남기고 순위에는 올리지 않는다.
+    """
+
+    def __init__(self, cache_path="selector_cache.json", fallback_only=None):
+        """
+        Args:
+            cache_path (str): 순위 저장 파일 경로 (None 이면 저장하지 않음)
+            fallback_only (dict): 역할 -> 항상 기본 순서 그대로 뒤쪽에 두는 셀렉터 목록
+        """
+        self.cache_path = cache_path
+        self.fallback_only = {role: set(selectors) for role, selectors in (fallback_only or {}).items()}
+        self.rankings = {}      # role -> [최근 성공 순 셀렉터]
+        self.stats = {}         # role -> {selector: {'hits': n, 'misses': n}}
+        self._last_order = {}
+        self._dirty = False
+        self.load()
+
+    def ordered(self, role, selectors):
+        """
+        학습된 순위를 반영한 셀렉터 목록 반환
+        
+        Args:
+            role (str): 요소 역할
+            selectors (list): 기본 폴백 셀렉터 목록
+        
+        Returns:
+            list: 최근 성공한 셀렉터가 앞에 오는 셀렉터 목록
+        """
+        fallback_only = self.fallback_only.get(role, ())
+        learned = [selector for selector in self.rankings.get(role, [])
+                   if selector in selectors and selector not in fallback_only]
+        order = learned + [selector for selector in selectors if selector not in learned]
+        self._last_order[role] = order
+        return order
+
+    def record_hit(self, role, selector):
+        """
+        셀렉터 성공 기록
+        
+        직전 ordered() 순서에서 성공 셀렉터보다 앞에 있던 셀렉터는 실패로 기록하고,
+        성공 셀렉터를 순위 맨 앞으로 올린다. (fallback_only 셀렉터는 올리지 않음)
+        """
+        order = self._last_order.get(role, [])
+        if selector in order:
+            for missed in order[:order.index(selector)]:
+                self._stat(role, missed)['misses'] += 1
+        self._stat(role, selector)['hits'] += 1
+        self._dirty = True
+        if selector in self.fallback_only.get(role, ()):
+            return
+        
+        ranking = self.rankings.setdefault(role, [])
+        if selector in ranking:
+            ranking.remove(selector)
+        ranking.insert(0, selector)
+
+    def record_miss(self, role):
+        """직전 ordered() 순서의 모든 셀렉터가 실패한 경우 기록"""
+        for missed in self._last_order.get(role, []):
+            self._stat(role, missed)['misses'] += 1
+        self._dirty = True
+
+    def _stat(self, role, selector):
+        return self.stats.setdefault(role, {}).setdefault(selector, {'hits': 0, 'misses': 0})
+
+    def load(self):
+        """저장된 순위 불러오기"""
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return
+        
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.rankings = data.get('rankings', {})
+            self.stats = data.get('stats', {})
+            print(f"셀렉터 캐시 불러옴: {self.cache_path} ({len(self.rankings)}개 역할)")
+        except Exception as e:
+            print(f"셀렉터 캐시 불러오기 실패: {e}")
+
+    def save(self):
+        """순위를 파일로 저장 (변경이 있을 때만)"""
+        if not self.cache_path or not self._dirty:
+            return
+        
+        try:
+            tmp_path = f"{self.cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'rankings': self.rankings, 'stats': self.stats}, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.cache_path)
+            self._dirty = False
+        except Exception as e:
+            print(f"셀렉터 캐시 저장 실패: {e}")
+
+    def print_summary(self):
+        """역할별 셀렉터 적중 통계 출력"""
+        if not self.stats:
+            return
+        
+        print("\n=== 셀렉터 적중 통계 ===")
+        for role, selectors in self.stats.items():
+            hits = sum(stat['hits'] for stat in selectors.values())
+            misses = sum(stat['misses'] for stat in selectors.values())
+            best = self.rankings.get(role, ['-'])[0]
+            print(f"  {role}: 성공 {hits}회, 실패 {misses}회, 현재 1순위 '{best}'")
+
+
+class SessionStore:
+    """
+    로그인 세션 저장소
+    
+    로그인 성공 후 쿠키와 localStorage 를 JSON 파일로 저장하고,
+    다음 실행 시 브라우저에 다시 주입하여 로그인 과정을 건너뛴다.
+    """
+
+    def __init__(self, path="coupang_session.json"):
+        """
+        Args:
+            path (str): 세션 저장 파일 경로
+        """
+        self.path = path
+
+    def exists(self):
+        """저장된 세션 파일이 있는지 여부"""
+        return bool(self.path) and os.path.exists(self.path)
+
+    def save(self, driver):
+        """
+        현재 브라우저의 쿠키와 localStorage 저장
+        
+        Args:
+            driver: 로그인된 Selenium WebDriver
+        
+        Returns:
+            bool: 저장 성공 여부
+        """
+        if not self.path:
+            return False
+        
+        try:
+            local_storage = driver.execute_script(
+                "var items = {};"
+                "for (var i = 0; i < window.localStorage.length; i++) {"
+                "  var key = window.localStorage.key(i);"
+                "  items[key] = window.localStorage.getItem(key);"
+                "}"
+                "return items;"
+            ) or {}
+            data = {
+                'saved_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                'url': driver.current_url,
+                'cookies': driver.get_cookies(),
+                'local_storage': local_storage
+            }
+            
+            tmp_path = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
+            
+            print(f"[O] 로그인 세션 저장: {self.path} (쿠키 {len(data['cookies'])}개)")
+            return True
+        except Exception as e:
+            print(f"[X] 로그인 세션 저장 실패: {e}")
+            return False
+
+    def load(self):
+        """
+        저장된 세션 데이터 읽기
+        
+        Returns:
+            dict: {'cookies': [...], 'local_storage': {...}} (없으면 None)
+        """
+        if not self.exists():
+            return None
+        
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"[X] 로그인 세션 읽기 실패: {e}")
+            return None
+
+    def restore(self, driver, base_url):
+        """
+        저장된 쿠키와 localStorage 를 브라우저에 주입
+        
+        Args:
+            driver: Selenium WebDriver
+            base_url (str): 쿠키 도메인에 해당하는 페이지 (쿠키 주입 전에 먼저 연다)
+        
+        Returns:
+            bool: 주입한 쿠키가 하나라도 있으면 True
+        """
+        data = self.load()
+        if not data or not data.get('cookies'):
+            return False
+        
+        driver.get(base_url)
+        
+        restored = 0
+        for cookie in data['cookies']:
+            cookie = dict(cookie)
+            if 'expiry' in cookie:
+                cookie['expiry'] = int(cookie['expiry'])
+            try:
+                driver.add_cookie(cookie)
+                restored += 1
+            except Exception:
+                continue
+        
+        local_storage = data.get('local_storage') or {}
+        if local_storage:
+            try:
+                driver.execute_script(
+                    "var items = arguments[0];"
+                    "for (var key in items) { window.localStorage.setItem(key, items[key]); }",
+                    local_storage
+                )
+            except Exception:
+                pass
+        
+        print(f"저장된 세션 복원: 쿠키 {restored}개, localStorage {len(local_storage)}개 ({data.get('saved_at')})")
+        return restored > 0
+
+    def clear(self):
+        """저장된 세션 삭제"""
+        if self.exists():
+            os.remove(self.path)
+
+
+class ShortUrlCache:
+    """
+    상품 식별자 기반 단축 URL 캐시 (SQLite)
+    
+    productId/itemId/vendorItemId 로 만든 키에 단축 URL 을 저장하고,
+    TTL 이 지난 항목은 무시하며, 최대 개수를 넘으면 가장 오래 사용하지 않은 항목부터 지운다.
+    """
+
+    def __init__(self, path="short_url_cache.sqlite3", ttl_days=30, max_entries=100000, clock=time.time):
+        """
+        Args:
+            path (str): SQLite 파일 경로
+            ttl_days (float): 캐시 유효 기간(일), None 이면 만료 없음
+            max_entries (int): 최대 저장 개수 (LRU)
+            clock (callable): 현재 시각(초)을 돌려주는 함수
+        """
+        self.path = path
+        self.clock = clock
+        self.ttl_seconds = ttl_days * 86400 if ttl_days else None
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+        
+        self.conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS short_urls ("
+            " key TEXT PRIMARY KEY,"
+            " short_url TEXT NOT NULL,"
+            " product_url TEXT,"
+            " created_at REAL NOT NULL,"
+            " last_used_at REAL NOT NULL)"
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_short_urls_last_used ON short_urls (last_used_at)")
+        self.conn.commit()
+
+    def get(self, product_url):
+        """
+        캐시된 단축 URL 조회
+        
+        Args:
+            product_url (str): 상품 URL
+        
+        Returns:
+            str: 단축 URL (없거나 만료되었으면 None)
+        """
+        key = product_identity_key(product_url)
+        if not key:
+            return None
+        
+        now = self.clock()
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT short_url, created_at FROM short_urls WHERE key = ?", (key,)
+            ).fetchone()
+            
+            if row and self.ttl_seconds and now - row[1] > self.ttl_seconds:
+                self.conn.execute("DELETE FROM short_urls WHERE key = ?", (key,))
+                self.conn.commit()
+                row = None
+            
+            if not row:
+                self.misses += 1
+                return None
+            
+            self.conn.execute("UPDATE short_urls SET last_used_at = ? WHERE key = ?", (now, key))
+            self.conn.commit()
+            self.hits += 1
+            return row[0]
+
+    def put(self, product_url, short_url):
+        """
+        단축 URL 저장 (link.coupang.com 단축 URL 만 저장)
+        
+        Args:
+            product_url (str): 상품 URL
+            short_url (str): 단축 URL
+        """
+        key = product_identity_key(product_url)
+        if not key or not short_url or 'link.coupang.com' not in short_url:
+            return
+        
+        now = self.clock()
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO short_urls (key, short_url, product_url, created_at, last_used_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (key, short_url, product_url, now, now)
+            )
+            if self.max_entries:
+                self.conn.execute(
+                    "DELETE FROM short_urls WHERE key IN ("
+                    " SELECT key FROM short_urls ORDER BY last_used_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,)
+                )
+            self.conn.commit()
+
+    def print_summary(self):
+        """캐시 적중 통계 출력"""
+        total = self.hits + self.misses
+        if not total:
+            return
+        print(f"\n단축 URL 캐시: 적중 {self.hits}회 / 조회 {total}회 ({self.hits / total * 100:.0f}%)")
+
+    def close(self):
+        """DB 연결 종료"""
+        with self.lock:
+            self.conn.close()
+
+
+class ShortLinkHttpClient:
+    """
+    링크 생성 페이지가 호출하는 단축 URL API를 직접 호출하는 HTTP 클라이언트
+    
+    브라우저에서 한 번 캡처한 요청(URL, 메서드, 헤더, 본문)을 템플릿으로 삼아
+    원래 상품의 식별자 값을 새 상품의 값으로 바꿔 보내고, 응답에서 단축 URL을 찾는다.
+    쿠키는 브라우저에서 복사하고 연결은 requests.Session 풀로 재사용한다.
+    """
+
+    # 브라우저가 자동으로 붙이는 헤더는 복사하지 않음
+    SKIP_HEADERS = {'cookie', 'content-length', 'host', 'connection', 'accept-encoding'}
+
+    def __init__(self, endpoint, pool_size=10, timeout=10, max_failures=3):
+        """
+        Args:
+            endpoint (dict): 캡처한 요청 {'url', 'method', 'headers', 'post_data', 'source_ids'}
+            pool_size (int): 연결 풀 크기
+            timeout (float): 요청 타임아웃(초)
+            max_failures (int): 연속 실패가 이 횟수를 넘으면 비활성화 (브라우저로 폴백)
+        """
+        if requests is None:
+            raise RuntimeError("requests 라이브러리가 필요합니다: pip install requests")
+        
+        self.endpoint = endpoint
+        self.timeout = timeout
+        self.max_failures = max_failures
+        self.failures = 0
+        self.calls = 0
+        
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({
+            name: value for name, value in (endpoint.get('headers') or {}).items()
+            if not name.startswith(':') and name.lower() not in self.SKIP_HEADERS
+        })
+
+    @property
+    def enabled(self):
+        """연속 실패 한도를 넘지 않았는지 여부"""
+        return self.failures < self.max_failures
+
+    def load_cookies(self, cookies):
+        """
+        브라우저 쿠키 복사
+        
+        Args:
+            cookies (list): driver.get_cookies() 결과
+        """
+        for cookie in cookies:
+            self.session.cookies.set(
+                cookie['name'], cookie['value'],
+                domain=cookie.get('domain'), path=cookie.get('path', '/')
+            )
+
+    def build_request(self, product_url):
+        """
+        새 상품용 요청 URL/본문 구성
+        
+        Returns:
+            tuple: (url, post_data) (식별자를 치환할 수 없으면 None)
+        """
+        source_ids = self.endpoint.get('source_ids') or {}
+        target = parse_product_url(product_url)
+        url = self.endpoint['url']
+        post_data = self.endpoint.get('post_data') or None
+        
+        replaced = False
+        for name in PRODUCT_ID_PARAMS:
+            old_value = source_ids.get(name)
+            if not old_value:
+                continue
+            if not target[name]:
+                # 원래 요청에 있던 식별자를 새 상품에서 알 수 없으면 잘못된 상품으로 요청하게 됨
+                return None
+            pattern = re.compile(rf'(?<!\d){re.escape(old_value)}(?!\d)')
+            url, url_count = pattern.subn(target[name], url)
+            body_count = 0
+            if post_data:
+                post_data, body_count = pattern.subn(target[name], post_data)
+            replaced = replaced or bool(url_count or body_count)
+        
+        # 식별자 자리가 하나도 없는 요청은 원래 상품의 단축 URL 을 돌려받게 되므로 사용하지 않음
+        return (url, post_data) if replaced else None
+
+    def shorten(self, product_url):
+        """
+        단축 URL API 직접 호출
+        
+        Args:
+            product_url (str): 상품 URL
+        
+        Returns:
+            str: 단축 URL (실패 시 None)
+        """
+        if not self.enabled:
+            return None
+        
+        request = self.build_request(product_url)
+        if not request:
+            return None
+        
+        url, post_data = request
+        self.calls += 1
+        try:
+            response = self.session.request(
+                self.endpoint.get('method', 'POST'), url,
+                data=post_data.encode('utf-8') if post_data else None,
+                timeout=self.timeout
+            )
+            short_url = find_short_url(response.text) if response.ok else None
+        except Exception as e:
+            print(f"[X] 단축 URL API 호출 실패: {e}")
+            short_url = None
+        
+        if short_url:
+            self.failures = 0
+        else:
+            self.failures += 1
+            if not self.enabled:
+                print("[!] 단축 URL API 연속 실패, 브라우저 방식으로 전환")
+        return short_url
+
+
+class LxmlExtractor:
+    """
+    브라우저 없이 HTML 에서 상품 카드와 단축 URL 을 추출하는 lxml 엔진
+    
+    BATCH_EXTRACT_PRODUCTS_JS / READ_SHORT_URL_JS 와 같은 셀렉터 순서와 판정 규칙을
+    저장된 스냅샷이나 실시간 page_source 에 한 번에 적용한다.
+    렌더링 정보가 없으므로 표시 여부는 hidden 속성과 인라인 style 로만 판단한다.
+    """
+
+    BLOCK_TAGS = {
+        'address', 'article', 'aside', 'blockquote', 'dd', 'div', 'dl', 'dt', 'fieldset', 'figcaption',
+        'figure', 'footer', 'form', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header', 'hr', 'li', 'main',
+        'nav', 'ol', 'p', 'pre', 'section', 'table', 'tr', 'ul'
+    }
+    SKIP_TAGS = {'script', 'style', 'noscript', 'template'}
+    HIDDEN_STYLE_RE = re.compile(r'display\s*:\s*none|visibility\s*:\s*hidden', re.I)
+    PRICE_RE = re.compile(r'[\d,]+원|₩[\d,]+|[\d,]+\s*원')
+
+    def __init__(self):
+        if lxml_html is None:
+            raise RuntimeError("lxml 라이브러리가 필요합니다: pip install lxml cssselect")
+        self._compiled = {}
+
+    @staticmethod
+    def available():
+        """lxml(+cssselect) 사용 가능 여부"""
+        return lxml_html is not None
+
+    def parse(self, html_text, base_url=None):
+        """
+        HTML 파싱 (base_url 이 있으면 href/src 를 절대 URL 로 변환)
+        
+        Returns:
+            lxml.html.HtmlElement: 문서 루트
+        """
+        root = lxml_html.fromstring(html_text)
+        if base_url:
+            try:
+                root.make_links_absolute(base_url, resolve_base_href=True)
+            except Exception:
+                pass
+        return root
+
+    def select(self, root, selector):
+        """CSS 셀렉터로 요소 찾기 (컴파일 결과 재사용, 지원하지 않는 셀렉터는 빈 목록)"""
+        compiled = self._compiled.get(selector)
+        if compiled is None:
+            try:
+                compiled = CSSSelector(selector, translator='html')
+            except Exception:
+                compiled = False
+            self._compiled[selector] = compiled
+        return compiled(root) if compiled else []
+
+    def _is_hidden(self, node):
+        return node.get('hidden') is not None or bool(self.HIDDEN_STYLE_RE.search(node.get('style') or ''))
+
+    def is_visible(self, element):
+        """hidden 속성이나 인라인 style 로 숨겨진 요소(조상 포함)가 아닌지 여부"""
+        return not any(self._is_hidden(node) for node in (element, *element.iterancestors()))
+
+    def inner_text(self, element):
+        """블록 요소 경계를 줄바꿈으로 바꾼 innerText 근사값"""
+        parts = []
+        
+        def walk(node):
+            if isinstance(node.tag, str) and node.tag not in self.SKIP_TAGS and not self._is_hidden(node):
+                block = node.tag in self.BLOCK_TAGS
+                if block or node.tag == 'br':
+                    parts.append('\n')
+                if node.text:
+                    parts.append(node.text)
+                for child in node:
+                    walk(child)
+                if block:
+                    parts.append('\n')
+            if node.tail and node is not element:
+                parts.append(node.tail)
+        
+        walk(element)
+        lines = (' '.join(line.split()) for line in ''.join(parts).split('\n'))
+        return '\n'.join(line for line in lines if line)
+
+    @staticmethod
+    def _has_any(text, words):
+        return any(word in text for word in words)
+
+    def collect_cards(self, root, selectors):
+        """
+        유효한 카드가 하나라도 있는 첫 셀렉터의 카드 (CARD_COLLECT_JS 의 collectCards 와 같은 규칙)
+        
+        Returns:
+            tuple: (카드 요소 리스트, 일치한 셀렉터)
+        """
+        for selector in selectors:
+            cards = [
+                element for element in self.select(root, selector)
+                if self.is_visible(element) and (
+                    len(self.inner_text(element)) > 10 or element.find('.//a') is not None
+                    or element.find('.//img') is not None
+                )
+            ]
+            if cards:
+                return cards, selector
+        return [], None
+
+    def count_cards(self, html_or_root, selectors=None):
+        """검색 결과에 렌더링된 상품 카드 수 (COUNT_RESULT_CARDS_JS 와 같은 규칙)"""
+        root = self.parse(html_or_root) if isinstance(html_or_root, (str, bytes)) else html_or_root
+        return len(self.collect_cards(root, selectors or RESULT_CARD_SELECTORS)[0])
+
+    def extract_products(self, html_or_root, count=10, card_selectors=None, base_url=None):
+        """
+        검색 결과 HTML 에서 상품 카드 정보 추출 (BATCH_EXTRACT_PRODUCTS_JS 와 같은 규칙)
+        
+        Args:
+            html_or_root: HTML 문자열 또는 parse() 결과
+            count (int): 앞에서부터 확인할 카드 개수 (None 이면 전체)
+            card_selectors (list): 카드 셀렉터 순서 (None 이면 PRODUCT_CARD_SELECTORS)
+            base_url (str): 상대 URL 변환 기준 주소
+        
+        Returns:
+            dict: {'selector', 'total', 'products': [{'rank', 'name', 'price', 'product_url', 'image_url'}]}
+        """
+        root = self.parse(html_or_root, base_url) if isinstance(html_or_root, (str, bytes)) else html_or_root
+        
+        cards, matched_selector = self.collect_cards(root, card_selectors or PRODUCT_CARD_SELECTORS)
+        
+        products = []
+        for index, card in enumerate(cards[:count]):
+            full_text = self.inner_text(card)
+            name = ''
+            
+            # 상품명: 전체 텍스트 첫 줄 -> 상품명 셀렉터 순
+            first_line = full_text.split('\n')[0].strip()
+            if len(first_line) > 5 and not self._has_any(first_line, ['%', '원', '₩', '할인']):
+                name = first_line
+            for selector in PRODUCT_NAME_SELECTORS:
+                if name:
+                    break
+                for element in self.select(card, selector)[:3]:
+                    text = self.inner_text(element)
+                    if len(text) > 10 and not self._has_any(text, ['%', '원', '₩', '할인', '쿠폰']):
+                        name = text.split('\n')[0]
+                        break
+            if not name:
+                continue
+            
+            # 상품 URL
+            product_url = ''
+            for selector in PRODUCT_LINK_SELECTORS:
+                for link in self.select(card, selector):
+                    href = link.get('href') or ''
+                    if href and ('product' in href or 'item' in href or 'coupang.com' in href):
+                        product_url = href
+                        break
+                if product_url:
+                    break
+            
+            # 가격
+            price = ''
+            for selector in PRODUCT_PRICE_SELECTORS:
+                for element in self.select(card, selector):
+                    text = self.inner_text(element)
+                    if text and (self._has_any(text, ['원', '₩', ',']) or re.search(r'\d', text)):
+                        price = text
+                        break
+                if price:
+                    break
+            if not price:
+                match = self.PRICE_RE.search(full_text)
+                if match:
+                    price = match.group(0)
+            
+            # 이미지 URL
+            image_url = ''
+            for image in card.iter('img'):
+                image_url = image.get('src') or image.get('data-src') or ''
+                if image_url:
+                    break
+            
+            products.append({
+                'rank': index + 1,
+                'name': name,
+                'price': price,
+                'product_url': product_url,
+                'image_url': image_url
+            })
+        
+        return {'selector': matched_selector, 'total': len(cards), 'products': products}
+
+    def extract_short_url(self, html_or_root, selectors=None):
+        """
+        링크 생성 페이지 HTML 에서 단축 URL 추출 (READ_SHORT_URL_JS 와 같은 규칙)
+        
+        Returns:
+            dict: {'url', 'selector'} (없으면 None)
+        """
+        root = self.parse(html_or_root) if isinstance(html_or_root, (str, bytes)) else html_or_root
+        for selector in selectors or SHORTEN_URL_INPUT_SELECTORS:
+            for element in self.select(root, selector):
+                url = find_short_url(f"{element.text_content()} {element.get('value') or ''}")
+                if url:
+                    return {'url': url, 'selector': selector}
+        return None
+
+
+class SnapshotRecorder:
+    """
+    페이지 HTML 스냅샷 저장소 (기록/재생용)
+    
+    검색 결과와 링크 생성 페이지의 page_source 를 실행별 디렉터리에 저장하고,
+    각 스냅샷의 URL, keyword/rank 태그, 실제 실행에서 얻은 결과를 manifest.jsonl 에 남긴다.
+    replay_snapshots.py 가 이 결과를 기대값으로 삼아 브라우저 없이 추출 규칙을 검증한다.
+    """
+
+    MANIFEST = "manifest.jsonl"
+
+    def __init__(self, root_dir="snapshots"):
+        """
+        Args:
+            root_dir (str): 스냅샷 저장 최상위 디렉터리 (실행마다 하위 디렉터리 생성)
+        """
+        self.run_dir = os.path.join(
+            root_dir, f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
+        )
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def capture(self, driver, kind, expected=None, **tags):
+        """
+        현재 페이지 HTML 저장
+        
+        Args:
+            driver: Selenium WebDriver
+            kind (str): 페이지 종류 ('search_results', 'link_generation')
+            expected: 실제 실행에서 얻은 결과 (재생 시 비교용)
+            **tags: keyword, rank 등
+        
+        Returns:
+            str: 저장한 파일 경로 (실패 시 None)
+        """
+        try:
+            html_text = driver.page_source
+            url = driver.current_url
+        except Exception as e:
+            print(f"[X] 스냅샷 저장 실패: {e}")
+            return None
+        return self.save(html_text, kind, url, expected, **tags)
+
+    def save(self, html_text, kind, url, expected=None, **tags):
+        """HTML 과 메타데이터 저장"""
+        with self._lock:
+            os.makedirs(self.run_dir, exist_ok=True)
+            self.count += 1
+            filename = f"{self.count:05d}_{kind}.html"
+            with open(os.path.join(self.run_dir, filename), 'w', encoding='utf-8') as f:
+                f.write(html_text)
+            with open(os.path.join(self.run_dir, self.MANIFEST), 'a', encoding='utf-8') as f:
+                f.write(json.dumps({
+                    'file': filename,
+                    'kind': kind,
+                    'url': url,
+                    'tags': tags,
+                    'expected': expected,
+                    'captured_at': datetime.now().isoformat(timespec='seconds')
+                }, ensure_ascii=False) + "\n")
+        return os.path.join(self.run_dir, filename)
+
+    @classmethod
+    def iter_snapshots(cls, root_dir):
+        """
+        root_dir 아래 모든 실행의 스냅샷 순회
+        
+        Yields:
+            tuple: (manifest 레코드, HTML 파일 경로)
+        """
+        for dirpath, _, filenames in sorted(os.walk(root_dir)):
+            if cls.MANIFEST not in filenames:
+                continue
+            with open(os.path.join(dirpath, cls.MANIFEST), 'r', encoding='utf-8') as f:
+                for line in f:
+                    if line.strip():
+                        record = json.loads(line)
+                        yield record, os.path.join(dirpath, record['file'])
+
+
+class TabPool:
+    """
+    재사용 탭 풀
+    
+    K개의 탭을 한 번만 열어 두고, 각 탭에 다음 상품 페이지를 비동기로 로드시킨 뒤
+    먼저 준비된 탭부터 처리한다. 탭 생성/종료 비용이 없어지고, 한 탭을 처리하는 동안
+    다른 탭들이 로딩된다.
+    """
+
+    # 이전 문서에 표시를 남기고 이동 (같은 문서의 해시만 바뀌는 경우 새로 불러옴)
+    LOAD_JS = (
+        "var url = arguments[0];"
+        "window.__tabPoolStale = true;"
+        "var sameDocument = url.indexOf('#') !== -1 && url.split('#')[0] === location.href.split('#')[0];"
+        "location.href = url;"
+        "if (sameDocument) { location.reload(); }"
+    )
+    READY_JS = (
+        "return !window.__tabPoolStale && document.readyState === 'complete'"
+        " && location.href !== 'about:blank' && !!document.querySelector(arguments[0]);"
+    )
+
+    def __init__(self, driver, size=3, ready_selector=None):
+        """
+        Args:
+            driver: Selenium WebDriver
+            size (int): 탭 개수
+            ready_selector (str): 로드 완료로 판단할 요소의 CSS 셀렉터
+        """
+        self.driver = driver
+        self.size = max(1, size)
+        self.ready_selector = ready_selector or f"{LINK_GENERATION_READY_CSS}, {HOVER_BUTTON_WAIT_CSS}"
+        self.home = None
+        self.handles = []
+        self.current = None
+
+    def open(self):
+        """탭 열기"""
+        self.home = self.driver.current_window_handle
+        for _ in range(self.size):
+            self.driver.switch_to.new_window('tab')
+            self.handles.append(self.driver.current_window_handle)
+        self.current = self.handles[-1]
+        print(f"탭 풀 준비: {len(self.handles)}개")
+
+    def switch(self, handle):
+        """탭 전환 (이미 해당 탭이면 생략)"""
+        if self.current != handle:
+            self.driver.switch_to.window(handle)
+            self.current = handle
+
+    def load(self, handle, url):
+        """탭에 URL 로드 시작 (로드 완료를 기다리지 않음)"""
+        self.switch(handle)
+        self.driver.execute_script(self.LOAD_JS, url)
+
+    def is_ready(self, handle):
+        """탭의 새 페이지 로드가 끝났는지 여부"""
+        self.switch(handle)
+        try:
+            return bool(self.driver.execute_script(self.READY_JS, self.ready_selector))
+        except Exception:
+            return False
+
+    def wait_for_ready(self, handles, waiter, timeout):
+        """
+        handles 중 먼저 준비된 탭 반환
+        
+        Returns:
+            str: 준비된 탭 핸들 (시간 초과 시 None)
+        """
+        return waiter.until(
+            lambda driver: next((handle for handle in handles if self.is_ready(handle)), None),
+            "tab_pool_ready", timeout=timeout
+        )
+
+    def close(self):
+        """탭 닫고 원래 탭으로 복귀"""
+        for handle in self.handles:
+            try:
+                self.driver.switch_to.window(handle)
+                self.driver.close()
+            except Exception:
+                continue
+        self.handles = []
+        if self.home:
+            self.driver.switch_to.window(self.home)
+            self.current = self.home
+
+
+class BrowserProfileMonitor:
+    """
+    브라우저 프로필별 페이지 로드 시간과 Chrome 메모리(RSS) 측정
+    
+    기본 프로필과 경량 프로필(lean)을 같은 작업으로 각각 실행해 출력되는 요약을 비교한다.
+    RSS 측정은 psutil 이 설치되어 있을 때만 동작한다.
+    """
+
+    def __init__(self, driver, profile="default"):
+        """
+        Args:
+            driver: Selenium WebDriver
+            profile (str): 프로필 이름 (출력용)
+        """
+        self.driver = driver
+        self.profile = profile
+        self.records = []
+        self.rss_samples = []
+
+    def record(self, label):
+        """
+        현재 탭의 페이지 로드 지표와 Chrome RSS 기록
+        
+        Args:
+            label (str): 페이지 종류 (통계 집계용)
+        """
+        try:
+            metrics = self.driver.execute_script(PAGE_LOAD_METRICS_JS) or {}
+        except Exception:
+            return
+        
+        metrics['label'] = label
+        self.records.append(metrics)
+        
+        rss = self.chrome_rss()
+        if rss is not None:
+            self.rss_samples.append(rss)
+
+    def chrome_rss(self):
+        """
+        chromedriver 가 띄운 Chrome 프로세스 전체의 RSS 합계
+        
+        Returns:
+            int: 바이트 단위 RSS (psutil 이 없거나 측정할 수 없으면 None)
+        """
+        if psutil is None:
+            return None
+        
+        try:
+            service_process = psutil.Process(self.driver.service.process.pid)
+            return sum(child.memory_info().rss for child in service_process.children(recursive=True))
+        except Exception:
+            return None
+
+    def summary(self):
+        """
+        페이지 종류별 통계
+        
+        Returns:
+            dict: {label: {'count', 'avg_load_ms', 'avg_resources', 'avg_transfer_kb'}}
+        """
+        grouped = {}
+        for record in self.records:
+            grouped.setdefault(record['label'], []).append(record)
+        
+        stats = {}
+        for label, records in grouped.items():
+            load_times = [r['load_ms'] for r in records if r.get('load_ms')]
+            stats[label] = {
+                'count': len(records),
+                'avg_load_ms': sum(load_times) / len(load_times) if load_times else None,
+                'avg_resources': sum(r.get('resources', 0) for r in records) / len(records),
+                'avg_transfer_kb': sum(r.get('transfer_bytes', 0) for r in records) / len(records) / 1024,
+            }
+        return stats
+
+    def print_summary(self):
+        """프로필 측정 결과 출력"""
+        stats = self.summary()
+        if not stats:
+            return
+        
+        print(f"\n=== 브라우저 프로필 측정 ({self.profile}) ===")
+        for label, stat in stats.items():
+            load = f"{stat['avg_load_ms']:.0f}ms" if stat['avg_load_ms'] is not None else "-"
+            print(f"  {label}: {stat['count']}회, 평균 로드 {load}, "
+                  f"리소스 {stat['avg_resources']:.1f}개, 전송 {stat['avg_transfer_kb']:.1f}KB")
+        
+        if self.rss_samples:
+            mb = 1024 * 1024
+            print(f"  Chrome RSS: 평균 {sum(self.rss_samples) / len(self.rss_samples) / mb:.0f}MB, "
+                  f"최대 {max(self.rss_samples) / mb:.0f}MB")
+        elif psutil is None:
+            print("  Chrome RSS: psutil 미설치로 측정 안 함 (pip install psutil)")
+
 
 class CoupangPartnersWebAutomation:
-    def __init__(self, headless=False):
+    def __init__(self, headless=False, wait_timeout=10, poll_frequency=0.1,
+                 selector_cache_path="selector_cache.json",
+                 session_path="coupang_session.json", user_data_dir=None,
+                 short_url_cache_path="short_url_cache.sqlite3", short_url_cache_ttl_days=30,
+                 direct_link_generation=True, link_generation_url_template=None,
+                 http_shortening=False, lean_profile=False, profile_commands=False,
+                 base_url="https://partners.coupang.com", target_url=None,
+                 extraction_engine="script", snapshot_dir=None,
+                 result_sink_path=None, result_run_id=None, result_sink=None, export_formats=('xlsx',),
+                 tab_pool_size=3):
         """
         쿠팡 파트너스 웹사이트 자동화 클래스
         
         Args:
             headless (bool): 브라우저를 숨김 모드로 실행할지 여부
+            wait_timeout (float): 조건 대기 기본 최대 시간(초)
+            poll_frequency (float): 조건 대기 확인 간격(초)
+            selector_cache_path (str): 학습된 셀렉터 순위 저장 파일 (None 이면 저장 안 함)
+            session_path (str): 로그인 세션(쿠키/localStorage) 저장 파일 (None 이면 저장 안 함)
+            user_data_dir (str): 전용 Chrome 프로필 디렉터리 (지정 시 브라우저가 세션을 직접 유지)
+            short_url_cache_path (str): 단축 URL 캐시 SQLite 파일 (None 이면 캐시 사용 안 함)
+            short_url_cache_ttl_days (float): 단축 URL 캐시 유효 기간(일)
+            direct_link_generation (bool): 상품 식별자로 링크 생성 페이지 URL을 만들어 바로 이동할지 여부
+                (실패하면 호버/클릭 방식으로 폴백)
+            link_generation_url_template (str): 링크 생성 페이지 URL 템플릿
+                ({productId}, {itemId}, {vendorItemId} 치환, None 이면 실행 중 관찰한 URL에서 학습)
+            http_shortening (bool): 브라우저 성능 로그로 단축 URL API 요청을 캡처한 뒤
+                이후 상품은 HTTP로 직접 단축 (실패하면 브라우저로 폴백)
+            lean_profile (bool): 이미지/미디어/폰트/외부 트래커를 차단하고
+                메모리 사용을 줄이는 경량 브라우저 프로필 사용
+            profile_commands (bool): WebDriver 명령 수와 지연 시간을 명령 종류/호출 위치별로 집계
+            base_url (str): 쿠팡 파트너스 사이트 주소 (모의 사이트로 벤치마크할 때 변경)
+            target_url (str): 제휴 워크스페이스 주소 (None 이면 base_url + "/#affiliate/ws")
+            extraction_engine (str): 검색 결과 일괄 추출 방식
+                ('script': execute_script, 'lxml': page_source 를 한 번 받아 lxml 로 파싱)
+            snapshot_dir (str): 검색 결과/링크 생성 페이지 HTML 스냅샷 저장 디렉터리 (None 이면 저장 안 함)
+            result_sink_path (str): 상품별 결과를 즉시 추가 기록할 JSON Lines 파일 (None 이면 기록 안 함)
+            result_run_id (str): 결과 기록의 실행 식별자 (워커끼리 공유, None 이면 현재 시각)
+            result_sink (ResultSink): 공유할 결과 기록 저장소 (지정하면 result_sink_path 대신 사용,
+                닫는 것은 만든 쪽의 책임)
+            export_formats (tuple): 결과 파일 형식 (EXPORTERS 의 키, 기본값 엑셀)
+            tab_pool_size (int): 상품 URL 목록을 단축할 때 미리 로드하며 재사용할 탭 수
         """
+        self.wait_timeout = wait_timeout
+        self.http_shortening = http_shortening and requests is not None
+        self.shorten_endpoint = None
+        self.http_shortener = None
+        self.poll_frequency = poll_frequency
+        self.user_data_dir = user_data_dir
+        self.lean_profile = lean_profile
+        self.profile_commands = profile_commands
+        self.tracer = PhaseTracer()
+        self.snapshots = SnapshotRecorder(snapshot_dir) if snapshot_dir else None
+        self.owns_result_sink = result_sink is None
+        if result_sink is None and result_sink_path:
+            result_sink = ResultSink(result_sink_path, result_run_id)
+        self.result_sink = result_sink
+        self.export_formats = tuple(export_formats)
+        self.tab_pool_size = max(1, tab_pool_size)
+        self.lxml_extractor = None
+        if extraction_engine == "lxml":
+            if LxmlExtractor.available():
+                self.lxml_extractor = LxmlExtractor()
+            else:
+                print("[!] lxml 이 설치되지 않아 JavaScript 일괄 추출을 사용합니다. (pip install lxml cssselect)")
+        self.selectors = SelectorResolver(selector_cache_path, fallback_only={"product_card": LOOSE_CARD_SELECTORS})
+        self.session_store = SessionStore(session_path)
+        self.short_url_cache = (
+            ShortUrlCache(short_url_cache_path, ttl_days=short_url_cache_ttl_days)
+            if short_url_cache_path else None
+        )
         self.setup_driver(headless)
-        self.base_url = "https://partners.coupang.com"
-        self.target_url = "https://partners.coupang.com/#affiliate/ws"
+        self.base_url = base_url.rstrip('/')
+        self.target_url = target_url or f"{self.base_url}/#affiliate/ws"
         self.products_data = []
+        self.products_processed = 0
+        self.last_link_generation_url = None
+        self.direct_link_generation = direct_link_generation
+        self.link_generation_url_template = link_generation_url_template
 
     def setup_driver(self, headless=False):
         """Chrome 드라이버 설정"""
         chrome_options = Options()
         
         if headless:
-            chrome_options.add_argument('--headless')
+            chrome_options.add_argument('--headless=new')
         
         chrome_options.add_argument('--no-sandbox')
         chrome_options.add_argument('--disable-dev-shm-usage')
@@ -40,13 +1891,149 @@ class CoupangPartnersWebAutomation:
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option('useAutomationExtension', False)
         chrome_options.add_argument('--window-size=1920,1080') 
+        if self.lean_profile:
+            for argument in LEAN_CHROME_ARGS:
+                chrome_options.add_argument(argument)
+            chrome_options.add_experimental_option('prefs', LEAN_CHROME_PREFS)
+        if self.user_data_dir:
+            chrome_options.add_argument(f'--user-data-dir={os.path.abspath(self.user_data_dir)}')
+        if self.http_shortening:
+            # 단축 URL API 요청 캡처용 DevTools 네트워크 로그
+            chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
         chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
         
         self.driver = webdriver.Chrome(options=chrome_options)
+        self.command_profiler = WebDriverCommandProfiler(self.driver) if self.profile_commands else None
+        self.driver.set_script_timeout(30)
         self.wait = WebDriverWait(self.driver, 15)
+        self.waiter = WaitEngine(self.driver, self.wait_timeout, self.poll_frequency)
+        self.profile_monitor = BrowserProfileMonitor(self.driver, "lean" if self.lean_profile else "default")
+        self.apply_resource_blocking()
         
         print("Chrome 드라이버 초기화 완료")
 
+    def apply_resource_blocking(self):
+        """
+        경량 프로필이면 현재 탭에 리소스 차단 적용
+        
+        CDP 차단 설정은 탭마다 따로 적용되므로 새 탭을 열 때마다 호출한다.
+        """
+        if not self.lean_profile:
+            return
+        
+        try:
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': LEAN_BLOCKED_URL_PATTERNS})
+        except Exception as e:
+            print(f"리소스 차단 설정 실패: {e}")
+
+    def record_result(self, product, keyword=None):
+        """
+        결과 기록 저장소가 있으면 상품 결과 한 줄 추가 (단축 URL 이 정해질 때마다 호출)
+        
+        Args:
+            product (dict): 상품 정보
+            keyword (str): 검색 키워드 (None 이면 현재 keyword 태그)
+        """
+        if self.result_sink:
+            self.result_sink.write(product, keyword or self.tracer.tags.get('keyword'))
+
+    def find_first_element(self, role, selectors, any_of=None, visible=True, enabled=True, timeout=0):
+        """
+        셀렉터 폴백 목록 전체를 execute_script 한 번으로 확인해 조건에 맞는 첫 요소 반환
+        
+        학습된 순서(SelectorResolver)대로 CSS/XPath 셀렉터를 브라우저 안에서 차례로 적용하고
+        표시/활성 여부와 텍스트/클래스/속성 조건을 함께 검사한다.
+        
+        Args:
+            role (str): 셀렉터 역할 이름 (순서 학습/통계용)
+            selectors (list): CSS 또는 //로 시작하는 XPath 셀렉터 목록
+            any_of (list): 조건 목록 [{필드: [부분 문자열, ...]}, ...], 하나라도 만족하면 일치
+                (필드는 'text', 'class' 또는 속성 이름, 한 조건의 문자열은 모두 포함되어야 함, 대소문자 무시)
+            visible (bool): 화면에 표시된 요소만 찾을지 여부
+            enabled (bool): 비활성(disabled) 요소를 제외할지 여부
+            timeout (float): 요소가 나타날 때까지 기다릴 최대 시간(초), 0 이면 한 번만 확인
+        
+        Returns:
+            WebElement: 찾은 요소 (없으면 None)
+        """
+        ordered = self.selectors.ordered(role, selectors)
+        options = {'visible': visible, 'enabled': enabled, 'anyOf': any_of or []}
+        
+        def lookup(driver):
+            return driver.execute_script(FIND_FIRST_ELEMENT_JS, ordered, options)
+        
+        if timeout:
+            result = self.waiter.until(lookup, f"find_{role}", timeout=timeout)
+        else:
+            try:
+                result = lookup(self.driver)
+            except Exception as e:
+                print(f"[X] 요소 찾기 실패 ({role}): {e}")
+                result = None
+        
+        if not result:
+            self.selectors.record_miss(role)
+            return None
+        
+        self.selectors.record_hit(role, result['selector'])
+        return result['element']
+
+    def is_logged_in(self, timeout=5):
+        """
+        현재 브라우저 세션이 로그인 상태인지 빠르게 확인
+        
+        제휴 워크스페이스를 열어 로그인 페이지로 튕기지 않고 검색 입력창이 보이면 로그인 상태로 본다.
+        
+        Args:
+            timeout (float): 최대 확인 시간(초)
+        
+        Returns:
+            bool: 로그인 상태 여부
+        """
+        try:
+            self.driver.get(self.target_url)
+            ready = self.waiter.until(
+                lambda driver: 'login' not in driver.current_url.lower()
+                and any(element.is_displayed() for element in driver.find_elements(By.CSS_SELECTOR, SEARCH_INPUT_WAIT_CSS)),
+                "session_check", timeout=timeout
+            )
+            return bool(ready)
+        except Exception:
+            return False
+
+    def ensure_login(self, email, password):
+        """
+        저장된 세션으로 로그인 상태를 복원하고, 실패한 경우에만 로그인 실행
+        
+        Args:
+            email (str): 로그인 이메일
+            password (str): 로그인 비밀번호
+        
+        Returns:
+            bool: 로그인 상태 확보 여부
+        """
+        if self.user_data_dir and self.is_logged_in():
+            print("[O] Chrome 프로필의 로그인 세션 사용")
+            return True
+        
+        if self.session_store.exists():
+            print("저장된 로그인 세션 복원 중...")
+            try:
+                if self.session_store.restore(self.driver, self.base_url) and self.is_logged_in():
+                    print("[O] 저장된 세션으로 로그인 확인")
+                    return True
+            except Exception as e:
+                print(f"[X] 세션 복원 실패: {e}")
+            print("[!] 저장된 세션이 만료되었습니다. 다시 로그인합니다.")
+        
+        if not self.login(email, password):
+            return False
+        
+        self.session_store.save(self.driver)
+        return True
+
+    @traced("login")
     def login(self, email, password):
         """
         쿠팡 파트너스에 로그인
@@ -61,7 +2048,7 @@ class CoupangPartnersWebAutomation:
             # 쿠팡 파트너스 메인 페이지로 이동
             print("쿠팡 파트너스 메인 페이지 접속 중...")
             self.driver.get(self.base_url)
-            time.sleep(3)
+            self.waiter.document_ready("login_home_load")
             
             # 로그인 버튼 찾기 및 클릭
             print("로그인 버튼 찾는 중...")
@@ -78,43 +2065,20 @@ class CoupangPartnersWebAutomation:
                 "button[class*='login']"
             ]
 
-            login_button = None
-            for selector in login_button_selectors:
-                try:
-                    if selector.startswith("//"):
-                        elements = self.driver.find_elements(By.XPATH, selector)
-                    else:
-                        elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    
-                    for element in elements:
-                        if element.is_displayed() and element.is_enabled():
-                            text = element.text.strip().lower()
-                            class_name = element.get_attribute('class') or ""
-                            href = element.get_attribute('href') or ""
-                            
-                            if (
-                                ('ant-btn' in class_name and 'btn-link' in class_name) or
-                                any(keyword in text for keyword in ['로그인', 'login', '시작']) or 
-                                'login' in href.lower()
-                            ):
-                                login_button = element
-                                print(f"로그인 버튼 찾음: {selector}")
-                                break
-                    
-                    if login_button:
-                        break
-                        
-                except Exception:
-                    continue
-            
+            login_button = self.find_first_element(
+                "login_button", login_button_selectors,
+                any_of=[{'class': ['ant-btn', 'btn-link']}, {'text': ['로그인']}, {'text': ['login']},
+                        {'text': ['시작']}, {'href': ['login']}]
+            )
             if not login_button:
                 print("로그인 버튼을 찾을 수 없습니다.")
                 return False
+            print("로그인 버튼 찾음")
             
             # 로그인 버튼 클릭
             print("로그인 버튼 클릭 중...")
             self.driver.execute_script("arguments[0].scrollIntoView(true);", login_button)
-            time.sleep(1)
+            self.waiter.until(lambda driver: login_button.is_displayed(), "login_button_scroll", timeout=1)
             
             try:
                 login_button.click()
@@ -124,7 +2088,7 @@ class CoupangPartnersWebAutomation:
                 except:
                     ActionChains(self.driver).move_to_element(login_button).click().perform()
             
-            time.sleep(3)
+            self.waiter.element_present(LOGIN_FORM_WAIT_CSS, "login_form", timeout=10)
             
             print("로그인 폼에 정보 입력 중...")
             
@@ -141,21 +2105,11 @@ class CoupangPartnersWebAutomation:
                 "#username"
             ]
             
-            email_input = None
-            for selector in email_selectors:
-                try:
-                    email_input = WebDriverWait(self.driver, 5).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                    )
-                    if email_input and email_input.is_displayed():
-                        print(f"이메일 입력창 찾음: {selector}")
-                        break
-                except:
-                    continue
-            
+            email_input = self.find_first_element("email_input", email_selectors, enabled=False, timeout=5)
             if not email_input:
                 print("이메일 입력창을 찾을 수 없습니다.")
                 return False
+            print("이메일 입력창 찾음")
             
             email_input.clear()
             email_input.send_keys(email)
@@ -169,19 +2123,11 @@ class CoupangPartnersWebAutomation:
                 "#password"
             ]
             
-            password_input = None
-            for selector in password_selectors:
-                try:
-                    password_input = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    if password_input and password_input.is_displayed():
-                        print(f"비밀번호 입력창 찾음: {selector}")
-                        break
-                except:
-                    continue
-            
+            password_input = self.find_first_element("password_input", password_selectors, enabled=False)
             if not password_input:
                 print("비밀번호 입력창을 찾을 수 없습니다.")
                 return False
+            print("비밀번호 입력창 찾음")
             
             password_input.clear()
             password_input.send_keys(password)
@@ -195,20 +2141,7 @@ class CoupangPartnersWebAutomation:
                 "//input[@value='로그인']"
             ]
             
-            submit_button = None
-            for selector in submit_selectors:
-                try:
-                    if selector.startswith("//"):
-                        submit_button = self.driver.find_element(By.XPATH, selector)
-                    else:
-                        submit_button = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    
-                    if submit_button and submit_button.is_displayed():
-                        print(f"로그인 제출 버튼 찾음: {selector}")
-                        break
-                except:
-                    continue
-            
+            submit_button = self.find_first_element("login_submit", submit_selectors, enabled=False)
             if submit_button:
                 submit_button.click()
                 print("로그인 제출 버튼 클릭 완료")
@@ -218,126 +2151,450 @@ class CoupangPartnersWebAutomation:
             
             # 로그인 완료 대기
             print("로그인 완료 대기 중...")
-            try:
-                WebDriverWait(self.driver, 15).until(
-                    lambda driver: 
-                    ("dashboard" in driver.current_url.lower() or
-                     "main" in driver.current_url.lower() or
-                     "home" in driver.current_url.lower() or
-                     ("partners.coupang.com" in driver.current_url and "login" not in driver.current_url.lower()))
-                )
+            if self.waiter.until(
+                lambda driver: 
+                ("dashboard" in driver.current_url.lower() or
+                 "main" in driver.current_url.lower() or
+                 "home" in driver.current_url.lower() or
+                 (urlparse(self.base_url).netloc in driver.current_url and "login" not in driver.current_url.lower())),
+                "login_redirect", timeout=15
+            ):
                 print("로그인 성공!")
                 return True
-            except:
+            else:
                 print("로그인 상태 확인 중...")
-                time.sleep(5)
-                return True
+                if self.waiter.url_not_contains("login", "login_settle", timeout=5):
+                    print("로그인 성공!")
+                    return True
+                print("로그인 완료를 확인할 수 없습니다.")
+                return False
                 
         except Exception as e:
             print(f"로그인 실패: {e}")
             return False
 
+    @traced("navigate_ws")
     def navigate_to_affiliate_ws(self):
         """제휴 워크스페이스로 이동"""
         try:
-            print("제휴 워크스페이스로 이동 중...")
-            self.driver.get(self.target_url)
-            time.sleep(5)
+            print("제휴 워크스페이스로 이동 중...")
+            self.driver.get(self.target_url)
+            self.waiter.element_visible(SEARCH_INPUT_WAIT_CSS, "workspace_load")
+            self.profile_monitor.record("affiliate_ws")
+            
+            print(f"현재 URL: {self.driver.current_url}")
+            return True
+            
+        except Exception as e:
+            print(f"워크스페이스 이동 실패: {e}")
+            return False
+
+    def submit_search(self, keyword):
+        """
+        검색 입력창에 키워드를 입력하고 검색 실행
+
+        Args:
+            keyword (str): 검색할 키워드
+
+        Returns:
+            bool: 검색 실행 여부
+        """
+        # 검색 입력창 찾기
+        print("검색 입력창 찾는 중...")
+        search_input_selectors = [
+            ".ant-input.ant-input-lg",
+            "input.ant-input.ant-input-lg",
+            ".ant-input-lg",
+            "input[class*='ant-input'][class*='lg']",
+            "input[placeholder*='상품']",
+            "input[placeholder*='검색']",
+            "input[placeholder*='키워드']",
+            ".search-input",
+            "#search-input"
+        ]
+        
+        search_input = self.find_first_element("search_input", search_input_selectors, enabled=False, timeout=5)
+        if not search_input:
+            print("검색 입력창을 찾을 수 없습니다.")
+            return False
+        print("검색 입력창 찾음")
+        
+        # 검색어 입력
+        print(f"검색어 '{keyword}' 입력 중...")
+        search_input.clear()
+        search_input.send_keys(keyword)
+        self.waiter.until(
+            lambda driver: search_input.get_attribute('value') == keyword,
+            "search_input_value", timeout=1
+        )
+        
+        # 검색 버튼 클릭
+        print("검색 버튼 찾는 중...")
+        search_button_selectors = [
+            ".search-button",
+            "button.search-button", 
+            "[class*='search-button']",
+            ".ant-btn[class*='search']",
+            "button[class*='search']",
+            ".search-btn",
+            ".btn-search",
+            "//button[contains(@class, 'search-button')]",
+            "//button[contains(text(), '검색')]"
+        ]
+        
+        search_button = self.find_first_element("search_button", search_button_selectors)
+        if search_button:
+            search_button.click()
+            print("검색 버튼 클릭 완료")
+        else:
+            search_input.send_keys(Keys.ENTER)
+            print("Enter 키로 검색 시도")
+        
+        return True
+
+    def count_result_cards(self):
+        """
+        현재 페이지에 렌더링된 상품 카드 수 (JavaScript 한 번으로 확인)
+        
+        상품 카드 전용 셀렉터(RESULT_CARD_SELECTORS)로 찾은 카드 중 일괄 추출과 같은 규칙
+        (화면에 보이고 텍스트/링크/이미지가 있음)을 통과한 카드만 센다.
+        """
+        try:
+            return self.driver.execute_script(COUNT_RESULT_CARDS_JS, RESULT_CARD_SELECTORS) or 0
+        except Exception:
+            return 0
+
+    def wait_for_result_cards(self, count, label="search_results", timeout=None, raise_on_timeout=False):
+        """
+        검색 결과에 상품 카드가 count 개 이상 렌더링될 때까지 대기 (링크 생성 페이지에서는 미충족)
+        
+        Args:
+            count (int): 필요한 상품 카드 수
+            label (str): 대기 이름 (통계 집계용)
+            timeout (float): 최대 대기 시간(초), None 이면 기본값
+            raise_on_timeout (bool): 시간 초과 시 TimeoutException 을 던질지 여부
+        
+        Returns:
+            int: 렌더링된 상품 카드 수 (시간 초과 시 None)
+        """
+        def rendered(driver):
+            if 'linkgeneration' in driver.current_url:
+                return 0
+            cards = self.count_result_cards()
+            return cards if cards >= count else 0
+        
+        return self.waiter.until(rendered, label, timeout=timeout, raise_on_timeout=raise_on_timeout)
+
+    @traced("return_to_results")
+    def return_to_search_results(self, keyword, index):
+        """
+        링크 생성 페이지에서 검색 결과 페이지로 복귀
+        
+        브라우저 히스토리(뒤로 가기)로 이전 검색 결과를 복원하고,
+        복원에 실패한 경우에만 검색을 다시 실행한다.
+        
+        Args:
+            keyword (str): 검색 키워드 (재검색용)
+            index (int): 다음에 처리할 상품 인덱스
+        
+        Returns:
+            bool: 검색 결과 페이지 복귀 성공 여부
+        """
+        try:
+            if 'linkgeneration' in self.driver.current_url:
+                self.driver.back()
             
-            print(f"현재 URL: {self.driver.current_url}")
+            self.wait_for_result_cards(index + 1, "history_restore", timeout=5, raise_on_timeout=True)
+            print("[O] 히스토리로 검색 결과 복원")
+            return True
+        except Exception:
+            print("[!] 검색 결과 복원 실패, 다시 검색합니다.")
+        
+        try:
+            self.driver.get(self.target_url)
+            self.waiter.element_visible(SEARCH_INPUT_WAIT_CSS, "workspace_load")
+            if not self.submit_search(keyword):
+                return False
+            self.wait_for_result_cards(index + 1)
             return True
-            
         except Exception as e:
-            print(f"워크스페이스 이동 실패: {e}")
+            print(f"[X] 재검색 실패: {e}")
             return False
 
-    def search_products_and_get_short_urls(self, keyword, count=10):
+    def learn_link_generation_template(self, url):
         """
-        키워드로 상품 검색 후 첫 번째 상품에 마우스 호버하여 단축 URL 생성 및 상품 정보 저장
+        관찰한 링크 생성 페이지 URL에서 상품 식별자 자리를 치환 변수로 바꾼 템플릿 학습
         
         Args:
-            keyword (str): 검색할 키워드
+            url (str): 링크 생성 페이지 URL
+        """
+        if self.link_generation_url_template:
+            return
+        
+        info = parse_product_url(url)
+        if not info['is_link_generation'] or not info['productId']:
+            return
+        
+        template = url
+        for name in PRODUCT_ID_PARAMS:
+            if info[name]:
+                template = re.sub(
+                    rf'(?<=[?&]){name}={re.escape(info[name])}(?=&|$)',
+                    f'{name}={{{name}}}',
+                    template
+                )
+        
+        if '{productId}' in template:
+            self.link_generation_url_template = template
+            print(f"[O] 링크 생성 URL 템플릿 학습: {template[:100]}...")
+
+    def build_link_generation_url(self, product_url):
+        """
+        상품 URL의 식별자로 링크 생성 페이지 URL 구성
+        
+        Args:
+            product_url (str): 상품 URL
+        
+        Returns:
+            str: 링크 생성 페이지 URL (템플릿이나 productId 가 없으면 None)
+        """
+        template = self.link_generation_url_template
+        info = parse_product_url(product_url)
+        if not template or not info['productId']:
+            return None
+        
+        url = template
+        for name in PRODUCT_ID_PARAMS:
+            placeholder = f'{{{name}}}'
+            if info[name]:
+                url = url.replace(placeholder, info[name])
+            else:
+                url = re.sub(rf'(?<=[?&]){name}={re.escape(placeholder)}&?', '', url)
+        return url.rstrip('&?')
+
+    @traced("link_generation_nav")
+    def open_link_generation_directly(self, product_url, link_generation_url=None):
+        """
+        호버/클릭 없이 링크 생성 페이지로 바로 이동
+        
+        Args:
+            product_url (str): 상품 URL
+            link_generation_url (str): 이미 알고 있는 링크 생성 페이지 URL (없으면 템플릿으로 구성)
         
         Returns:
-            list: 상품 정보와 단축 URL이 포함된 딕셔너리 리스트
+            bool: 링크 생성 페이지가 준비되었는지 여부
         """
+        if not self.direct_link_generation:
+            return False
+        
+        url = link_generation_url or self.build_link_generation_url(product_url)
+        if not url:
+            return False
+        
+        print(f"링크 생성 페이지로 바로 이동: {url[:100]}...")
         try:
-            print(f"'{keyword}' 키워드로 상품 검색 중...")
-            
-            # 검색 입력창 찾기
-            print("검색 입력창 찾는 중...")
-            search_input_selectors = [
-                ".ant-input.ant-input-lg",
-                "input.ant-input.ant-input-lg",
-                ".ant-input-lg",
-                "input[class*='ant-input'][class*='lg']",
-                "input[placeholder*='상품']",
-                "input[placeholder*='검색']",
-                "input[placeholder*='키워드']",
-                ".search-input",
-                "#search-input"
-            ]
-            
-            search_input = None
-            for selector in search_input_selectors:
-                try:
-                    search_input = WebDriverWait(self.driver, 5).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                    )
-                    if search_input and search_input.is_displayed():
-                        print(f"검색 입력창 찾음: {selector}")
-                        break
-                except:
-                    continue
+            self.driver.get(url)
+            if (self.waiter.url_contains('linkgeneration', "link_generation_direct", timeout=5)
+                    and self.waiter.element_present(LINK_GENERATION_READY_CSS, "link_generation_direct_ready", timeout=5)):
+                print("[O] 링크 생성 페이지 직접 이동 성공")
+                self.last_link_generation_url = self.driver.current_url
+                return True
+        except Exception as e:
+            print(f"[X] 링크 생성 페이지 직접 이동 실패: {e}")
+            return False
+        
+        print("[!] 링크 생성 페이지 직접 이동 실패, 호버/클릭 방식으로 진행")
+        return False
+
+    def capture_shorten_endpoint(self):
+        """
+        DevTools 성능 로그에서 단축 URL을 반환한 XHR/Fetch 요청을 찾아 HTTP 클라이언트 준비
+        
+        링크 생성 페이지에서 단축 URL을 얻은 직후 호출한다. 로그는 읽을 때마다 비워지므로
+        엔드포인트를 찾은 뒤에도 호출해 로그가 쌓이지 않게 한다.
+        
+        Returns:
+            dict: 캡처한 요청 정보 (찾지 못하면 None)
+        """
+        if not self.http_shortening:
+            return None
+        
+        try:
+            entries = self.driver.get_log('performance')
+        except Exception as e:
+            print(f"[X] 성능 로그 읽기 실패: {e}")
+            return None
+        
+        if self.http_shortener:
+            return self.shorten_endpoint
+        
+        requests_by_id = {}
+        candidates = []
+        for entry in entries:
+            try:
+                message = json.loads(entry['message'])['message']
+            except Exception:
+                continue
             
-            if not search_input:
-                print("검색 입력창을 찾을 수 없습니다.")
-                return None
+            params = message.get('params', {})
+            if message.get('method') == 'Network.requestWillBeSent':
+                requests_by_id[params.get('requestId')] = params.get('request', {})
+            elif message.get('method') == 'Network.responseReceived' and params.get('type') in ('XHR', 'Fetch'):
+                candidates.append(params.get('requestId'))
+        
+        # 가장 최근 요청부터 확인
+        for request_id in reversed(candidates):
+            request = requests_by_id.get(request_id)
+            if not request:
+                continue
+            try:
+                body = self.driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': request_id}).get('body', '')
+            except Exception:
+                continue
             
-            # 검색어 입력
-            print(f"검색어 '{keyword}' 입력 중...")
-            search_input.clear()
-            search_input.send_keys(keyword)
-            time.sleep(1)
-            
-            # 검색 버튼 클릭
-            print("검색 버튼 찾는 중...")
-            search_button_selectors = [
-                ".search-button",
-                "button.search-button", 
-                "[class*='search-button']",
-                ".ant-btn[class*='search']",
-                "button[class*='search']",
-                ".search-btn",
-                ".btn-search",
-                "//button[contains(@class, 'search-button')]",
-                "//button[contains(text(), '검색')]"
-            ]
+            short_url = find_short_url(body)
+            if not short_url:
+                continue
             
-            search_button = None
-            for selector in search_button_selectors:
+            post_data = request.get('postData')
+            if request.get('hasPostData') and not post_data:
                 try:
-                    if selector.startswith("//"):
-                        search_button = self.driver.find_element(By.XPATH, selector)
-                    else:
-                        search_button = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    
-                    if search_button and search_button.is_displayed() and search_button.is_enabled():
-                        print(f"검색 버튼 찾음: {selector}")
-                        break
-                except:
-                    continue
+                    post_data = self.driver.execute_cdp_cmd(
+                        'Network.getRequestPostData', {'requestId': request_id}
+                    ).get('postData')
+                except Exception:
+                    post_data = None
+            
+            source = parse_product_url(self.last_link_generation_url or self.driver.current_url)
+            self.shorten_endpoint = {
+                'url': request.get('url'),
+                'method': request.get('method', 'POST'),
+                'headers': request.get('headers', {}),
+                'post_data': post_data,
+                'source_ids': {name: source[name] for name in PRODUCT_ID_PARAMS}
+            }
+            print(f"[O] 단축 URL API 캡처: {self.shorten_endpoint['method']} {self.shorten_endpoint['url'][:80]}")
             
-            if search_button:
-                search_button.click()
-                print("검색 버튼 클릭 완료")
+            try:
+                self.http_shortener = ShortLinkHttpClient(self.shorten_endpoint)
+                self.http_shortener.load_cookies(self.driver.get_cookies())
+            except Exception as e:
+                print(f"[X] HTTP 단축 클라이언트 준비 실패: {e}")
+                self.http_shortener = None
+            return self.shorten_endpoint
+        
+        return None
+
+    def shorten_via_http(self, product_url):
+        """
+        캡처한 단축 URL API로 직접 단축 (준비되지 않았거나 실패하면 None)
+        
+        Args:
+            product_url (str): 상품 URL
+        
+        Returns:
+            str: 단축 URL
+        """
+        if not self.http_shortener or not product_url:
+            return None
+        
+        with self.tracer.span("shorten_http"):
+            short_url = self.http_shortener.shorten(product_url)
+        if short_url:
+            print(f"[O] HTTP로 단축 URL 생성: {short_url}")
+        return short_url
+
+    def create_short_url_for_card(self, keyword, product, index, single_pass=True):
+        """
+        검색 결과의 index 번째 상품 카드로 단축 URL 생성
+        
+        Args:
+            keyword (str): 검색 키워드 (결과 페이지 복원용)
+            product (Product): 결과를 기록할 상품
+            index (int): 상품 카드 인덱스 (0부터)
+            single_pass (bool): 히스토리로 결과 페이지를 복원할지 여부
+        """
+        # 단축 URL API를 캡처했다면 브라우저 없이 HTTP로 생성
+        short_url = self.shorten_via_http(product.product_url)
+        if short_url:
+            product.resolve(short_url)
+            return
+        
+        # 상품 식별자를 알고 있으면 링크 생성 페이지로 바로 이동
+        direct_url = None
+        if self.direct_link_generation and product.product_url:
+            direct_url = product.link_generation_url or self.build_link_generation_url(product.product_url)
+        
+        if direct_url:
+            self.last_link_generation_url = None
+            if self.open_link_generation_directly(product.product_url, direct_url):
+                short_url = self.extract_short_url_from_page()
+                if short_url:
+                    self.capture_shorten_endpoint()
+                    product.link_generation_url = self.last_link_generation_url or ''
+                    product.resolve(short_url)
+                    print(f"[O] 단축 URL 생성 성공: {short_url}")
+                    return
+        
+        # 검색 페이지로 돌아가기 (직접 이동을 시도했다면 결과 페이지를 벗어난 상태)
+        navigated = bool(direct_url)
+        if index > 0 or navigated:
+            if single_pass:
+                if not self.return_to_search_results(keyword, index):
+                    product.fail("검색 결과 복원 실패")
+                    return
             else:
+                self.driver.get(self.target_url)
+                self.waiter.element_visible(SEARCH_INPUT_WAIT_CSS, "workspace_load")
+                
+                # 다시 검색
+                search_input = self.driver.find_element(By.CSS_SELECTOR, ".ant-input.ant-input-lg")
+                search_input.clear()
+                search_input.send_keys(keyword)
                 search_input.send_keys(Keys.ENTER)
-                print("Enter 키로 검색 시도")
+                self.wait_for_result_cards(index + 1)
+        
+        # 해당 상품에 마우스 호버하여 단축 URL 생성
+        self.last_link_generation_url = None
+        short_url = self.get_short_url_from_hover_by_index(index)
+        product.link_generation_url = self.last_link_generation_url or ''
+        
+        if short_url:
+            self.capture_shorten_endpoint()
+            product.resolve(short_url)
+            print(f"[O] 단축 URL 생성 성공: {short_url}")
+        else:
+            product.fail("호버 단축 URL 생성 실패")
+            print(f"[X] 단축 URL 생성 실패")
+
+    def search_products_and_get_short_urls(self, keyword, count=10, single_pass=True,
+                                           completed=None, on_product=None):
+        """
+        키워드로 상품 검색 후 첫 번째 상품에 마우스 호버하여 단축 URL 생성 및 상품 정보 저장
+        
+        Args:
+            keyword (str): 검색할 키워드
+            count (int): 처리할 상품 개수
+            single_pass (bool): 검색을 한 번만 실행하고 히스토리로 결과 페이지를 복원할지 여부
+                (False면 상품마다 워크스페이스로 돌아가 다시 검색)
+            completed (dict): 이미 단축 URL이 생성된 상품 {상품 식별 키: short_url} (해당 상품은 건너뜀,
+                키는 CheckpointStore.product_key 와 같이 추적 파라미터를 무시한 식별 키)
+            on_product (callable): 상품 하나의 처리가 끝날 때마다 호출할 함수 on_product(product)
+        
+        Returns:
+            list: 단축 URL 생성 결과가 기록된 Product 리스트
+        """
+        try:
+            print(f"'{keyword}' 키워드로 상품 검색 중...")
+            self.tracer.set_tags(keyword=keyword, rank=None)
             
-            # 검색 결과 로딩 대기
-            print("검색 결과 로딩 대기 중...")
-            time.sleep(5)
+            with self.tracer.span("search"):
+                if not self.submit_search(keyword):
+                    return None
+                
+                # 검색 결과 로딩 대기
+                print("검색 결과 로딩 대기 중...")
+                self.wait_for_result_cards(1)
             
             # 여러 상품 정보 추출
             products = self.extract_multiple_products_info(count)
@@ -347,31 +2604,32 @@ class CoupangPartnersWebAutomation:
                 
                 # 각 상품에 대해 단축 URL 생성
                 for i, product in enumerate(products, 1):
-                    print(f"\n[{i}/{len(products)}] {product['name'][:30]}... 단축 URL 생성 중...")
-                    
-                    # 검색 페이지로 돌아가기
-                    if i > 1:
-                        self.driver.get(self.target_url)
-                        time.sleep(2)
-                        
-                        # 다시 검색
-                        search_input = self.driver.find_element(By.CSS_SELECTOR, ".ant-input.ant-input-lg")
-                        search_input.clear()
-                        search_input.send_keys(keyword)
-                        search_input.send_keys(Keys.ENTER)
-                        time.sleep(3)
+                    print(f"\n[{i}/{len(products)}] {product.name[:30]}... 단축 URL 생성 중...")
+                    self.tracer.set_tags(rank=i)
+                    self.products_processed += 1
+                    product.keyword = keyword
                     
-                    # 해당 상품에 마우스 호버하여 단축 URL 생성
-                    short_url = self.get_short_url_from_hover_by_index(i-1)
+                    reused_url = None
+                    if completed and product.product_url:
+                        reused_url = completed.get(CheckpointStore.product_key(product.product_url))
+                    if not reused_url and self.short_url_cache:
+                        reused_url = self.short_url_cache.get(product.product_url)
                     
-                    if short_url:
-                        product['short_url'] = short_url
-                        product['deep_link'] = ''  # 딥링크는 필요시 추가
-                        print(f"[O] 단축 URL 생성 성공: {short_url}")
+                    if reused_url:
+                        product.resolve(reused_url)
+                        print(f"[O] 이전 실행의 단축 URL 재사용: {reused_url}")
                     else:
-                        product['short_url'] = '생성 실패'
-                        product['deep_link'] = ''
-                        print(f"[X] 단축 URL 생성 실패")
+                        with self.tracer.span("product"):
+                            # 이름 없는 카드를 건너뛰었을 수 있으므로 목록 위치가 아닌 카드 순번(rank - 1) 사용
+                            self.create_short_url_for_card(keyword, product, product.rank - 1, single_pass)
+                        if self.short_url_cache and product.ok:
+                            self.short_url_cache.put(product.product_url, product.short_url)
+                    
+                    self.record_result(product, keyword)
+                    if on_product:
+                        on_product(product)
+                
+                self.tracer.set_tags(rank=None)
                 
                 # products_data에 추가
                 self.products_data = products
@@ -385,217 +2643,112 @@ class CoupangPartnersWebAutomation:
             print(f"상품 검색 실패: {e}")
             return None
 
-    def extract_multiple_products_info(self, count=10):
-        """검색 결과에서 여러 상품 정보 추출"""
-        try:
-            print(f"{count}개 상품 정보 추출 중...")
-            
-            # 상품 목록 컨테이너 찾기
-            product_selectors = [
-                "[data-testid='product-item']",
-                ".product-item", 
-                ".search-product",
-                ".ant-card",
-                ".product-card",
-                ".search-result-item",
-                "[class*='product']",
-                "[class*='item']",
-                "[class*='card']",
-                ".ant-list-item",
-                ".list-item",
-                "[class*='result']",
-                ".ant-row .ant-col"
-            ]
-            
-            product_elements = []
-            for selector in product_selectors:
-                try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if elements and len(elements) >= 1:
-                        valid_elements = []
-                        for element in elements:
-                            if element.is_displayed():
-                                text = element.text.strip()
-                                links = element.find_elements(By.TAG_NAME, "a")
-                                images = element.find_elements(By.TAG_NAME, "img")
-                                
-                                if (text and len(text) > 10) or links or images:
-                                    valid_elements.append(element)
-                        
-                        if len(valid_elements) >= 1:
-                            product_elements = valid_elements
-                            print(f"상품 목록 컨테이너 찾음: {selector} ({len(valid_elements)}개)")
-                            break
-                except:
-                    continue
-            
-            if not product_elements:
-                print("상품 목록을 찾을 수 없습니다.")
-                return None
-            
-            # 여러 상품 정보 추출
-            products = []
-            for i in range(min(count, len(product_elements))):
-                product_info = self.extract_single_product_info(product_elements[i], i+1)
-                if product_info:
-                    products.append(product_info)
-            
-            return products
-            
-        except Exception as e:
-            print(f"상품 정보 추출 실패: {e}")
-            return None
-    
-    def get_short_url_from_hover_by_index(self, index):
-        """특정 인덱스의 상품에 마우스 호버하여 단축 URL 생성"""
-        try:
-            print(f"{index+1}번째 상품에 마우스 호버 중...")
-            
-            # 상품 목록 다시 찾기
-            product_selectors = [
-                "[data-testid='product-item']",
-                ".product-item", 
-                ".search-product",
-                ".ant-card",
-                ".product-card",
-                ".search-result-item",
-                "[class*='product']",
-                "[class*='item']",
-                "[class*='card']",
-                ".ant-list-item",
-                ".list-item",
-                "[class*='result']",
-                ".ant-row .ant-col"
-            ]
-            
-            product_elements = []
-            for selector in product_selectors:
-                try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if elements and len(elements) > index:
-                        valid_elements = []
-                        for element in elements:
-                            if element.is_displayed():
-                                text = element.text.strip()
-                                links = element.find_elements(By.TAG_NAME, "a")
-                                images = element.find_elements(By.TAG_NAME, "img")
-                                
-                                if (text and len(text) > 10) or links or images:
-                                    valid_elements.append(element)
-                        
-                        if len(valid_elements) > index:
-                            product_elements = valid_elements
-                            break
-                except:
-                    continue
-            
-            if not product_elements or len(product_elements) <= index:
-                print("상품을 찾을 수 없습니다.")
-                return None
-            
-            # 해당 인덱스의 상품에 마우스 호버
-            target_element = product_elements[index]
-            
-            actions = ActionChains(self.driver)
-            actions.move_to_element(target_element).perform()
-            time.sleep(2)  # 호버 후 버튼이 나타나길 기다림
-            
-            # 링크 생성 버튼 찾기
-            print("링크 생성 버튼 찾는 중...")
-            link_button_selectors = [
-                "button.ant-btn.hover-btn.btn-generate-link",
-                ".ant-btn.hover-btn.btn-generate-link",
-                "button[class*='btn-generate-link']",
-                "button[class*='hover-btn']",
-                "//button[contains(@class, 'hover-btn')]",
-                "//button[contains(text(), '링크생성')]",
-                "//button[contains(text(), '링크 생성')]"
-            ]
-            
-            link_button = None
-            for selector in link_button_selectors:
-                try:
-                    if selector.startswith("//"):
-                        elements = self.driver.find_elements(By.XPATH, selector)
-                    else:
-                        elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    
-                    for element in elements:
-                        if element.is_displayed() and element.is_enabled():
-                            link_button = element
-                            print(f"[O] 링크 생성 버튼 찾음")
-                            break
-                    
-                    if link_button:
-                        break
-                        
-                except Exception:
-                    continue
-            
-            if not link_button:
-                print("[X] 링크 생성 버튼을 찾을 수 없음")
-                return None
-            
-            # 링크 생성 버튼 클릭
-            print("링크 생성 버튼 클릭 중...")
-            try:
-                link_button.click()
-                print("[O] 링크 생성 버튼 클릭 성공")
-            except:
-                try:
-                    self.driver.execute_script("arguments[0].click();", link_button)
-                    print("[O] JavaScript로 클릭 성공")
-                except Exception as e:
-                    print(f"[X] 클릭 실패: {e}")
-                    return None
-            
-            time.sleep(3)
-            
-            # 링크 생성 페이지로 이동 확인
-            current_url = self.driver.current_url
-            print(f"현재 URL: {current_url[:100]}...")
-            
-            if 'linkgeneration' in current_url:
-                print("[O] 링크 생성 페이지로 이동 성공")
-                
-                # 단축 URL 찾기
-                short_url = self.extract_short_url_from_page()
-                return short_url
-            else:
-                print("[X] 링크 생성 페이지로 이동 실패")
-                return None
-                    
+    def extract_products_via_script(self, count=10):
+        """
+        검색 결과의 상품 카드 정보를 JavaScript 한 번으로 일괄 추출
+        
+        Args:
+            count (int): 추출할 상품 개수
+        
+        Returns:
+            list: 상품 정보 딕셔너리 리스트 (추출 실패 시 None)
+        """
+        try:
+            result = self.driver.execute_script(
+                BATCH_EXTRACT_PRODUCTS_JS,
+                self.selectors.ordered("product_card", PRODUCT_CARD_SELECTORS),
+                PRODUCT_NAME_SELECTORS,
+                PRODUCT_LINK_SELECTORS,
+                PRODUCT_PRICE_SELECTORS,
+                count
+            )
         except Exception as e:
-            print(f"단축 URL 생성 실패: {e}")
+            print(f"[X] 일괄 추출 스크립트 실행 실패: {e}")
             return None
-    
-    def get_short_url_from_hover(self):
-        """첫 번째 상품에 마우스 호버하여 단축 URL 생성"""  
+        
+        return self._products_from_batch_result(result)
+
+    def extract_products_via_lxml(self, count=10):
+        """
+        page_source 를 한 번 받아 lxml 로 상품 카드 정보 추출 (요소별 WebDriver 호출 없음)
+        
+        Args:
+            count (int): 추출할 상품 개수
+        
+        Returns:
+            list: 상품 정보 딕셔너리 리스트 (추출 실패 시 None)
+        """
+        if not self.lxml_extractor:
+            return None
+        
         try:
-            print(f"첫 번째 상품에 마우스 호버 중...")
-            
-            # 상품 목록 컨테이너 찾기
-            product_selectors = [
-                "[data-testid='product-item']",
-                ".product-item", 
-                ".search-product",
-                ".ant-card",
-                ".product-card",
-                ".search-result-item",
-                "[class*='product']",
-                "[class*='item']",
-                "[class*='card']",
-                ".ant-list-item",
-                ".list-item",
-                "[class*='result']",
-                ".ant-row .ant-col"
+            result = self.lxml_extractor.extract_products(
+                self.driver.page_source, count,
+                card_selectors=self.selectors.ordered("product_card", PRODUCT_CARD_SELECTORS),
+                base_url=self.driver.current_url
+            )
+        except Exception as e:
+            print(f"[X] lxml 추출 실패: {e}")
+            return None
+        
+        return self._products_from_batch_result(result)
+
+    def _products_from_batch_result(self, result):
+        """일괄 추출 결과({'selector', 'total', 'products'})를 Product 리스트로 변환"""
+        if not result or not result.get('products'):
+            print("[!] 일괄 추출 결과 없음")
+            return None
+        
+        self.selectors.record_hit("product_card", result.get('selector'))
+        print(f"상품 목록 컨테이너 찾음: {result.get('selector')} ({result.get('total')}개)")
+        
+        return products_from_items(result['products'])
+
+    def capture_snapshot(self, kind, expected=None):
+        """
+        스냅샷 기록 모드이면 현재 페이지 HTML 저장 (현재 keyword/rank 태그 포함)
+        
+        Args:
+            kind (str): 페이지 종류
+            expected: 이번 실행에서 얻은 결과 (상품 목록 또는 단축 URL)
+        """
+        if not self.snapshots:
+            return
+        if isinstance(expected, list):
+            expected = [
+                {'name': product.name, 'price': product.price_text,
+                 'product_url': product.product_url, 'image_url': product.image_url}
+                for product in expected
             ]
+        self.snapshots.capture(self.driver, kind, expected, **self.tracer.tags)
+
+    @traced("extract_products")
+    def extract_multiple_products_info(self, count=10, batch=True):
+        """
+        검색 결과에서 여러 상품 정보 추출
+        
+        Args:
+            count (int): 추출할 상품 개수
+            batch (bool): JavaScript 일괄 추출을 먼저 시도할지 여부
+                (실패하면 요소별 WebDriver 호출 방식으로 추출)
+        """
+        try:
+            print(f"{count}개 상품 정보 추출 중...")
+            
+            if batch:
+                products = self.extract_products_via_lxml(count) or self.extract_products_via_script(count)
+                if products:
+                    print(f"[O] 일괄 추출로 {len(products)}개 상품 정보 추출")
+                    self.capture_snapshot("search_results", products)
+                    return products
+                print("요소별 추출 방식으로 다시 시도합니다.")
             
+            # 상품 목록 컨테이너 찾기
             product_elements = []
-            for selector in product_selectors:
+            for selector in self.selectors.ordered("product_card", PRODUCT_CARD_SELECTORS):
                 try:
                     elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if elements and len(elements) >= 3:
+                    if elements and len(elements) >= 1:
                         valid_elements = []
                         for element in elements:
                             if element.is_displayed():
@@ -606,24 +2759,85 @@ class CoupangPartnersWebAutomation:
                                 if (text and len(text) > 10) or links or images:
                                     valid_elements.append(element)
                         
-                        if len(valid_elements) >= 3:
+                        if len(valid_elements) >= 1:
                             product_elements = valid_elements
                             print(f"상품 목록 컨테이너 찾음: {selector} ({len(valid_elements)}개)")
+                            self.selectors.record_hit("product_card", selector)
                             break
                 except:
                     continue
             
             if not product_elements:
+                self.selectors.record_miss("product_card")
                 print("상품 목록을 찾을 수 없습니다.")
                 return None
             
-            # 첫 번째 상품에 마우스 호버
-            first_element = product_elements[0]
-            print(f"첫 번째 상품에 마우스 호버...")
+            # 여러 상품 정보 추출
+            products = []
+            for i in range(min(count, len(product_elements))):
+                product_info = self.extract_single_product_info(product_elements[i], i+1)
+                if product_info:
+                    products.append(product_info)
+            
+            self.capture_snapshot("search_results", products)
+            return products
+            
+        except Exception as e:
+            print(f"상품 정보 추출 실패: {e}")
+            return None
+    
+    def find_product_card(self, index):
+        """
+        검색 결과의 index 번째 상품 카드 요소 (카드 색인 사용)
+        
+        일괄 추출이나 이전 조회에서 붙인 data-cpa-card 순번으로 바로 찾고,
+        카드가 다시 렌더링되어 순번이 사라진 경우에만 색인을 다시 만든다.
+        
+        Args:
+            index (int): 상품 카드 인덱스 (0부터)
+        
+        Returns:
+            WebElement: 상품 카드 (없으면 None)
+        """
+        try:
+            result = self.driver.execute_script(
+                CARD_INDEX_JS, self.selectors.ordered("product_card", PRODUCT_CARD_SELECTORS), index
+            )
+        except Exception as e:
+            print(f"[X] 상품 카드 색인 조회 실패: {e}")
+            return None
+        
+        if not result or not result.get('element'):
+            self.selectors.record_miss("product_card")
+            return None
+        
+        if result.get('rebuilt'):
+            self.selectors.record_hit("product_card", result['selector'])
+            print(f"상품 카드 색인 생성: {result['selector']} ({result['total']}개)")
+        return result['element']
+
+    @traced("hover")
+    def get_short_url_from_hover_by_index(self, index):
+        """특정 인덱스의 상품에 마우스 호버하여 단축 URL 생성"""
+        try:
+            print(f"{index+1}번째 상품에 마우스 호버 중...")
+            
+            # 카드 색인에서 상품 찾기
+            target_element = self.find_product_card(index)
+            if target_element is None:
+                print("상품을 찾을 수 없습니다.")
+                return None
             
-            actions = ActionChains(self.driver)
-            actions.move_to_element(first_element).perform()
-            time.sleep(2)  # 호버 후 버튼이 나타나길 기다림
+            # 해당 인덱스의 상품에 마우스 호버 (그 사이 다시 렌더링되었으면 색인을 새로 만들어 한 번 더 시도)
+            try:
+                ActionChains(self.driver).move_to_element(target_element).perform()
+            except StaleElementReferenceException:
+                target_element = self.find_product_card(index)
+                if target_element is None:
+                    print("상품을 찾을 수 없습니다.")
+                    return None
+                ActionChains(self.driver).move_to_element(target_element).perform()
+            self.waiter.element_visible(HOVER_BUTTON_WAIT_CSS, "hover_button", timeout=3)  # 호버 후 버튼이 나타나길 기다림
             
             # 링크 생성 버튼 찾기
             print("링크 생성 버튼 찾는 중...")
@@ -637,29 +2851,11 @@ class CoupangPartnersWebAutomation:
                 "//button[contains(text(), '링크 생성')]"
             ]
             
-            link_button = None
-            for selector in link_button_selectors:
-                try:
-                    if selector.startswith("//"):
-                        elements = self.driver.find_elements(By.XPATH, selector)
-                    else:
-                        elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    
-                    for element in elements:
-                        if element.is_displayed() and element.is_enabled():
-                            link_button = element
-                            print(f"[O] 링크 생성 버튼 찾음")
-                            break
-                    
-                    if link_button:
-                        break
-                        
-                except Exception:
-                    continue
-            
+            link_button = self.find_first_element("generate_link_button", link_button_selectors)
             if not link_button:
                 print("[X] 링크 생성 버튼을 찾을 수 없음")
                 return None
+            print(f"[O] 링크 생성 버튼 찾음")
             
             # 링크 생성 버튼 클릭
             print("링크 생성 버튼 클릭 중...")
@@ -674,7 +2870,7 @@ class CoupangPartnersWebAutomation:
                     print(f"[X] 클릭 실패: {e}")
                     return None
             
-            time.sleep(3)
+            self.waiter.url_contains('linkgeneration', "link_generation_page", timeout=5)
             
             # 링크 생성 페이지로 이동 확인
             current_url = self.driver.current_url
@@ -682,6 +2878,8 @@ class CoupangPartnersWebAutomation:
             
             if 'linkgeneration' in current_url:
                 print("[O] 링크 생성 페이지로 이동 성공")
+                self.last_link_generation_url = current_url
+                self.learn_link_generation_template(current_url)
                 
                 # 단축 URL 찾기
                 short_url = self.extract_short_url_from_page()
@@ -694,28 +2892,67 @@ class CoupangPartnersWebAutomation:
             print(f"단축 URL 생성 실패: {e}")
             return None
     
+    def get_short_url_from_hover(self):
+        """첫 번째 상품에 마우스 호버하여 단축 URL 생성 (카드 색인 사용)"""
+        return self.get_short_url_from_hover_by_index(0)
+    
+    def read_short_url_from_dom(self):
+        """
+        링크 생성 페이지의 단축 URL 표시 영역을 JavaScript 한 번으로 읽기
+        
+        Returns:
+            str: 단축 URL (없으면 None)
+        """
+        try:
+            result = self.driver.execute_script(
+                READ_SHORT_URL_JS,
+                self.selectors.ordered("shorten_url_input", SHORTEN_URL_INPUT_SELECTORS)
+            )
+        except Exception:
+            return None
+        
+        if not result:
+            return None
+        self.selectors.record_hit("shorten_url_input", result['selector'])
+        return result['url']
+
+    def observe_short_url(self, timeout=5):
+        """
+        단축 URL 버튼 클릭 후 표시 영역에 URL이 채워질 때까지 대기 (MutationObserver)
+        
+        시스템 클립보드를 쓰지 않으므로 여러 브라우저/스레드가 동시에 실행해도 서로 간섭하지 않는다.
+        
+        Args:
+            timeout (float): 최대 대기 시간(초)
+        
+        Returns:
+            str: 단축 URL (시간 초과 시 None)
+        """
+        def observed(driver):
+            result = driver.execute_async_script(
+                OBSERVE_SHORT_URL_JS,
+                self.selectors.ordered("shorten_url_input", SHORTEN_URL_INPUT_SELECTORS),
+                int(timeout * 1000)
+            )
+            if result:
+                self.selectors.record_hit("shorten_url_input", result['selector'])
+                return result['url']
+            return None
+        
+        return self.waiter.until(observed, "shorten_url", timeout=timeout)
+
+    @traced("shorten")
     def extract_short_url_from_page(self):
         """링크 생성 페이지에서 단축 URL 추출"""
         try:
             print("단축 URL 찾는 중...")
             
-            url_input_selectors = [
-                ".shorten-url-wrapper > div.unselectable-input.shorten-url-input.large",
-                ".shorten-url-wrapper .unselectable-input.shorten-url-input",
-            ]
-            
-            # input 필드에서 URL 찾기
-            for selector in url_input_selectors:
-                try:
-                    inputs = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    for input_elem in inputs:
-                        if input_elem.is_displayed():
-                            url_value = input_elem.get_attribute('value')
-                            if url_value and 'link.coupang.com' in url_value:
-                                print(f"[O] 단축 URL 찾음: {url_value}")
-                                return url_value
-                except:
-                    continue
+            # 이미 표시된 단축 URL 확인
+            url_value = self.read_short_url_from_dom()
+            if url_value:
+                print(f"[O] 단축 URL 찾음: {url_value}")
+                self.capture_snapshot("link_generation", url_value)
+                return url_value
             
             # 단축 URL이 없다면 생성 버튼 찾기
             print("단축 URL 생성 버튼 찾는 중...")
@@ -731,42 +2968,27 @@ class CoupangPartnersWebAutomation:
                 ".ant-btn[class*='primary']"
             ]
             
-            for selector in short_url_selectors:
-                try:
-                    if selector.startswith("//"):
-                        elements = self.driver.find_elements(By.XPATH, selector)
-                    else:
-                        elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    
-                    for element in elements:
-                        if element.is_displayed() and element.is_enabled():
-                            text = element.text.strip()
-                            # 클래스명에 shorten-url-controls가 포함되어 있거나 텍스트에 단축이 포함된 경우
-                            class_name = element.get_attribute('class') or ""
-                            if ('shorten-url-controls' in class_name) or ('단축' in text) or ('짧은' in text) or ('복사' in text):
-                                print(f"[O] 단축 URL 생성/복사 버튼 찾음: '{text}' (class: {class_name})")
-                                element.click()
-                                print(f"[O] 버튼 클릭 완료")
-                                time.sleep(2)
-                                
-                                # 클립보드 대신 바로 페이지에서 URL 추출 시도
-                                time.sleep(1)
-                                
-                                # 다시 URL 찾기
-                                for selector2 in url_input_selectors:
-                                    try:
-                                        inputs = self.driver.find_elements(By.CSS_SELECTOR, selector2)
-                                        for input_elem in inputs:
-                                            if input_elem.is_displayed():
-                                                url_value = input_elem.get_attribute('value')
-                                                if url_value and 'link.coupang.com' in url_value:
-                                                    print(f"[O] 단축 URL 생성 완료: {url_value}")
-                                                    return url_value
-                                    except:
-                                        continue
-                                break
-                except:
-                    continue
+            shorten_button = self.find_first_element(
+                "shorten_url_button", short_url_selectors, any_of=SHORTEN_BUTTON_MATCH
+            )
+            if shorten_button:
+                print(f"[O] 단축 URL 생성/복사 버튼 찾음")
+                shorten_button.click()
+                print(f"[O] 버튼 클릭 완료")
+                
+                # 클립보드 대신 페이지에 표시되는 URL 대기
+                url_value = self.observe_short_url(timeout=5)
+                if url_value:
+                    print(f"[O] 단축 URL 생성 완료: {url_value}")
+                    self.capture_snapshot("link_generation", url_value)
+                    return url_value
+            
+            # 여전히 못 찾았다면 페이지 소스에서 정규식으로 찾기
+            url_value = find_short_url(self.driver.page_source)
+            if url_value:
+                print(f"[O] 페이지 소스에서 단축 URL 찾음: {url_value}")
+                self.capture_snapshot("link_generation", url_value)
+                return url_value
             
             print("[X] 단축 URL을 찾을 수 없음")
             return None
@@ -811,19 +3033,7 @@ class CoupangPartnersWebAutomation:
             
             # 여전히 못 찾았다면 기존 방식 시도
             if not name:
-                name_selectors = [
-                    ".product-name", 
-                    "[data-testid='product-name']", 
-                    "h3", "h4", ".title",
-                    ".ant-card-meta-title",
-                    "[class*='title']",
-                    "[class*='name']",
-                    "a[href*='product']",
-                    "span",
-                    "div"
-                ]
-                
-                for selector in name_selectors:
+                for selector in PRODUCT_NAME_SELECTORS:
                     try:
                         name_elements = element.find_elements(By.CSS_SELECTOR, selector)
                         for name_element in name_elements[:3]:  # 처음 3개만 확인
@@ -850,15 +3060,9 @@ class CoupangPartnersWebAutomation:
             
             # 상품 URL 추출
             print(f"      상품 URL 추출 시도 중...")
-            link_selectors = [
-                "a[href*='product']",
-                "a[href*='item']", 
-                "a"
-            ]
-            
             product_url = ""
             found_url_selector = ""
-            for selector in link_selectors:
+            for selector in PRODUCT_LINK_SELECTORS:
                 try:
                     link_elements = element.find_elements(By.CSS_SELECTOR, selector)
                     print(f"      셀렉터 '{selector}'로 {len(link_elements)}개 링크 발견")
@@ -886,17 +3090,9 @@ class CoupangPartnersWebAutomation:
             
             # 가격 추출
             print(f"      가격 정보 추출 시도 중...")
-            price_selectors = [
-                ".price", 
-                "[data-testid='price']", 
-                ".product-price",
-                "[class*='price']",
-                ".cost", ".amount"
-            ]
-            
-            price = "가격정보없음"
+            price = ""
             found_price_selector = ""
-            for selector in price_selectors:
+            for selector in PRODUCT_PRICE_SELECTORS:
                 try:
                     price_elements = element.find_elements(By.CSS_SELECTOR, selector)
                     print(f"      가격 셀렉터 '{selector}'로 {len(price_elements)}개 요소 발견")
@@ -914,7 +3110,7 @@ class CoupangPartnersWebAutomation:
                             print(f"      [O] 가격 찾음: '{price}' (셀렉터: {selector})")
                             break
                     
-                    if price != "가격정보없음":
+                    if price:
                         break
                 except Exception as e:
                     # 에러 메시지 간소화
@@ -922,7 +3118,7 @@ class CoupangPartnersWebAutomation:
                     print(f"      가격 셀렉터 '{selector}' 실패: {error_msg}")
                     continue
             
-            if price == "가격정보없음":
+            if not price:
                 print(f"      [!] 가격 정보를 찾을 수 없음")
                 # 요소 내의 모든 숫자가 포함된 텍스트 찾아보기
                 try:
@@ -962,15 +3158,13 @@ class CoupangPartnersWebAutomation:
                 print(f"      이미지 추출 오류: {e}")
             
             # 결과 정리
-            result = {
+            result = Product.from_item({
                 'rank': rank,
                 'name': name,
                 'price': price,
                 'product_url': product_url,
-                'image_url': image_url,
-                'short_url': '',  # 나중에 생성
-                'deep_link': ''   # 나중에 생성
-            }
+                'image_url': image_url
+            })
             
             print(f"      === {rank}번째 상품 정보 추출 완료 ===")
             print(f"      결과: 상품명='{name[:30]}...', 가격='{price}', URL={bool(product_url)}, 이미지={bool(image_url)}")
@@ -984,8 +3178,40 @@ class CoupangPartnersWebAutomation:
             print(f"      오류 상세: {traceback.format_exc()}")
             return None
 
-    def generate_short_urls_for_all(self):
-        """상위 10개 상품에 대해 단축 URL 생성"""
+    @staticmethod
+    def extract_product_info_from_url(url):
+        """
+        URL 만으로 상품 식별자(productId/itemId/vendorItemId)와 추적 파라미터 추출
+        
+        Args:
+            url (str): 링크 생성 페이지 또는 상품 URL
+        
+        Returns:
+            dict: parse_product_url 결과
+        """
+        return parse_product_url(url)
+
+    @staticmethod
+    def extract_product_info_from_urls(urls, dedup=False):
+        """
+        여러 URL 의 상품 식별자를 한 번에 추출
+        
+        Args:
+            urls (iterable): URL 목록
+            dedup (bool): 같은 상품은 첫 번째만 남길지 여부
+        
+        Returns:
+            list: parse_product_url 결과 리스트
+        """
+        return parse_product_urls(urls, dedup=dedup)
+
+    def generate_short_urls_for_all(self, tab_pool_size=None):
+        """
+        상위 10개 상품에 대해 단축 URL 생성 (재사용 탭 풀 사용)
+        
+        Args:
+            tab_pool_size (int): 동시에 로드할 재사용 탭 수 (None 이면 self.tab_pool_size)
+        """
         try:
             if not self.products_data:
                 print("단축 URL을 생성할 상품이 없습니다.")
@@ -995,51 +3221,140 @@ class CoupangPartnersWebAutomation:
             products_to_process = min(10, len(self.products_data))
             print(f"\n=== 상위 {products_to_process}개 상품의 단축 URL 생성 시작 ===")
             
+            pending = []
             for idx, product in enumerate(self.products_data[:products_to_process], 1):
-                print(f"\n[{idx}/{products_to_process}] {product['name'][:50]}...")
+                print(f"\n[{idx}/{products_to_process}] {product.name[:50]}...")
+                self.products_processed += 1
                 
-                if not product.get('product_url'):
-                    product['short_url'] = 'URL 없음'
-                    product['deep_link'] = 'URL 없음'
+                if not product.product_url:
+                    product.fail("상품 URL 없음", ProductStatus.NO_URL)
                     print("  상품 URL이 없습니다.")
+                    self.record_result(product)
                     continue
                 
-                try:
-                    # generate_single_short_url_with_info 메서드 사용
-                    product_info, short_url, deep_link = self.generate_single_short_url_with_info(product['product_url'])
-                    product['short_url'] = short_url
-                    product['deep_link'] = deep_link
-                    
-                    if short_url and short_url not in ["단축 URL 생성 실패", "처리 오류", "링크 생성 버튼 없음", "클릭 실패"]:
-                        print(f"  ✓ 단축 URL 생성 성공")
-                    else:
-                        print(f"  ✗ 단축 URL 생성 실패: {short_url}")
-                        
-                except Exception as e:
-                    print(f"  ✗ 오류 발생: {e}")
-                    product['short_url'] = '생성 오류'
-                    product['deep_link'] = '생성 오류'
+                cached_url = self.short_url_cache.get(product.product_url) if self.short_url_cache else None
+                if cached_url:
+                    product.resolve(cached_url)
+                    print(f"  ✓ 캐시된 단축 URL 사용")
+                    self.record_result(product)
+                    continue
                 
-                # 잠시 대기 (서버 부하 방지)
-                if idx < products_to_process:
-                    time.sleep(2)
+                pending.append(product)
+            
+            if pending:
+                self.generate_short_urls_with_tab_pool(pending, tab_pool_size or self.tab_pool_size)
             
             print(f"\n=== {products_to_process}개 상품 단축 URL 생성 완료 ===")
             
         except Exception as e:
             print(f"단축 URL 생성 실패: {e}")
 
-    def generate_single_short_url_with_info(self, product_url):
-        """상품 정보 추출과 단축 URL 생성을 동시에 수행"""
+    def generate_short_urls_with_tab_pool(self, products, size=3):
+        """
+        재사용 탭 풀로 여러 상품의 단축 URL 생성
+        
+        각 탭에 다음 상품(알 수 있으면 링크 생성 페이지, 아니면 상품 페이지)을 미리 로드해 두고,
+        먼저 준비된 탭부터 처리한 뒤 같은 탭에 다음 상품을 로드한다.
+        동시에 로드되는 페이지 수가 size 개로 제한되므로 별도의 고정 대기는 두지 않는다.
+        캡처한 단축 URL API로 바로 단축되는 상품은 탭을 쓰지 않는다.
+        
+        Args:
+            products (list): product_url 이 있는 Product 리스트
+            size (int): 탭 개수
+        """
+        queue_products = []
+        for product in products:
+            short_url = self.shorten_via_http(product.product_url)
+            if not short_url:
+                queue_products.append(product)
+                continue
+            product.resolve(short_url)
+            if self.short_url_cache:
+                self.short_url_cache.put(product.product_url, short_url)
+            self.record_result(product)
+        if not queue_products:
+            return
+        
+        in_flight = {}
+        tabs = TabPool(self.driver, min(size, len(queue_products)))
+        
+        def dispatch(handle):
+            product = queue_products.pop(0)
+            url = self.build_link_generation_url(product.product_url) if self.direct_link_generation else None
+            tabs.load(handle, url or product.product_url)
+            in_flight[handle] = (product, time.perf_counter())
+        
         try:
-            print(f"\n상품 페이지로 이동: {product_url[:50]}...")
+            tabs.open()
+            for handle in tabs.handles:
+                tabs.switch(handle)
+                self.apply_resource_blocking()
+                if queue_products:
+                    dispatch(handle)
             
-            # 새 탭에서 상품 페이지 열기
-            self.driver.execute_script("window.open('');")
-            self.driver.switch_to.window(self.driver.window_handles[-1])
+            while in_flight:
+                handle = tabs.wait_for_ready(list(in_flight), self.waiter, timeout=self.wait_timeout)
+                if not handle:
+                    # 준비된 탭이 없으면 가장 오래 기다린 탭을 그대로 처리
+                    handle = min(in_flight, key=lambda h: in_flight[h][1])
+                
+                product, started = in_flight.pop(handle)
+                tabs.switch(handle)
+                print(f"\n[탭] {product.name[:50]}... (대기 {time.perf_counter() - started:.1f}s)")
+                
+                short_url = self.shorten_via_http(product.product_url)
+                if short_url:
+                    product.resolve(short_url)
+                else:
+                    try:
+                        with self.tracer.span("product", rank=product.rank):
+                            _, short_url, error = self.generate_short_url_in_current_tab(
+                                product.product_url, preloaded=True
+                            )
+                        product.resolve(short_url, error)
+                    except Exception as e:
+                        print(f"  ✗ 오류 발생: {e}")
+                        product.fail(str(e), ProductStatus.ERROR)
+                
+                if self.short_url_cache and product.ok:
+                    self.short_url_cache.put(product.product_url, product.short_url)
+                self.record_result(product)
+                
+                if product.ok:
+                    print(f"  ✓ 단축 URL 생성 성공")
+                else:
+                    print(f"  ✗ 단축 URL 생성 실패: {product.error}")
+                
+                if queue_products:
+                    dispatch(handle)
+        finally:
+            tabs.close()
+
+    def generate_short_url_in_current_tab(self, product_url, preloaded=False):
+        """
+        현재 탭에서 상품의 단축 URL 생성 (탭을 열거나 닫지 않음)
+        
+        Args:
+            product_url (str): 상품 URL
+            preloaded (bool): 현재 탭에 상품 페이지나 링크 생성 페이지가 이미 로드되어 있는지 여부
+        
+        Returns:
+            tuple: (상품 식별 정보, 단축 URL (실패 시 None), 실패 사유 (성공 시 ''))
+        """
+        # 이전 상품의 링크 생성 페이지 URL 이 단축 API 캡처의 원래 식별자로 쓰이지 않도록 초기화
+        self.last_link_generation_url = None
+        
+        # 링크 생성 페이지로 바로 이동, 실패하면 상품 페이지에서 링크 생성 버튼 클릭
+        if preloaded:
+            on_link_generation = 'linkgeneration' in self.driver.current_url
+        else:
+            on_link_generation = self.open_link_generation_directly(product_url)
             
-            self.driver.get(product_url)
-            time.sleep(3)
+        if not on_link_generation:
+            if not preloaded or not self.driver.find_elements(By.CSS_SELECTOR, HOVER_BUTTON_WAIT_CSS):
+                self.driver.get(product_url)
+            self.waiter.element_present(HOVER_BUTTON_WAIT_CSS, "product_page_load")
+            self.profile_monitor.record("product_page")
             
             # 링크 생성 버튼 클릭
             print(f"링크 생성 버튼 찾는 중...")
@@ -1052,41 +3367,20 @@ class CoupangPartnersWebAutomation:
                 "//button[contains(text(), '링크 생성')]"
             ]
             
-            link_button = None
-            for selector in link_generation_selectors:
-                try:
-                    if selector.startswith("//"):
-                        elements = self.driver.find_elements(By.XPATH, selector)
-                    else:
-                        elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    
-                    for element in elements:
-                        if element.is_displayed() and element.is_enabled():
-                            text = element.text.strip()
-                            class_name = element.get_attribute('class') or ""
-                            
-                            if ('링크' in text and '생성' in text) or 'btn-generate-link' in class_name:
-                                link_button = element
-                                print(f"[O] 링크 생성 버튼 찾음: '{text}'")
-                                break
-                    
-                    if link_button:
-                        break
-                        
-                except Exception:
-                    continue
-            
+            link_button = self.find_first_element(
+                "generate_link_button", link_generation_selectors,
+                any_of=[{'text': ['링크', '생성']}, {'class': ['btn-generate-link']}]
+            )
             if not link_button:
                 print(f"[X] 링크 생성 버튼을 찾을 수 없음")
-                self.driver.close()
-                self.driver.switch_to.window(self.driver.window_handles[0])
-                return None, "링크 생성 버튼 없음", "딥링크 생성 실패"
+                return None, None, "링크 생성 버튼 없음"
+            print(f"[O] 링크 생성 버튼 찾음")
             
             # 링크 생성 버튼 클릭
             print(f"링크 생성 버튼 클릭 중...")
             try:
                 self.driver.execute_script("arguments[0].scrollIntoView(true);", link_button)
-                time.sleep(1)
+                self.waiter.until(lambda driver: link_button.is_displayed(), "link_button_scroll", timeout=1)
                 link_button.click()
                 print(f"[O] 링크 생성 버튼 클릭 성공")
             except Exception:
@@ -1095,243 +3389,174 @@ class CoupangPartnersWebAutomation:
                     print(f"[O] JavaScript 클릭 성공")
                 except Exception as e:
                     print(f"[X] 클릭 실패: {e}")
-                    self.driver.close()
-                    self.driver.switch_to.window(self.driver.window_handles[0])
-                    return None, "클릭 실패", "딥링크 생성 실패"
+                    return None, None, "클릭 실패"
             
-            time.sleep(3)
+            self.waiter.url_contains('linkgeneration', "link_generation_page", timeout=5)
             
-            # 링크 생성 페이지로 이동 확인 및 상품 정보 추출
-            current_url = self.driver.current_url
-            print(f"현재 URL: {current_url[:100]}...")
+        # 링크 생성 페이지로 이동 확인 및 상품 정보 추출
+        current_url = self.driver.current_url
+        print(f"현재 URL: {current_url[:100]}...")
             
-            product_info = None
-            short_url = "단축 URL 생성 실패"
-            deep_link = "딥링크 생성 실패"
+        product_info = None
+        short_url = None
             
-            if 'linkgeneration' in current_url:
-                print(f"[O] 링크 생성 페이지로 이동 성공")
+        if 'linkgeneration' in current_url:
+            print(f"[O] 링크 생성 페이지로 이동 성공")
+            self.last_link_generation_url = current_url
+            self.learn_link_generation_template(current_url)
+            self.profile_monitor.record("link_generation")
                 
-                # URL에서 상품 정보 추출
-                product_info = self.extract_product_info_from_url(current_url)
+            # URL에서 상품 정보 추출
+            product_info = self.extract_product_info_from_url(current_url)
+            print(f"상품 식별자: productId={product_info['productId']}, itemId={product_info['itemId']}, "
+                  f"vendorItemId={product_info['vendorItemId']}")
                 
-                # 단축 URL 찾기 (이미 생성되어 있을 수 있음)
-                print(f"단축 URL 찾는 중...")
-                url_input_selectors = [
-                    ".shorten-url-wrapper > div.unselectable-input.shorten-url-input.large",
-                    ".shorten-url-wrapper .unselectable-input.shorten-url-input",
-                ]
-                
-                # input 필드에서 URL 찾기
-                for selector in url_input_selectors:
-                    try:
-                        inputs = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                        for input_elem in inputs:
-                            if input_elem.is_displayed():
-                                # div 요소의 경우 textContent 사용
-                                url_value = input_elem.text.strip()
-                                if not url_value:
-                                    url_value = input_elem.get_attribute('textContent')
-                                if not url_value:
-                                    url_value = input_elem.get_attribute('value')
-                                    
-                                if url_value and 'link.coupang.com' in url_value:
-                                    short_url = url_value
-                                    print(f"[O] 단축 URL 찾음: {url_value[:50]}...")
-                                    break
-                    except:
-                        continue
+            # 단축 URL 찾기 (이미 생성되어 있을 수 있음)
+            print(f"단축 URL 찾는 중...")
+            url_value = self.read_short_url_from_dom()
+            if url_value:
+                short_url = url_value
+                print(f"[O] 단축 URL 찾음: {url_value[:50]}...")
                 
-                # 단축 URL이 없다면 생성 버튼 찾기
-                if short_url == "단축 URL 생성 실패":
-                    print(f"단축 URL 생성 버튼 찾는 중...")
-                    short_url_selectors = [
-                        "button.ant-btn.lg.shorten-url-controls-main",
-                        ".ant-btn.lg.shorten-url-controls-main",
-                        "button[class*='shorten-url-controls']",
-                        "//button[contains(@class, 'shorten-url-controls-main')]",
-                        "//button[contains(text(), '단축')]",
-                        "//button[contains(text(), '짧은')]",
-                        "//span[contains(text(), '단축')]/parent::button",
-                        "button[class*='short']",
-                        ".ant-btn[class*='primary']"
-                    ]
+            # 단축 URL이 없다면 생성 버튼 찾기
+            if not short_url:
+                print(f"단축 URL 생성 버튼 찾는 중...")
+                short_url_selectors = [
+                    "button.ant-btn.lg.shorten-url-controls-main",
+                    ".ant-btn.lg.shorten-url-controls-main",
+                    "button[class*='shorten-url-controls']",
+                    "//button[contains(@class, 'shorten-url-controls-main')]",
+                    "//button[contains(text(), '단축')]",
+                    "//button[contains(text(), '짧은')]",
+                    "//span[contains(text(), '단축')]/parent::button",
+                    "button[class*='short']",
+                    ".ant-btn[class*='primary']"
+                ]
                     
-                    for selector in short_url_selectors:
-                        try:
-                            if selector.startswith("//"):
-                                elements = self.driver.find_elements(By.XPATH, selector)
-                            else:
-                                elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                            
-                            for element in elements:
-                                if element.is_displayed() and element.is_enabled():
-                                    text = element.text.strip()
-                                    # 클래스명에 shorten-url-controls가 포함되어 있거나 텍스트에 단축이 포함된 경우
-                                    class_name = element.get_attribute('class') or ""
-                                    if ('shorten-url-controls' in class_name) or ('단축' in text) or ('짧은' in text) or ('복사' in text):
-                                        print(f"[O] 단축 URL 생성/복사 버튼 찾음: '{text}' (class: {class_name})")
-                                        
-                                        # 클립보드 초기화 (이전 내용 제거)
-                                        try:
-                                            import pyperclip
-                                            pyperclip.copy("")  # 클립보드 비우기
-                                        except:
-                                            pass
-                                        
-                                        element.click()
-                                        print(f"[O] 버튼 클릭 완료")
-                                        time.sleep(3)
-                                        
-                                        # 클립보드에서 URL 가져오기
-                                        try:
-                                            import pyperclip
-                                            clipboard_content = pyperclip.paste()
-                                            if clipboard_content and 'link.coupang.com' in clipboard_content:
-                                                short_url = clipboard_content
-                                                print(f"[O] 클립보드에서 단축 URL 복사됨: {short_url[:50]}...")
-                                        except:
-                                            pass
-                                        
-                                        # 다시 URL 찾기
-                                        for selector2 in url_input_selectors:
-                                            try:
-                                                inputs = self.driver.find_elements(By.CSS_SELECTOR, selector2)
-                                                for input_elem in inputs:
-                                                    if input_elem.is_displayed():
-                                                        url_value = input_elem.get_attribute('value')
-                                                        if url_value and 'link.coupang.com' in url_value:
-                                                            short_url = url_value
-                                                            print(f"[O] 단축 URL 생성 완료")
-                                                            break
-                                                if short_url != "단축 URL 생성 실패":
-                                                    break
-                                            except:
-                                                continue
-                                        break
-                            if short_url != "단축 URL 생성 실패":
-                                break
-                        except:
-                            continue
+                shorten_button = self.find_first_element(
+                    "shorten_url_button", short_url_selectors, any_of=SHORTEN_BUTTON_MATCH
+                )
+                if shorten_button:
+                    print(f"[O] 단축 URL 생성/복사 버튼 찾음")
+                    shorten_button.click()
+                    print(f"[O] 버튼 클릭 완료")
+                    
+                    # 클립보드 대신 페이지에 표시되는 URL 대기
+                    url_value = self.observe_short_url(timeout=5)
+                    if url_value:
+                        short_url = url_value
+                        print(f"[O] 단축 URL 생성 완료")
                 
-                # 여전히 못 찾았다면 페이지 소스에서 정규식으로 찾기
-                if short_url == "단축 URL 생성 실패":
-                    try:
-                        page_text = self.driver.page_source
-                        import re
-                        short_urls = re.findall(r'https://link\.coupang\.com/[^\s"<>]+', page_text)
-                        if short_urls:
-                            short_url = short_urls[0]
-                            print(f"[O] 페이지 소스에서 단축 URL 찾음")
-                    except:
-                        pass
+            # 여전히 못 찾았다면 페이지 소스에서 정규식으로 찾기
+            if not short_url:
+                try:
+                    short_url = find_short_url(self.driver.page_source)
+                    if short_url:
+                        print(f"[O] 페이지 소스에서 단축 URL 찾음")
+                except:
+                    pass
                 
+            if short_url:
+                self.capture_snapshot("link_generation", short_url)
+                self.capture_shorten_endpoint()
             else:
-                print(f"[X] 링크 생성 페이지로 이동 실패")
+                return product_info, None, "단축 URL 생성 실패"
+                
+        else:
+            print(f"[X] 링크 생성 페이지로 이동 실패")
+            return product_info, None, "링크 생성 페이지 이동 실패"
+        
+        return product_info, short_url, ""
+
+    def generate_single_short_url_with_info(self, product_url):
+        """상품 정보 추출과 단축 URL 생성을 동시에 수행"""
+        short_url = self.shorten_via_http(product_url)
+        if short_url:
+            return self.extract_product_info_from_url(product_url), short_url, ""
+        
+        try:
+            print(f"\n상품 페이지로 이동: {product_url[:50]}...")
+            
+            # 새 탭에서 상품 페이지 열기
+            self.driver.execute_script("window.open('');")
+            self.driver.switch_to.window(self.driver.window_handles[-1])
+            self.apply_resource_blocking()
+            
+            # 새 탭에서 단축 URL 생성 후 탭 닫기
+            result = self.generate_short_url_in_current_tab(product_url)
             
-            # 탭 닫기
             self.driver.close()
             self.driver.switch_to.window(self.driver.window_handles[0])
             
-            return product_info, short_url, deep_link
+            return result
             
         except Exception as e:
             print(f"[X] 처리 중 오류: {e}")
             if len(self.driver.window_handles) > 1:
                 self.driver.close()
                 self.driver.switch_to.window(self.driver.window_handles[0])
-            return None, "처리 오류", "딥링크 생성 실패"
+            return None, None, f"처리 오류: {e}"
 
-    def save_results_to_excel(self, keyword, filename=None):
-        """결과를 엑셀 파일로 저장"""
-        if not self.products_data:
-            print("저장할 데이터가 없습니다.")
-            return None
+    def save_results_to_excel(self, keyword, filename=None, output_dir=None, products=None):
+        """
+        결과를 엑셀 파일로 저장 (save_results 의 엑셀 전용 형태)
         
-        try:
-            if not filename:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                filename = f"쿠팡파트너스_TOP{len(self.products_data)}_{keyword}_{timestamp}.xlsx"
-            
-            # 데이터 포맷팅
-            formatted_data = []
-            for product in self.products_data:
-                formatted_data.append({
-                    # '순위': product['rank'],
-                    '상품명': product['name'],
-                    '가격': product['price'],
-                    '원본URL': product['product_url'],
-                    '단축URL': product['short_url'],
-                    # '딥링크': product['deep_link'],
-                    '이미지URL': product['image_url'],
-                    '생성일시': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                    '단축URL상태': '성공' if product['short_url'] != '단축 URL 생성 실패' else '실패'
-                })
-            
-            df = pd.DataFrame(formatted_data)
-            
-            # 엑셀 파일 저장 (스타일 적용)
-            with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-                df.to_excel(writer, sheet_name='TOP상품분석', index=False)
-                
-                workbook = writer.book
-                worksheet = writer.sheets['TOP상품분석']
-                
-                # 스타일 적용
-                header_font = Font(bold=True, color="FFFFFF")
-                header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-                header_alignment = Alignment(horizontal="center", vertical="center")
-                
-                success_fill = PatternFill(start_color="D4F4DD", end_color="D4F4DD", fill_type="solid")
-                fail_fill = PatternFill(start_color="F4D4D4", end_color="F4D4D4", fill_type="solid")
-                
-                cell_alignment = Alignment(horizontal="left", vertical="center", wrap_text=True)
-                border = Border(
-                    left=Side(style='thin'), right=Side(style='thin'),
-                    top=Side(style='thin'), bottom=Side(style='thin')
-                )
-                
-                # 헤더 스타일
-                for cell in worksheet[1]:
-                    cell.font = header_font
-                    cell.fill = header_fill
-                    cell.alignment = header_alignment
-                    cell.border = border
-                
-                # 데이터 셀 스타일
-                for row in worksheet.iter_rows(min_row=2, max_row=worksheet.max_row, 
-                                             min_col=1, max_col=worksheet.max_column):
-                    for cell in row:
-                        cell.alignment = cell_alignment
-                        cell.border = border
-                        
-                        # 상태에 따른 색상
-                        if cell.column_letter == 'I':  # 단축URL상태 컬럼
-                            if cell.value == '성공':
-                                cell.fill = success_fill
-                            elif cell.value == '실패':
-                                cell.fill = fail_fill
-                
-                # 컬럼 너비 조정
-                column_widths = {
-                    'A': 8,   'B': 40,  'C': 15,  'D': 50,  'E': 50,
-                    'F': 50,  'G': 30,  'H': 20,  'I': 12
-                }
-                
-                for col, width in column_widths.items():
-                    worksheet.column_dimensions[col].width = width
-                
-                # 행 높이 조정
-                for row in range(1, worksheet.max_row + 1):
-                    worksheet.row_dimensions[row].height = 25
-                worksheet.row_dimensions[1].height = 35
+        Returns:
+            str: 저장한 파일 경로 (실패하면 None)
+        """
+        basename = os.path.splitext(filename)[0] if filename else None
+        filenames = self.save_results(keyword, formats=('xlsx',), basename=basename,
+                                      output_dir=output_dir, products=products)
+        return filenames[0] if filenames else None
+
+    @traced("save_results")
+    def save_results(self, keyword, formats=None, basename=None, output_dir=None, products=None):
+        """
+        결과를 지정한 형식의 파일로 저장 (상품을 한 번 순회하며 모든 형식에 행 단위 스트리밍)
+        
+        Args:
+            keyword (str): 검색 키워드 (파일 이름용)
+            formats (iterable): 결과 파일 형식 (None 이면 self.export_formats)
+            basename (str): 확장자를 제외한 파일 이름 (None 이면 키워드와 시각으로 생성)
+            output_dir (str): 저장 디렉터리
+            products (iterable): 저장할 상품 (None 이면 결과 기록 저장소의 이번 실행 기록,
+                저장소가 없거나 기록이 없으면 self.products_data, 제너레이터도 가능)
+        
+        Returns:
+            list: 저장한 파일 경로
+        """
+        formats = formats or self.export_formats
+        count = None
+        if products is None and self.result_sink and self.result_sink.keyword_counts[keyword]:
+            # 기록을 다시 읽지 않고 저장소가 이번 실행에서 센 줄 수를 파일 이름에 사용
+            products = self.result_sink.records(keyword)
+            count = self.result_sink.keyword_counts[keyword]
+        if products is None:
+            products = self.products_data
+        if count is None and hasattr(products, '__len__'):
+            count = len(products)
+        if count == 0:
+            print("저장할 데이터가 없습니다.")
+            return []
+        
+        try:
+            if not basename:
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                count = count if count is not None else 'ALL'
+                basename = f"쿠팡파트너스_TOP{count}_{keyword}_{timestamp}"
+            if output_dir:
+                os.makedirs(output_dir, exist_ok=True)
+                basename = os.path.join(output_dir, basename)
             
-            print(f"엑셀 파일 저장 완료: {filename}")
-            return filename
+            run_id = self.result_sink.run_id if self.result_sink else None
+            exporters = export_products(products, basename, formats, keyword=keyword, run_id=run_id)
+            for exporter in exporters:
+                print(f"결과 파일 저장 완료: {exporter.filename} ({exporter.rows}행)")
+            return [exporter.filename for exporter in exporters]
             
         except Exception as e:
-            print(f"엑셀 파일 저장 실패: {e}")
-            return None
+            print(f"결과 파일 저장 실패: {e}")
+            return []
 
     def print_results(self, keyword):
         """검색 결과 출력"""
@@ -1342,26 +3567,923 @@ class CoupangPartnersWebAutomation:
         print(f"\n=== '{keyword}' TOP {len(self.products_data)} 검색 결과 ===")
         print("=" * 80)
         
-        success_count = 0
         for product in self.products_data:
-            status = "성공" if product['short_url'] != '단축 URL 생성 실패' else "실패"
-            if status == "성공":
-                success_count += 1
-            
-            print(f"{product['rank']}. {product['name']}")
-            print(f"   가격: {product['price']}")
-            print(f"   단축URL: {product['short_url']}")
-            print(f"   상태: {status}")
+            print(f"{product.rank}. {product.name}")
+            print(f"   가격: {product.display_price}")
+            print(f"   단축URL: {product.short_url or product.error}")
+            print(f"   상태: {product.status.value}")
             print()
         
-        print(f"총 {len(self.products_data)}개 상품 중 {success_count}개 단축URL 생성 성공")
+        counts = count_statuses(self.products_data)
+        print(f"총 {len(self.products_data)}개 상품: {format_status_counts(counts)}")
 
     def close(self):
         """브라우저 종료"""
+        self.selectors.save()
+        if self.result_sink and self.owns_result_sink:
+            self.result_sink.close()
+        if self.short_url_cache:
+            self.short_url_cache.print_summary()
+            self.short_url_cache.close()
         if hasattr(self, 'driver'):
             self.driver.quit()
             print("브라우저 종료")
 
+
+def product_to_record(product, created_at=None, keyword=None, run_id=None):
+    """
+    Product 를 EXPORT_SCHEMA 형식의 레코드로 변환 (생성일시는 datetime, 상태는 ProductStatus 이름)
+    
+    Args:
+        product (Product): 상품
+        created_at (str): 생성일시 (상품에 없을 때 사용, None 이면 현재 시각)
+        keyword (str): 검색 키워드 (상품에 없을 때 사용)
+        run_id (str): 실행 식별자
+    
+    Returns:
+        dict: 필드별 값
+    """
+    created_at = product.created_at or created_at
+    try:
+        created_at = datetime.strptime(created_at, EXPORT_TIME_FORMAT) if created_at else datetime.now()
+    except ValueError:
+        created_at = datetime.now()
+    
+    return {
+        'run_id': run_id or '',
+        'keyword': product.keyword or keyword or '',
+        'rank': product.rank or None,
+        'name': product.name,
+        'price': product.price,
+        'product_url': product.product_url,
+        'short_url': product.short_url,
+        'image_url': product.image_url,
+        'deep_link': product.deep_link,
+        'created_at': created_at.replace(microsecond=0),
+        'status': product.status.name,
+        'error': product.error
+    }
+
+
+def product_to_row(product, created_at=None):
+    """
+    Product 를 엑셀 한 행으로 변환 (EXCEL_COLUMNS 순서, 실패한 상품은 단축URL 칸에 실패 사유)
+    
+    Args:
+        product (Product): 상품
+        created_at (str): 생성일시 (상품에 없을 때 사용, None 이면 현재 시각)
+    
+    Returns:
+        list: 컬럼 값 리스트
+    """
+    return [
+        product.name,
+        product.display_price,
+        product.product_url,
+        product.short_url or product.error,
+        product.image_url,
+        product.created_at or created_at or datetime.now().strftime(EXPORT_TIME_FORMAT),
+        product.status.value
+    ]
+
+
+class ResultExporter:
+    """
+    결과 파일 내보내기 기본 클래스
+    
+    상품을 받는 즉시 기록하는 스트리밍 방식이며 with 문으로 사용한다.
+    파일 전체에 공통인 keyword/run_id/created_at 은 생성할 때 지정한다.
+    """
+
+    EXTENSION = ''
+
+    def __init__(self, filename, keyword=None, run_id=None, created_at=None):
+        """
+        Args:
+            filename (str): 저장할 파일 경로
+            keyword (str): 검색 키워드
+            run_id (str): 실행 식별자
+            created_at (str): 생성일시 (None 이면 현재 시각)
+        """
+        self.filename = filename
+        self.keyword = keyword
+        self.run_id = run_id
+        self.created_at = created_at or datetime.now().strftime(EXPORT_TIME_FORMAT)
+        self.rows = 0
+
+    def write(self, product):
+        """상품 하나 기록"""
+        self.write_record(product_to_record(product, self.created_at, self.keyword, self.run_id))
+        self.rows += 1
+
+    def write_record(self, record):
+        """EXPORT_SCHEMA 형식 레코드 하나 기록"""
+        raise NotImplementedError
+
+    def close(self):
+        """파일 닫기"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+def format_export_value(value):
+    """CSV/JSON 용 값 변환 (datetime 은 EXPORT_TIME_FORMAT 문자열)"""
+    if isinstance(value, datetime):
+        return value.strftime(EXPORT_TIME_FORMAT)
+    return value
+
+
+class CsvExporter(ResultExporter):
+    """CSV 내보내기 (엑셀에서 바로 열 수 있도록 UTF-8 BOM 포함)"""
+
+    EXTENSION = '.csv'
+
+    def __init__(self, filename, keyword=None, run_id=None, created_at=None):
+        super().__init__(filename, keyword, run_id, created_at)
+        self.file = open(filename, 'w', newline='', encoding='utf-8-sig')
+        self.writer = csv.writer(self.file)
+        self.writer.writerow([field for field, _ in EXPORT_SCHEMA])
+
+    def write_record(self, record):
+        self.writer.writerow(['' if record[field] is None else format_export_value(record[field])
+                              for field, _ in EXPORT_SCHEMA])
+
+    def close(self):
+        self.file.close()
+
+
+class JsonLinesExporter(ResultExporter):
+    """JSON Lines 내보내기 (한 줄에 상품 하나)"""
+
+    EXTENSION = '.jsonl'
+
+    def __init__(self, filename, keyword=None, run_id=None, created_at=None):
+        super().__init__(filename, keyword, run_id, created_at)
+        self.file = open(filename, 'w', encoding='utf-8')
+
+    def write_record(self, record):
+        line = {field: format_export_value(record[field]) for field, _ in EXPORT_SCHEMA}
+        self.file.write(json.dumps(line, ensure_ascii=False) + "\n")
+
+    def close(self):
+        self.file.close()
+
+
+class ParquetExporter(ResultExporter):
+    """
+    Parquet 내보내기 (pyarrow 필요)
+    
+    가격/순위는 정수, 생성일시는 timestamp, 상태는 사전(enum) 인코딩 컬럼으로 저장한다.
+    한 실행이 파일 하나이므로 output_dir 의 Parquet 파일을 모아 읽으면 여러 달 치 실행을 바로 분석할 수 있다.
+    (analyze_results.py results)
+    """
+
+    EXTENSION = '.parquet'
+    BATCH_SIZE = 1000
+
+    def __init__(self, filename, keyword=None, run_id=None, created_at=None):
+        if pa is None:
+            raise RuntimeError("pyarrow 라이브러리가 필요합니다: pip install pyarrow")
+        super().__init__(filename, keyword, run_id, created_at)
+        self.schema = self.arrow_schema()
+        self.writer = pq.ParquetWriter(filename, self.schema)
+        self.buffer = []
+
+    @staticmethod
+    def arrow_schema():
+        """EXPORT_SCHEMA 에 대응하는 pyarrow 스키마"""
+        types = {
+            'string': pa.string(),
+            'int': pa.int64(),
+            'timestamp': pa.timestamp('s'),
+            'status': pa.dictionary(pa.int8(), pa.string())
+        }
+        return pa.schema([(field, types[kind]) for field, kind in EXPORT_SCHEMA])
+
+    def write_record(self, record):
+        self.buffer.append(record)
+        if len(self.buffer) >= self.BATCH_SIZE:
+            self.flush()
+
+    def flush(self):
+        """버퍼의 레코드를 row group 으로 기록"""
+        if self.buffer:
+            self.writer.write_table(pa.Table.from_pylist(self.buffer, schema=self.schema))
+            self.buffer = []
+
+    def close(self):
+        self.flush()
+        self.writer.close()
+
+
+class StreamingExcelWriter(ResultExporter):
+    """
+    상수 메모리 엑셀 저장기
+    
+    openpyxl write-only 모드로 행을 받는 즉시 기록하고, 셀 스타일은 통합 문서에 한 번 등록한
+    이름 있는 스타일(NamedStyle)을 공유한다. 행 수와 관계없이 메모리 사용량이 일정하다.
+    """
+
+    EXTENSION = '.xlsx'
+    SHEET_NAME = 'TOP상품분석'
+
+    def __init__(self, filename, keyword=None, run_id=None, created_at=None, sheet_name=SHEET_NAME):
+        """
+        Args:
+            filename (str): 저장할 엑셀 파일 경로
+            keyword (str): 검색 키워드 (엑셀 컬럼에는 없음)
+            run_id (str): 실행 식별자 (엑셀 컬럼에는 없음)
+            created_at (str): 생성일시 (None 이면 현재 시각)
+            sheet_name (str): 시트 이름
+        """
+        super().__init__(filename, keyword, run_id, created_at)
+        self.workbook = openpyxl.Workbook(write_only=True)
+        self._register_styles()
+        
+        self.sheet = self.workbook.create_sheet(sheet_name)
+        for index, column in enumerate(EXCEL_COLUMNS, 1):
+            self.sheet.column_dimensions[get_column_letter(index)].width = EXCEL_COLUMN_WIDTHS[column]
+        self.sheet.sheet_format.defaultRowHeight = 25
+        self.sheet.sheet_format.customHeight = True
+        self.sheet.row_dimensions[1].height = 35
+        self.sheet.freeze_panes = 'A2'
+        self.status_column = EXCEL_COLUMNS.index('단축URL상태')
+        
+        self.sheet.append([self._cell(column, 'header') for column in EXCEL_COLUMNS])
+
+    def _register_styles(self):
+        border = Border(
+            left=Side(style='thin'), right=Side(style='thin'),
+            top=Side(style='thin'), bottom=Side(style='thin')
+        )
+        cell_alignment = Alignment(horizontal="left", vertical="center", wrap_text=True)
+        
+        styles = [
+            NamedStyle(name='header', font=Font(bold=True, color="FFFFFF"),
+                       fill=PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid"),
+                       alignment=Alignment(horizontal="center", vertical="center"), border=border),
+            NamedStyle(name='cell', alignment=cell_alignment, border=border),
+            NamedStyle(name='cell_success', alignment=cell_alignment, border=border,
+                       fill=PatternFill(start_color="D4F4DD", end_color="D4F4DD", fill_type="solid")),
+            NamedStyle(name='cell_fail', alignment=cell_alignment, border=border,
+                       fill=PatternFill(start_color="F4D4D4", end_color="F4D4D4", fill_type="solid")),
+        ]
+        for style in styles:
+            self.workbook.add_named_style(style)
+
+    def _cell(self, value, style):
+        cell = WriteOnlyCell(self.sheet, value=value)
+        cell.style = style
+        return cell
+
+    def write_row(self, row):
+        """결과 한 행 기록 (EXCEL_COLUMNS 순서의 값 리스트)"""
+        status = row[self.status_column]
+        cells = []
+        for index, value in enumerate(row):
+            style = 'cell'
+            if index == self.status_column and status != ProductStatus.PENDING.value:
+                style = 'cell_success' if status == ProductStatus.SUCCESS.value else 'cell_fail'
+            cells.append(self._cell(value, style))
+        self.sheet.append(cells)
+        self.rows += 1
+
+    def write(self, product):
+        """상품 하나 기록"""
+        self.write_row(product_to_row(product, self.created_at))
+
+    def close(self):
+        """파일 저장 (write-only 통합 문서는 한 번만 저장할 수 있음)"""
+        self.workbook.save(self.filename)
+
+
+# 결과 파일 형식별 내보내기 클래스 (명령줄 --format 값)
+EXPORTERS = {
+    'xlsx': StreamingExcelWriter,
+    'csv': CsvExporter,
+    'jsonl': JsonLinesExporter,
+    'parquet': ParquetExporter,
+}
+
+
+def export_products(products, basename, formats=('xlsx',), keyword=None, run_id=None):
+    """
+    상품을 한 번만 순회하면서 여러 형식의 결과 파일에 동시에 기록
+    
+    Args:
+        products (iterable): 상품 (제너레이터도 가능)
+        basename (str): 확장자를 제외한 파일 경로
+        formats (iterable): EXPORTERS 의 형식 이름
+        keyword (str): 검색 키워드
+        run_id (str): 실행 식별자
+    
+    Returns:
+        list: 저장한 내보내기 객체 (filename, rows)
+    """
+    created_at = datetime.now().strftime(EXPORT_TIME_FORMAT)
+    exporters = []
+    for fmt in formats:
+        exporter_class = EXPORTERS[fmt]
+        try:
+            exporters.append(exporter_class(basename + exporter_class.EXTENSION, keyword, run_id, created_at))
+        except Exception as e:
+            print(f"{fmt} 파일 생성 실패: {e}")
+    
+    try:
+        for product in products:
+            for exporter in exporters:
+                exporter.write(product)
+    finally:
+        for exporter in exporters:
+            exporter.close()
+    return exporters
+
+
+class CheckpointStore:
+    """
+    배치 작업 체크포인트 저장소
+    
+    키워드별 상태(pending/running/done/failed)와 상품별 단축 URL 결과를 JSON 파일에
+    기록한다. 상태가 바뀔 때마다 파일을 원자적으로 교체하므로 중간에 프로세스가
+    죽어도 마지막으로 완료된 작업까지는 남는다.
+    """
+
+    def __init__(self, path="batch_checkpoint.json"):
+        """
+        Args:
+            path (str): 체크포인트 파일 경로
+        """
+        self.path = path
+        self.lock = threading.Lock()
+        self.data = {'keywords': {}}
+        self.load()
+
+    def load(self):
+        """체크포인트 파일 불러오기"""
+        if not os.path.exists(self.path):
+            return
+        
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.data = json.load(f)
+            self.data.setdefault('keywords', {})
+            done = sum(1 for state in self.data['keywords'].values() if state.get('status') == 'done')
+            print(f"체크포인트 불러옴: {self.path} (완료 키워드 {done}개)")
+        except Exception as e:
+            print(f"체크포인트 불러오기 실패: {e}")
+
+    def save(self):
+        """체크포인트 파일 저장"""
+        tmp_path = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def keyword_state(self, keyword):
+        """키워드 상태 딕셔너리 (없으면 pending 상태로 생성)"""
+        return self.data['keywords'].setdefault(keyword, {'status': 'pending', 'products': {}})
+
+    def is_done(self, keyword):
+        """키워드 처리가 완료되었는지 여부"""
+        return self.data['keywords'].get(keyword, {}).get('status') == 'done'
+
+    def mark_keyword(self, keyword, status, **fields):
+        """
+        키워드 상태 변경 및 저장
+        
+        Args:
+            keyword (str): 키워드
+            status (str): pending / running / done / failed
+            **fields: 함께 기록할 값 (output, error 등)
+        """
+        with self.lock:
+            state = self.keyword_state(keyword)
+            state['status'] = status
+            state['updated_at'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            state.update(fields)
+            self.save()
+
+    @staticmethod
+    def product_key(product_url):
+        """상품 식별 키 (추적 파라미터가 달라도 같은 상품이면 같은 키, 식별자가 없으면 URL)"""
+        return product_identity_key(product_url) or product_url
+
+    def record_product(self, keyword, product):
+        """상품 하나의 처리 결과 기록 및 저장 (재시작 후 순위가 바뀌어도 같은 상품은 한 항목)"""
+        with self.lock:
+            state = self.keyword_state(keyword)
+            key = self.product_key(product.product_url) or f"rank:{product.rank}"
+            state['products'][key] = {
+                'rank': product.rank,
+                'name': product.name,
+                'product_url': product.product_url,
+                'short_url': product.short_url,
+                'error': product.error,
+                'done': product.ok
+            }
+            self.save()
+
+    def completed_products(self, keyword):
+        """
+        이미 단축 URL이 생성된 상품
+        
+        Returns:
+            dict: {상품 식별 키: short_url} (product_key 기준)
+        """
+        products = self.data['keywords'].get(keyword, {}).get('products', {})
+        return {
+            self.product_key(product['product_url']): product['short_url']
+            for product in products.values()
+            if product.get('done') and product.get('product_url')
+        }
+
+    def print_summary(self):
+        """키워드 상태별 개수 출력"""
+        counts = {}
+        for state in self.data['keywords'].values():
+            counts[state.get('status', 'pending')] = counts.get(state.get('status', 'pending'), 0) + 1
+        print(f"체크포인트 상태: {counts}")
+
+
+class BatchJobRunner:
+    """
+    다중 키워드 배치 실행기
+    
+    키워드 목록을 순서대로 처리하면서 CheckpointStore 에 진행 상황을 기록하고,
+    키워드 하나가 끝날 때마다 결과 파일을 바로 저장한다. 재시작하면 완료된 키워드와
+    단축 URL이 이미 생성된 상품은 건너뛴다.
+    """
+
+    def __init__(self, automation, checkpoint, count=10, output_dir="results"):
+        """
+        Args:
+            automation (CoupangPartnersWebAutomation): 로그인된 자동화 인스턴스
+            checkpoint (CheckpointStore): 체크포인트 저장소
+            count (int): 키워드별 처리할 상품 개수
+            output_dir (str): 키워드별 결과 파일 저장 디렉터리
+        """
+        self.automation = automation
+        self.checkpoint = checkpoint
+        self.count = count
+        self.output_dir = output_dir
+
+    @staticmethod
+    def load_keywords(path):
+        """
+        키워드 파일 읽기 (한 줄에 하나, 빈 줄과 # 주석 무시, 중복 제거)
+        
+        Returns:
+            list: 키워드 리스트
+        """
+        keywords = []
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                keyword = line.strip()
+                if keyword and not keyword.startswith('#') and keyword not in keywords:
+                    keywords.append(keyword)
+        return keywords
+
+    def run(self, keywords):
+        """
+        키워드 목록 처리
+        
+        Args:
+            keywords (list): 키워드 리스트
+        
+        Returns:
+            dict: {'done': n, 'failed': n, 'skipped': n}
+        """
+        result = {'done': 0, 'failed': 0, 'skipped': 0}
+        
+        for index, keyword in enumerate(keywords, 1):
+            print(f"\n##### [{index}/{len(keywords)}] 키워드 '{keyword}' #####")
+            
+            if self.checkpoint.is_done(keyword):
+                print("[O] 이미 완료된 키워드, 건너뜀")
+                result['skipped'] += 1
+                continue
+            
+            self.checkpoint.mark_keyword(keyword, 'running')
+            
+            try:
+                if not self.automation.navigate_to_affiliate_ws():
+                    raise RuntimeError("워크스페이스 이동 실패")
+                
+                products = self.automation.search_products_and_get_short_urls(
+                    keyword, self.count,
+                    completed=self.checkpoint.completed_products(keyword),
+                    on_product=lambda product: self.checkpoint.record_product(keyword, product)
+                )
+                if not products:
+                    raise RuntimeError("상품 정보 추출 실패")
+                
+                filenames = self.automation.save_results(keyword, output_dir=self.output_dir)
+                self.checkpoint.mark_keyword(keyword, 'done', output=', '.join(filenames), error='')
+                result['done'] += 1
+                
+            except Exception as e:
+                print(f"[X] 키워드 '{keyword}' 처리 실패: {e}")
+                self.checkpoint.mark_keyword(keyword, 'failed', error=str(e))
+                result['failed'] += 1
+        
+        print(f"\n=== 배치 완료: 완료 {result['done']}개, 실패 {result['failed']}개, 건너뜀 {result['skipped']}개 ===")
+        self.checkpoint.print_summary()
+        return result
+
+
+class CoupangWorkerPool:
+    """
+    브라우저 워커 풀
+    
+    독립된 CoupangPartnersWebAutomation 인스턴스 N개가 하나의 로그인 세션
+    (SessionStore 로 복사한 쿠키)과 하나의 결과 기록 저장소(ResultSink)를 공유하고,
+    작업 큐에서 키워드나 상품 URL을 비어 있는 워커가 가져가 처리한다.
+    """
+
+    def __init__(self, worker_count, email, password, headless=False, **automation_kwargs):
+        """
+        Args:
+            worker_count (int): 워커(브라우저) 수
+            email (str): 로그인 이메일
+            password (str): 로그인 비밀번호
+            headless (bool): 브라우저를 숨김 모드로 실행할지 여부
+            **automation_kwargs: CoupangPartnersWebAutomation 에 전달할 추가 인자
+        """
+        self.worker_count = max(1, worker_count)
+        self.email = email
+        self.password = password
+        self.headless = headless
+        
+        # 결과 기록은 저장소 하나를 모든 워커가 공유 (쓰기는 저장소의 잠금으로 직렬화)
+        result_sink_path = automation_kwargs.pop('result_sink_path', None)
+        result_run_id = automation_kwargs.pop('result_run_id', None)
+        self.result_sink = ResultSink(result_sink_path, result_run_id) if result_sink_path else None
+        automation_kwargs['result_sink'] = self.result_sink
+        self.automation_kwargs = automation_kwargs
+        self.workers = []
+        self.worker_stats = []
+        self.products_data = []
+        self.elapsed = 0.0
+
+    def start(self):
+        """
+        워커 생성 및 로그인
+        
+        첫 번째 워커가 로그인(또는 저장된 세션 복원)을 마치고 세션을 저장하면,
+        나머지 워커는 동시에 생성되어 저장된 세션을 복원한다.
+        
+        Returns:
+            bool: 로그인된 워커가 하나 이상인지 여부
+        """
+        print(f"\n=== 워커 {self.worker_count}개 시작 ===")
+        first = CoupangPartnersWebAutomation(headless=self.headless, **self.automation_kwargs)
+        if not first.ensure_login(self.email, self.password):
+            print("[X] 첫 번째 워커 로그인 실패")
+            first.close()
+            return False
+        first.session_store.save(first.driver)
+        self.workers.append(first)
+        
+        def create_worker(worker_id):
+            worker = CoupangPartnersWebAutomation(headless=self.headless, **self.automation_kwargs)
+            if worker.ensure_login(self.email, self.password):
+                return worker
+            print(f"[X] 워커 {worker_id} 로그인 실패")
+            worker.close()
+            return None
+        
+        if self.worker_count > 1:
+            with ThreadPoolExecutor(max_workers=self.worker_count - 1) as executor:
+                for worker in executor.map(create_worker, range(2, self.worker_count + 1)):
+                    if worker:
+                        self.workers.append(worker)
+        
+        print(f"[O] 로그인된 워커 {len(self.workers)}개 준비 완료")
+        return bool(self.workers)
+
+    def _run(self, items, handler):
+        """
+        작업 큐를 워커들이 나눠 처리
+        
+        Args:
+            items (list): 작업 항목 리스트
+            handler (callable): handler(worker, item) -> 상품 딕셔너리 리스트
+        
+        Returns:
+            list: 항목 순서대로 정렬된 결과 리스트의 리스트
+        """
+        work_queue = queue.Queue()
+        for index, item in enumerate(items):
+            work_queue.put((index, item))
+        
+        results = [None] * len(items)
+        self.worker_stats = [
+            {'worker': i + 1, 'items': 0, 'products': 0, 'busy_seconds': 0.0}
+            for i in range(len(self.workers))
+        ]
+        
+        def worker_loop(worker_index):
+            worker = self.workers[worker_index]
+            stat = self.worker_stats[worker_index]
+            while True:
+                try:
+                    index, item = work_queue.get_nowait()
+                except queue.Empty:
+                    return
+                
+                start = time.perf_counter()
+                try:
+                    results[index] = handler(worker, item) or []
+                except Exception as e:
+                    print(f"[X] 워커 {worker_index + 1} 작업 실패 ({item}): {e}")
+                    results[index] = []
+                stat['busy_seconds'] += time.perf_counter() - start
+                stat['items'] += 1
+                stat['products'] += len(results[index])
+        
+        start = time.perf_counter()
+        threads = [
+            threading.Thread(target=worker_loop, args=(i,), name=f"coupang-worker-{i + 1}")
+            for i in range(len(self.workers))
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.elapsed = time.perf_counter() - start
+        
+        return results
+
+    def run_keywords(self, keywords, count=10):
+        """
+        키워드별 검색 및 단축 URL 생성을 워커들에게 분배
+        
+        Args:
+            keywords (list): 검색 키워드 리스트
+            count (int): 키워드별 처리할 상품 개수
+        
+        Returns:
+            list: 키워드 순서, 순위 순으로 병합된 상품 리스트
+        """
+        def handle_keyword(worker, keyword):
+            if not worker.navigate_to_affiliate_ws():
+                return []
+            products = worker.search_products_and_get_short_urls(keyword, count) or []
+            for product in products:
+                product.keyword = keyword
+            return products
+        
+        results = self._run(keywords, handle_keyword)
+        self.products_data = [
+            product
+            for products in results
+            for product in sorted(products, key=lambda product: product.rank)
+        ]
+        return self.products_data
+
+    def run_product_urls(self, product_urls):
+        """
+        상품 URL별 단축 URL 생성을 워커들에게 분배
+        
+        Args:
+            product_urls (list): 상품 URL 리스트
+        
+        Returns:
+            list: 입력 순서대로 병합된 상품 리스트
+        """
+        def handle_product_urls(worker, chunk):
+            products = [Product(rank=rank, product_url=product_url) for rank, product_url in chunk]
+            pending = []
+            for product in products:
+                cached_url = worker.short_url_cache.get(product.product_url) if worker.short_url_cache else None
+                if cached_url:
+                    product.resolve(cached_url)
+                    worker.record_result(product)
+                else:
+                    pending.append(product)
+            
+            if pending:
+                # 워커의 탭 풀에서 탭을 재사용하며 다음 상품을 미리 로드
+                worker.generate_short_urls_with_tab_pool(pending, worker.tab_pool_size)
+            return products
+        
+        # 워커마다 탭 풀 크기의 몇 배씩 묶어 가져가 탭을 여러 상품에 재사용
+        chunk_size = max(1, self.automation_kwargs.get('tab_pool_size', 3)) * 4
+        items = list(enumerate(product_urls, 1))
+        chunks = [items[start:start + chunk_size] for start in range(0, len(items), chunk_size)]
+        results = self._run(chunks, handle_product_urls)
+        self.products_data = [product for products in results for product in products]
+        return self.products_data
+
+    def print_throughput(self):
+        """전체 및 워커별 처리량 출력"""
+        total_products = sum(stat['products'] for stat in self.worker_stats)
+        per_minute = total_products / self.elapsed * 60 if self.elapsed else 0.0
+        
+        print(f"\n=== 워커 풀 처리량 ===")
+        print(f"  전체: 상품 {total_products}개, {self.elapsed:.1f}s, {per_minute:.1f}개/분")
+        for stat in self.worker_stats:
+            busy = stat['busy_seconds']
+            rate = stat['products'] / busy * 60 if busy else 0.0
+            print(f"  워커 {stat['worker']}: 작업 {stat['items']}개, 상품 {stat['products']}개, "
+                  f"작업시간 {busy:.1f}s, {rate:.1f}개/분")
+
+    def close(self):
+        """모든 워커 종료"""
+        for worker in self.workers:
+            try:
+                worker.waiter.print_summary()
+                worker.close()
+            except Exception as e:
+                print(f"워커 종료 실패: {e}")
+        self.workers = []
+        if self.result_sink:
+            self.result_sink.close()
+
+
+def parse_args():
+    """명령줄 인자 파싱"""
+    parser = argparse.ArgumentParser(description="쿠팡 파트너스 상위 상품 단축 URL 생성 및 엑셀 저장")
+    parser.add_argument("-k", "--keyword", action="append",
+                        help="검색할 키워드 (여러 번 지정 가능)")
+    parser.add_argument("-n", "--count", type=int, default=10,
+                        help="키워드별 추출할 상품 개수 (기본값: 10)")
+    parser.add_argument("-w", "--workers", type=int, default=1,
+                        help="병렬로 실행할 브라우저 워커 수 (기본값: 1)")
+    parser.add_argument("--product-urls",
+                        help="단축 URL을 생성할 상품 URL 목록 파일 (한 줄에 하나)")
+    parser.add_argument("--tabs", type=int, default=3,
+                        help="상품 URL 목록 처리 시 미리 로드하며 재사용할 탭 수 (기본값: 3)")
+    parser.add_argument("--keywords-file",
+                        help="배치로 처리할 키워드 목록 파일 (한 줄에 하나)")
+    parser.add_argument("--checkpoint", default="batch_checkpoint.json",
+                        help="배치 체크포인트 파일 (기본값: batch_checkpoint.json)")
+    parser.add_argument("--output-dir", default="results",
+                        help="배치 결과 파일 저장 디렉터리 (기본값: results)")
+    parser.add_argument("--trace-summary",
+                        help="단계별 p50/p95/max 실행 시간 요약을 저장할 JSON 파일")
+    parser.add_argument("--trace",
+                        help="Chrome trace-event 형식 구간 기록을 저장할 JSON 파일")
+    parser.add_argument("--profile-commands", action="store_true",
+                        help="WebDriver 명령 수/지연 시간을 명령 종류와 호출 위치별로 집계")
+    parser.add_argument("--extraction-engine", choices=["script", "lxml"], default="script",
+                        help="검색 결과 일괄 추출 방식 (lxml: page_source 한 번 파싱)")
+    parser.add_argument("--snapshot-dir",
+                        help="검색 결과/링크 생성 페이지 HTML 스냅샷 저장 디렉터리 (재생 검증용)")
+    parser.add_argument("--results-log", default="results.jsonl",
+                        help="상품별 결과를 즉시 추가 기록할 JSON Lines 파일 (중단되어도 유지)")
+    parser.add_argument("--no-results-log", action="store_true",
+                        help="상품별 결과 기록 사용 안 함")
+    parser.add_argument("--format", dest="formats", action="append", choices=sorted(EXPORTERS),
+                        help="결과 파일 형식 (여러 번 지정 가능, 기본값: xlsx / parquet 은 pyarrow 필요)")
+    parser.add_argument("--results-to-excel", metavar="RESULTS_LOG",
+                        help="브라우저 없이 결과 기록 파일을 엑셀(--format 지정 시 해당 형식)로 변환 "
+                             "(--run-id 없으면 마지막 실행)")
+    parser.add_argument("--run-id",
+                        help="--results-to-excel 로 변환할 실행 식별자")
+    parser.add_argument("--lean", action="store_true",
+                        help="이미지/폰트/트래커를 차단하는 경량 브라우저 프로필 사용")
+    parser.add_argument("--headless", action="store_true",
+                        help="브라우저를 숨김 모드로 실행")
+    parser.add_argument("--url-cache", default="short_url_cache.sqlite3",
+                        help="단축 URL 캐시 SQLite 파일 (기본값: short_url_cache.sqlite3)")
+    parser.add_argument("--url-cache-ttl-days", type=float, default=30,
+                        help="단축 URL 캐시 유효 기간(일) (기본값: 30)")
+    parser.add_argument("--no-url-cache", action="store_true",
+                        help="단축 URL 캐시를 사용하지 않음")
+    parser.add_argument("--no-direct-link", action="store_true",
+                        help="링크 생성 페이지 직접 이동을 끄고 항상 호버/클릭 방식 사용")
+    parser.add_argument("--link-generation-template",
+                        help="링크 생성 페이지 URL 템플릿 ({productId}, {itemId}, {vendorItemId} 치환)")
+    parser.add_argument("--http-shorten", action="store_true",
+                        help="첫 단축 요청을 캡처해 이후 상품은 HTTP로 직접 단축 (requests 필요)")
+    return parser.parse_args()
+
+
+# 이번 실행의 결과 기록 식별자 (워커 풀의 모든 워커가 공유)
+RUN_ID = datetime.now().strftime('%Y%m%d_%H%M%S')
+
+
+def convert_results_log(args):
+    """결과 기록 파일을 브라우저 없이 결과 파일(기본값 엑셀)로 변환"""
+    path = args.results_to_excel
+    run_id = args.run_id or ResultSink.latest_run_id(path)
+    if not run_id:
+        print(f"변환할 기록이 없습니다: {path}")
+        return []
+    
+    label = os.path.splitext(os.path.basename(path))[0]
+    basename = f"쿠팡파트너스_{label}_{run_id}"
+    if args.output_dir:
+        os.makedirs(args.output_dir, exist_ok=True)
+        basename = os.path.join(args.output_dir, basename)
+    
+    exporters = export_products(ResultSink.read_products(path, run_id), basename, args.formats or ['xlsx'], run_id=run_id)
+    for exporter in exporters:
+        print(f"변환 완료: {exporter.filename} ({exporter.rows}행, 실행 {run_id})")
+    return [exporter.filename for exporter in exporters]
+
+
+def automation_options(args):
+    """명령줄 인자에서 CoupangPartnersWebAutomation 생성 인자 구성"""
+    return {
+        'headless': args.headless,
+        'short_url_cache_path': None if args.no_url_cache else args.url_cache,
+        'short_url_cache_ttl_days': args.url_cache_ttl_days,
+        'direct_link_generation': not args.no_direct_link,
+        'link_generation_url_template': args.link_generation_template,
+        'http_shortening': args.http_shorten,
+        'lean_profile': args.lean,
+        'profile_commands': args.profile_commands,
+        'extraction_engine': args.extraction_engine,
+        'snapshot_dir': args.snapshot_dir,
+        'result_sink_path': None if args.no_results_log else args.results_log,
+        'result_run_id': RUN_ID,
+        'export_formats': args.formats or ['xlsx'],
+        'tab_pool_size': args.tabs
+    }
+
+
+def export_traces(args, tracer):
+    """단계별 시간 요약 출력 및 요청된 trace 파일 저장"""
+    tracer.print_summary()
+    if args.trace_summary:
+        tracer.save_summary(args.trace_summary)
+    if args.trace:
+        tracer.save_trace(args.trace)
+
+
+def run_worker_pool(args, email, password, keywords):
+    """워커 풀로 키워드 또는 상품 URL 목록 처리 후 엑셀 저장"""
+    pool = CoupangWorkerPool(args.workers, email, password, **automation_options(args))
+    
+    try:
+        if not pool.start():
+            print("워커를 시작할 수 없습니다.")
+            return
+        
+        if args.product_urls:
+            with open(args.product_urls, 'r', encoding='utf-8') as f:
+                product_urls = [line.strip() for line in f if line.strip()]
+            products = pool.run_product_urls(product_urls)
+            label = os.path.splitext(os.path.basename(args.product_urls))[0]
+        else:
+            products = pool.run_keywords(keywords, args.count)
+            label = keywords[0] if len(keywords) == 1 else f"{keywords[0]}외{len(keywords) - 1}개"
+        
+        if products:
+            # 병합된 결과를 첫 번째 워커를 통해 결과 파일로 저장
+            pool.workers[0].products_data = products
+            pool.workers[0].save_results(label)
+        else:
+            print("상품 정보 추출에 실패했습니다.")
+        
+        # 저장 구간까지 포함해 단계별 시간 출력
+        pool.print_throughput()
+        export_traces(args, PhaseTracer.combine(worker.tracer for worker in pool.workers))
+        profilers = [worker.command_profiler for worker in pool.workers if worker.command_profiler]
+        if profilers:
+            WebDriverCommandProfiler.print_stats(*WebDriverCommandProfiler.merge(profilers),
+                                                 product_count=len(products or []))
+    finally:
+        pool.close()
+
+
+def run_batch(args, email, password):
+    """키워드 파일을 체크포인트 기반 배치로 처리"""
+    keywords = BatchJobRunner.load_keywords(args.keywords_file)
+    print(f"배치 키워드 {len(keywords)}개: {args.keywords_file}")
+    
+    checkpoint = CheckpointStore(args.checkpoint)
+    automation = None
+    
+    try:
+        automation = CoupangPartnersWebAutomation(**automation_options(args))
+        if not automation.ensure_login(email, password):
+            print("로그인에 실패했습니다. 수동으로 로그인을 완료한 후 계속하세요.")
+            input("로그인을 완료했으면 Enter를 눌러주세요...")
+            automation.session_store.save(automation.driver)
+        
+        runner = BatchJobRunner(automation, checkpoint, count=args.count, output_dir=args.output_dir)
+        runner.run(keywords)
+        
+    except KeyboardInterrupt:
+        print("\n사용자에 의해 중단되었습니다. 다시 실행하면 이어서 처리합니다.")
+    finally:
+        if automation:
+            automation.waiter.print_summary()
+            automation.profile_monitor.print_summary()
+            export_traces(args, automation.tracer)
+            if automation.command_profiler:
+                automation.command_profiler.print_summary(automation.products_processed)
+            automation.close()
+
+
 def main():
     # 설정값
     EMAIL = "alstmd9708@naver.com"  # 실제 이메일로 변경
@@ -1369,23 +4491,44 @@ def main():
     KEYWORD = "미니선풍기"        # 검색할 키워드
     TOP_COUNT = 10                  # 추출할 상품 개수
     
+    args = parse_args()
+    keywords = args.keyword or [KEYWORD]
+    KEYWORD = keywords[0]
+    TOP_COUNT = args.count
+    
+    if args.results_to_excel:
+        convert_results_log(args)
+        return
+    
+    if args.keywords_file:
+        run_batch(args, EMAIL, PASSWORD)
+        return
+    
+    if args.workers > 1 or len(keywords) > 1 or args.product_urls:
+        try:
+            run_worker_pool(args, EMAIL, PASSWORD, keywords)
+        except KeyboardInterrupt:
+            print("\n사용자에 의해 중단되었습니다.")
+        return
+    
     automation = None
     
     try:
         print("=" * 60)
-        print("쿠팡 파트너스 상위 10개 상품 단축 URL 생성 및 엑셀 저장")
+        print(f"쿠팡 파트너스 상위 {TOP_COUNT}개 상품 단축 URL 생성 및 엑셀 저장")
         print("=" * 60)
         print(f"검색 키워드: {KEYWORD}")
         print(f"추출 개수: TOP {TOP_COUNT}개 상품")
         print("=" * 60)
         
         # 자동화 클래스 초기화
-        automation = CoupangPartnersWebAutomation(headless=False)
+        automation = CoupangPartnersWebAutomation(**automation_options(args))
         
-        # 로그인
-        if not automation.login(EMAIL, PASSWORD):
+        # 로그인 (저장된 세션이 유효하면 건너뜀)
+        if not automation.ensure_login(EMAIL, PASSWORD):
             print("로그인에 실패했습니다. 수동으로 로그인을 완료한 후 계속하세요.")
             input("로그인을 완료했으면 Enter를 눌러주세요...")
+            automation.session_store.save(automation.driver)
         
         # 제휴 워크스페이스로 이동
         if not automation.navigate_to_affiliate_ws():
@@ -1397,33 +4540,42 @@ def main():
         
         if products:
             print(f"\n=== 단축 URL 생성 완료! ===")
-            success_count = sum(1 for p in products if p.get('short_url') and p['short_url'] != '생성 실패')
-            print(f"\n총 {len(products)}개 상품 중 {success_count}개 성공")
+            counts = count_statuses(products)
+            print(f"\n총 {len(products)}개 상품: {format_status_counts(counts)}")
             
             for i, product in enumerate(products, 1):
-                print(f"\n{i}. {product['name'][:50]}...")
-                print(f"   가격: {product['price']}")
-                print(f"   단축 URL: {product.get('short_url', '없음')}")
-            
-            # 엑셀 파일로 저장
-            filename = automation.save_results_to_excel(KEYWORD)
-            if filename:
-                print(f"\n엑셀 파일 저장 완료: {filename}")
+                print(f"\n{i}. {product.name[:50]}...")
+                print(f"   가격: {product.display_price}")
+                print(f"   단축 URL: {product.short_url or f'없음 ({product.error})'}")
+            
+            # 결과 파일로 저장 (기본값 엑셀, --format 으로 형식 지정)
+            automation.save_results(KEYWORD)
         else:
             print("상품 정보 추출에 실패했습니다.")
         
     except KeyboardInterrupt:
         print("\n사용자에 의해 중단되었습니다.")
+        if automation and automation.result_sink and automation.result_sink.count:
+            print(f"처리된 {automation.result_sink.count}개 상품은 {automation.result_sink.path} 에 기록되어 있습니다. "
+                  f"(엑셀 변환: --results-to-excel {automation.result_sink.path})")
     except Exception as e:
         print(f"예상치 못한 오류: {e}")
         import traceback
         traceback.print_exc()
     finally:
         if automation:
+            automation.waiter.print_summary()
+            automation.selectors.print_summary()
+            automation.profile_monitor.print_summary()
+            export_traces(args, automation.tracer)
+            if automation.command_profiler:
+                automation.command_profiler.print_summary(automation.products_processed)
             automation.close()
 
 if __name__ == "__main__":
     print("필요한 라이브러리:")
-    print("  pip install selenium pandas openpyxl")
+    print("  pip install selenium openpyxl")
+    print("선택 라이브러리 (HTTP 단축 / 메모리 측정 / lxml 추출 / Parquet 저장 / 실행 기록 분석):")
+    print("  pip install requests psutil lxml cssselect pyarrow pandas")
     print("=" * 60)
     main()
\ No newline at end of file
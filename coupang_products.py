@@ -0,0 +1,522 @@
+"""
+상품 URL/가격/결과 레코드 공통 모듈
+
+coupang-auto.py 와 오프라인 도구(analyze_results.py 등)가 함께 쓰는 순수 함수와 데이터 타입.
+selenium 없이 import 할 수 있고, 벡터 연산 함수(normalize_prices, product_keys)만 pandas 가 필요하다.
+"""
+import enum
+import json
+import os
+import re
+import threading
+from collections import Counter
+from dataclasses import dataclass, fields
+from datetime import datetime
+from typing import Optional
+from urllib.parse import parse_qs, urlparse
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+EXPORT_TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+PRICE_NUMBER_RE = re.compile(r'\d[\d,]*')
+# 가격 문자열에서 실제 가격이 아닌 금액
+# (단위 가격, 할인율, '할인 2,000원'/'쿠폰 1,000원'/'캐시적립 500원'/'배송비 2,500원' 처럼 라벨 뒤 금액,
+#  '645원 적립'/'2,000원 할인' 처럼 라벨 앞 금액. '할인가'/'쿠폰할인가' 는 가격 라벨이므로 남김)
+PRICE_NOISE_RE = re.compile(
+    r'\([^)]*당[^)]*\)'
+    r'|\d+(?:\.\d+)?\s*%'
+    r'|(?:할인|쿠폰|적립|캐시|배송비)(?!가)[\s:]*(?:금액|최대)?[\s:]*₩?\s*\d[\d,]*\s*원?'
+    r'|(?:최대\s*)?\d[\d,]*\s*원\s*(?:적립|할인)(?!가)'
+)
+# 원화 금액 ('12,900원', '₩12,900')
+WON_AMOUNT_RE = re.compile(r'₩\s*(?P<sign>\d[\d,]*)|(?P<suffix>\d[\d,]*)\s*원')
+
+# 상품 식별자 추출용 정규식
+PRODUCT_PATH_ID_RE = re.compile(r'/(?:vp/)?products/(\d+)')
+
+
+PRODUCT_ID_PARAMS = ('productId', 'itemId', 'vendorItemId')
+
+
+def parse_product_url(url):
+    """
+    상품 URL / 링크 생성 페이지 URL 에서 상품 식별자와 추적 파라미터 추출 (DOM 접근 없음)
+    
+    쿼리 문자열과 해시(#...?...) 뒤의 쿼리, /vp/products/{id} 경로를 모두 확인한다.
+    
+    Args:
+        url (str): 상품 URL 또는 링크 생성 페이지 URL
+    
+    Returns:
+        dict: {'url', 'productId', 'itemId', 'vendorItemId', 'tracking', 'is_link_generation', 'key'}
+            (없는 식별자는 빈 문자열, tracking 은 식별자 외 나머지 파라미터)
+    """
+    info = {
+        'url': url or '',
+        'productId': '',
+        'itemId': '',
+        'vendorItemId': '',
+        'tracking': {},
+        'is_link_generation': False,
+        'key': None
+    }
+    if not url:
+        return info
+    
+    parsed = urlparse(url)
+    params = parse_qs(parsed.query)
+    fragment_path = parsed.fragment
+    if '?' in parsed.fragment:
+        fragment_path, fragment_query = parsed.fragment.split('?', 1)
+        for key, values in parse_qs(fragment_query).items():
+            params.setdefault(key, values)
+    
+    for key, values in params.items():
+        value = values[0] if values else ''
+        if key in PRODUCT_ID_PARAMS:
+            info[key] = value
+        else:
+            info['tracking'][key] = value
+    
+    if not info['productId']:
+        match = PRODUCT_PATH_ID_RE.search(parsed.path) or PRODUCT_PATH_ID_RE.search(fragment_path)
+        if match:
+            info['productId'] = match.group(1)
+    
+    info['is_link_generation'] = 'linkgeneration' in parsed.path or 'linkgeneration' in fragment_path
+    if info['productId'] or info['itemId'] or info['vendorItemId']:
+        info['key'] = f"{info['productId']}:{info['itemId']}:{info['vendorItemId']}"
+    
+    return info
+
+
+def parse_product_urls(urls, dedup=False):
+    """
+    여러 URL 을 한 번에 파싱
+    
+    Args:
+        urls (iterable): URL 목록
+        dedup (bool): 같은 상품(식별 키)이 여러 번 나오면 첫 번째만 남길지 여부
+    
+    Returns:
+        list: parse_product_url 결과 리스트
+    """
+    results = []
+    seen = set()
+    for url in urls:
+        info = parse_product_url(url)
+        if dedup and info['key']:
+            if info['key'] in seen:
+                continue
+            seen.add(info['key'])
+        results.append(info)
+    return results
+
+
+SHORT_URL_RE = re.compile(r'https://link\.coupang\.com/[^\s"\'<>\\]+')
+
+
+def find_short_url(text):
+    """
+    텍스트(HTML, JSON 응답 등)에서 첫 번째 link.coupang.com 단축 URL 찾기
+    
+    Returns:
+        str: 단축 URL (없으면 None)
+    """
+    if not text:
+        return None
+    match = SHORT_URL_RE.search(text.replace('\\/', '/'))
+    return match.group(0) if match else None
+
+
+def product_identity_key(url):
+    """
+    상품 URL의 식별 키 (캐시/중복 제거용)
+    
+    Returns:
+        str: 'productId:itemId:vendorItemId' 형식의 키 (식별자가 없으면 None)
+    """
+    return parse_product_url(url)['key']
+
+
+# 상품 식별 파라미터 값 (쿼리 또는 해시 경로 뒤 쿼리, 빈 값 제외)
+PRODUCT_ID_PARAM_PATTERNS = {param: rf'[?&]{param}=([^&#]+)' for param in PRODUCT_ID_PARAMS}
+# 경로의 상품 번호 (URL 경로, 해시 경로 순)
+PRODUCT_PATH_ID_PATTERNS = (r'^[^?#]*/(?:vp/)?products/(\d+)', r'#[^?]*?/(?:vp/)?products/(\d+)')
+
+
+def require_pandas():
+    """pandas 가 없으면 RuntimeError"""
+    if pd is None:
+        raise RuntimeError("pandas 라이브러리가 필요합니다: pip install pandas")
+
+
+def product_keys(urls):
+    """
+    여러 상품 URL 의 식별 키를 한 번에 계산 (pandas 벡터 연산, product_identity_key 와 같은 키)
+    
+    URL 마다 urlparse/parse_qs 를 돌리지 않으므로 실행마다 추적 파라미터가 달라
+    고유 URL 이 수백만 개인 기록에서도 몇 초 안에 끝난다.
+    
+    Args:
+        urls (iterable|pd.Series): 상품 URL
+    
+    Returns:
+        pd.Series: 'productId:itemId:vendorItemId' 키 (식별자가 없으면 <NA>, Series 를 주면 같은 인덱스)
+    """
+    require_pandas()
+    if not isinstance(urls, pd.Series):
+        urls = pd.Series(list(urls), dtype='object')
+    urls = urls.fillna('').astype(str)
+    
+    ids = {param: urls.str.extract(pattern, expand=False)
+           for param, pattern in PRODUCT_ID_PARAM_PATTERNS.items()}
+    for pattern in PRODUCT_PATH_ID_PATTERNS:
+        ids['productId'] = ids['productId'].fillna(urls.str.extract(pattern, expand=False))
+    
+    found = ids['productId'].notna() | ids['itemId'].notna() | ids['vendorItemId'].notna()
+    keys = ids['productId'].fillna('') + ':' + ids['itemId'].fillna('') + ':' + ids['vendorItemId'].fillna('')
+    return keys.where(found, pd.NA)
+
+
+class ProductStatus(enum.Enum):
+    """상품 단축 URL 생성 상태 (값은 화면/엑셀 표시용 이름)"""
+    PENDING = '대기'
+    SUCCESS = '성공'
+    FAILED = '실패'
+    NO_URL = 'URL 없음'
+    ERROR = '오류'
+
+
+@dataclass(slots=True)
+class Product:
+    """
+    상품 한 개의 추출 정보와 단축 URL 생성 결과
+    
+    배치 전체에서 수십만 개를 보관하므로 딕셔너리 대신 __slots__ 데이터클래스를 쓴다.
+    성공/실패는 status 로, 실패 사유는 error 로 기록하고 short_url 에는 단축 URL 만 둔다.
+    """
+    rank: int = 0
+    name: str = ''
+    price: Optional[int] = None
+    price_text: str = ''
+    product_url: str = ''
+    image_url: str = ''
+    short_url: str = ''
+    deep_link: str = ''
+    link_generation_url: str = ''
+    keyword: str = ''
+    status: ProductStatus = ProductStatus.PENDING
+    error: str = ''
+    created_at: str = ''
+
+    @classmethod
+    def from_item(cls, item, keyword=''):
+        """
+        추출 결과 딕셔너리(일괄 추출/lxml/요소별 추출)로 생성
+        
+        Args:
+            item (dict): rank, name, price(카드 문자열), product_url, image_url
+            keyword (str): 검색 키워드
+        """
+        price_text = item.get('price') or ''
+        return cls(
+            rank=item.get('rank') or 0,
+            name=item.get('name') or '',
+            price=parse_price(price_text),
+            price_text=price_text,
+            product_url=item.get('product_url') or '',
+            image_url=item.get('image_url') or '',
+            keyword=keyword
+        )
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        to_dict 결과(결과 기록, 체크포인트)로 생성
+        
+        상태 필드가 없는 이전 형식 기록은 단축 URL 로 성공 여부를 판단하고,
+        short_url 에 들어 있던 실패 문구는 error 로 옮긴다.
+        """
+        values = {field.name: data[field.name] for field in fields(cls) if field.name in data}
+        price = values.get('price')
+        if isinstance(price, str):
+            values['price'] = parse_price(price)
+            if values['price'] is not None:
+                values['price_text'] = values.get('price_text') or price
+        
+        if 'status' in data:
+            values['status'] = ProductStatus[data['status']]
+        else:
+            short_url = data.get('short_url') or ''
+            if short_url.startswith('http'):
+                values['status'] = ProductStatus.SUCCESS
+            else:
+                values['status'] = ProductStatus.FAILED
+                values['short_url'] = ''
+                values['error'] = short_url
+        
+        values['created_at'] = values.get('created_at') or data.get('recorded_at') or ''
+        return cls(**values)
+
+    def to_dict(self):
+        """JSON 저장용 딕셔너리 (status 는 이름)"""
+        data = {field.name: getattr(self, field.name) for field in fields(self)}
+        data['status'] = self.status.name
+        return data
+
+    @property
+    def ok(self):
+        """단축 URL 생성 성공 여부"""
+        return self.status is ProductStatus.SUCCESS
+
+    @property
+    def display_price(self):
+        """표시용 가격 (카드에 표시된 문자열 우선)"""
+        if self.price_text:
+            return self.price_text
+        return f"{self.price:,}원" if self.price is not None else '가격정보없음'
+
+    def resolve(self, short_url, error='', deep_link=''):
+        """
+        단축 URL 생성 결과 기록 (short_url 이 없으면 error 사유로 실패 처리)
+        
+        Args:
+            short_url (str): 단축 URL (실패 시 None)
+            error (str): 실패 사유
+            deep_link (str): 딥링크
+        """
+        if short_url:
+            self.short_url = short_url
+            self.deep_link = deep_link or ''
+            self.status = ProductStatus.SUCCESS
+            self.error = ''
+            self.created_at = datetime.now().strftime(EXPORT_TIME_FORMAT)
+        else:
+            self.fail(error or '단축 URL 생성 실패')
+
+    def fail(self, error, status=ProductStatus.FAILED):
+        """
+        실패 기록
+        
+        Args:
+            error (str): 실패 사유
+            status (ProductStatus): 실패 상태 (FAILED / NO_URL / ERROR)
+        """
+        self.short_url = ''
+        self.deep_link = ''
+        self.status = status
+        self.error = error
+        self.created_at = datetime.now().strftime(EXPORT_TIME_FORMAT)
+
+
+def count_statuses(products):
+    """
+    상태별 상품 수
+    
+    Returns:
+        Counter: {ProductStatus: 개수}
+    """
+    return Counter(product.status for product in products)
+
+
+def format_status_counts(counts):
+    """상태별 개수를 '성공 8 / 실패 2' 형식으로 (개수가 있는 상태만)"""
+    return ' / '.join(f"{status.value} {counts[status]}" for status in ProductStatus if counts[status])
+
+
+def parse_price(price):
+    """
+    가격 문자열 하나를 정수로 변환 (normalize_prices 와 같은 규칙)
+    
+    단위 가격/할인율과 할인·쿠폰·적립·배송비 금액(PRICE_NOISE_RE)을 지운 뒤 남은 원화 금액 중 가장 작은 값
+    (정가와 할인가·쿠폰가가 함께 있으면 최종 가격)을 쓰고, 원화 표기가 없으면 첫 숫자를 쓴다.
+    ('정가 15,000원 12,900원' -> 12900, '가격정보없음' -> None)
+    
+    Args:
+        price (str|int): 가격
+    
+    Returns:
+        int: 가격 (숫자가 없으면 None)
+    """
+    if isinstance(price, int):
+        return price
+    text = PRICE_NOISE_RE.sub(' ', price or '')
+    amounts = [int(value.replace(',', '')) for match in WON_AMOUNT_RE.finditer(text)
+               for value in [match.group('sign') or match.group('suffix')]]
+    if amounts:
+        return min(amounts)
+    match = PRICE_NUMBER_RE.search(text)
+    return int(match.group().replace(',', '')) if match else None
+
+
+def normalize_prices(texts):
+    """
+    가격 문자열을 한 번에 정수로 변환 (pandas 벡터 연산, parse_price 와 같은 규칙)
+    
+    상품마다 정규식을 돌리지 않고 배치 전체(또는 수백만 행의 실행 기록)를 문자열 연산 몇 번으로 처리한다.
+    
+    Args:
+        texts (iterable|pd.Series): 가격 문자열 (숫자 값도 가능)
+    
+    Returns:
+        pd.Series: 'price' 이름의 Int64 가격 (숫자가 없으면 <NA>, Series 를 주면 같은 인덱스)
+    """
+    require_pandas()
+    index = texts.index if isinstance(texts, pd.Series) else None
+    texts = pd.Series(list(texts) if index is None else texts.to_numpy(), dtype='object')
+    cleaned = texts.fillna('').astype(str).str.replace(PRICE_NOISE_RE.pattern, ' ', regex=True)
+    
+    prices = pd.Series(pd.NA, index=cleaned.index, dtype='Int64')
+    amounts = cleaned.str.extractall(WON_AMOUNT_RE.pattern)
+    if not amounts.empty:
+        values = amounts['sign'].fillna(amounts['suffix']).str.replace(',', '', regex=False)
+        values = pd.to_numeric(values, errors='coerce')
+        prices = values.groupby(level=0).min().reindex(cleaned.index).astype('Int64')
+    
+    missing = prices.isna()
+    if missing.any():
+        fallback = cleaned[missing].str.extract(f'({PRICE_NUMBER_RE.pattern})', expand=False)
+        prices[missing] = pd.to_numeric(fallback.str.replace(',', '', regex=False), errors='coerce').astype('Int64')
+    
+    if index is not None:
+        prices.index = index
+    return prices.rename('price')
+
+
+def products_from_items(items, keyword=''):
+    """
+    추출 결과 딕셔너리 리스트를 Product 리스트로 변환 (가격은 normalize_prices 로 일괄 변환)
+    
+    Args:
+        items (list): rank, name, price(카드 문자열), product_url, image_url
+        keyword (str): 검색 키워드
+    
+    Returns:
+        list: Product 리스트
+    """
+    products = [
+        Product(
+            rank=item.get('rank') or 0,
+            name=item.get('name') or '',
+            price_text=item.get('price') or '',
+            product_url=item.get('product_url') or '',
+            image_url=item.get('image_url') or '',
+            keyword=keyword
+        )
+        for item in items
+    ]
+    if products:
+        prices = normalize_prices([product.price_text for product in products])
+        for product, price in zip(products, prices):
+            product.price = None if pd.isna(price) else int(price)
+    return products
+
+
+class ResultSink:
+    """
+    상품별 결과 추가 기록 저장소 (JSON Lines)
+    
+    단축 URL 이 정해지는 즉시 상품 한 줄을 파일 끝에 추가하고 디스크에 반영(fsync)한다.
+    예외나 Ctrl-C 로 중간에 종료되어도 이미 처리한 상품은 남고, 엑셀 등 결과 파일은
+    이 기록을 변환해 만든다. 마지막 줄이 쓰다 만 상태로 남아도 읽을 때 건너뛴다.
+    워커 풀에서는 저장소 하나를 모든 워커가 공유하고, 줄 단위 쓰기는 잠금으로 직렬화한다.
+    """
+
+    def __init__(self, path="results.jsonl", run_id=None):
+        """
+        Args:
+            path (str): 기록 파일 경로 (여러 실행이 같은 파일에 이어서 기록)
+            run_id (str): 실행 식별자 (None 이면 현재 시각)
+        """
+        self.path = path
+        self.run_id = run_id or datetime.now().strftime('%Y%m%d_%H%M%S')
+        self.count = 0
+        self.keyword_counts = Counter()
+        self.lock = threading.Lock()
+        
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self.file = open(path, 'a', encoding='utf-8')
+
+    def write(self, product, keyword=None):
+        """
+        상품 결과 한 줄 추가
+        
+        Args:
+            product (Product): 상품
+            keyword (str): 검색 키워드 (상품에 없을 때 사용)
+        """
+        if keyword and not product.keyword:
+            product.keyword = keyword
+        if not product.created_at:
+            product.created_at = datetime.now().strftime(EXPORT_TIME_FORMAT)
+        record = {'run_id': self.run_id}
+        record.update(product.to_dict())
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        
+        with self.lock:
+            self.file.write(line)
+            self.file.flush()
+            os.fsync(self.file.fileno())
+            self.count += 1
+            self.keyword_counts[product.keyword] += 1
+
+    def records(self, keyword=None):
+        """
+        이번 실행의 기록 (keyword 를 주면 해당 키워드만)
+        
+        Yields:
+            Product: 상품
+        """
+        with self.lock:
+            self.file.flush()
+        return self.read_products(self.path, self.run_id, keyword)
+
+    @staticmethod
+    def read(path, run_id=None, keyword=None):
+        """
+        기록 파일 읽기 (깨진 줄은 건너뜀)
+        
+        Args:
+            path (str): 기록 파일 경로
+            run_id (str): 실행 식별자 (None 이면 전체)
+            keyword (str): 키워드 (None 이면 전체)
+        
+        Yields:
+            dict: 상품 기록
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if run_id is not None and record.get('run_id') != run_id:
+                    continue
+                if keyword is not None and record.get('keyword') != keyword:
+                    continue
+                yield record
+
+    @staticmethod
+    def read_products(path, run_id=None, keyword=None):
+        """read 와 같은 조건으로 읽어 Product 로 변환"""
+        for record in ResultSink.read(path, run_id, keyword):
+            yield Product.from_dict(record)
+
+    @staticmethod
+    def latest_run_id(path):
+        """기록 파일의 마지막 실행 식별자"""
+        run_id = None
+        for record in ResultSink.read(path):
+            run_id = record.get('run_id', run_id)
+        return run_id
+
+    def close(self):
+        """파일 닫기"""
+        with self.lock:
+            if not self.file.closed:
+                self.file.close()
@@ -0,0 +1,363 @@
+"""
+쿠팡 파트너스 제휴 워크스페이스 모의 사이트
+
+벤치마크와 오프라인 확인용 로컬 HTTP 서버.
+coupang-auto.py 가 다루는 DOM(검색 입력창/검색 버튼, 상품 카드와 호버 시 나타나는 링크 생성 버튼,
+#affiliate/ws/linkgeneration 경로의 단축 URL 영역과 생성 버튼)과 단축 URL API 를 흉내 낸다.
+화면 렌더링과 API 응답 지연은 설정할 수 있다.
+
+단축 URL 은 상품 식별자로 결정되므로(short_url_for) 결과가 맞는 상품의 것인지 확인할 수 있다.
+
+사용법:
+    python mock_partners_site.py --port 8765 --render-delay 0.2 --api-delay 0.1
+"""
+import argparse
+import hashlib
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+# 1x1 투명 PNG (상품 이미지)
+PRODUCT_IMAGE_PNG = bytes.fromhex(
+    "89504e470d0a1a0a0000000d4948445200000001000000010806000000"
+    "1f15c4890000000d49444154789c6360000002000001e221bc330000000049454e44ae426082"
+)
+
+WORKSPACE_HTML = r"""<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="utf-8">
+<title>쿠팡 파트너스 (모의)</title>
+<style>
+body { font-family: sans-serif; margin: 0; padding: 20px; }
+.search-bar { margin-bottom: 20px; }
+.ant-input.ant-input-lg { width: 400px; height: 40px; font-size: 16px; }
+.search-product { display: inline-block; width: 220px; height: 260px; margin: 8px; padding: 8px;
+                  border: 1px solid #ddd; vertical-align: top; position: relative; }
+.search-product img { width: 120px; height: 120px; }
+.search-product .btn-generate-link { display: none; position: absolute; bottom: 8px; left: 8px; }
+.search-product:hover .btn-generate-link { display: inline-block; }
+.shorten-url-wrapper { margin: 20px 0; }
+.shorten-url-input { min-height: 24px; padding: 8px; border: 1px solid #ccc; width: 480px; }
+</style>
+<script>window.MOCK_CONFIG = __CONFIG__;</script>
+</head>
+<body>
+<div id="app"></div>
+<script>
+(function () {
+    var config = window.MOCK_CONFIG;
+    var app = document.getElementById('app');
+    var renderToken = 0;
+
+    function parseHash() {
+        var hash = location.hash.replace(/^#/, '');
+        var parts = hash.split('?');
+        var params = {};
+        (parts[1] || '').split('&').forEach(function (pair) {
+            if (!pair) { return; }
+            var kv = pair.split('=');
+            params[decodeURIComponent(kv[0])] = decodeURIComponent((kv[1] || '').replace(/\+/g, ' '));
+        });
+        return {path: parts[0], params: params};
+    }
+
+    function escapeHtml(text) {
+        return String(text).replace(/[&<>"]/g, function (c) {
+            return {'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;'}[c];
+        });
+    }
+
+    function later(fn) {
+        var token = ++renderToken;
+        setTimeout(function () { if (token === renderToken) { fn(); } }, config.render_delay * 1000);
+    }
+
+    function renderSearchBar(keyword) {
+        return '<div class="search-bar">' +
+            '<input class="ant-input ant-input-lg" placeholder="상품명 검색" value="' + escapeHtml(keyword || '') + '">' +
+            '<button class="ant-btn search-button" type="button">검색</button>' +
+            '</div><div class="search-results"></div>';
+    }
+
+    function bindSearch() {
+        var input = app.querySelector('.ant-input');
+        function submit() {
+            location.hash = '#affiliate/ws/search?keyword=' + encodeURIComponent(input.value);
+        }
+        app.querySelector('.search-button').addEventListener('click', submit);
+        input.addEventListener('keydown', function (e) { if (e.key === 'Enter') { submit(); } });
+    }
+
+    function renderWorkspace() {
+        app.innerHTML = '';
+        later(function () { app.innerHTML = renderSearchBar(''); bindSearch(); });
+    }
+
+    function renderResults(keyword) {
+        app.innerHTML = renderSearchBar(keyword);
+        bindSearch();
+        var token = renderToken;
+        fetch('/api/search?keyword=' + encodeURIComponent(keyword))
+            .then(function (r) { return r.json(); })
+            .then(function (data) {
+                later(function () {
+                    var html = data.products.map(function (p) {
+                        return '<div class="search-product" data-testid="product-item">' +
+                            '<img src="/static/product.png" alt="">' +
+                            '<div class="product-name">' + escapeHtml(p.name) + '</div>' +
+                            '<div class="price">' + escapeHtml(p.price) + '</div>' +
+                            '<a class="product-link" href="' + p.product_url + '">상품 보기</a>' +
+                            '<button class="ant-btn hover-btn btn-generate-link" type="button"' +
+                            ' data-link="' + escapeHtml(p.link_generation_hash) + '">링크 생성</button>' +
+                            '</div>';
+                    }).join('');
+                    app.querySelector('.search-results').innerHTML = html;
+                    app.querySelectorAll('.btn-generate-link').forEach(function (button) {
+                        button.addEventListener('click', function () {
+                            location.hash = button.getAttribute('data-link');
+                        });
+                    });
+                });
+            });
+    }
+
+    function renderLinkGeneration(params) {
+        app.innerHTML = '';
+        later(function () {
+            app.innerHTML = '<div class="link-generation">' +
+                '<div class="product-name">상품 ' + escapeHtml(params.productId || '') + '</div>' +
+                '<div class="shorten-url-wrapper"><div class="unselectable-input shorten-url-input large"></div></div>' +
+                '<div class="shorten-url-controls">' +
+                '<button class="ant-btn lg shorten-url-controls-main" type="button">단축 URL 생성</button>' +
+                '</div></div>';
+            app.querySelector('.shorten-url-controls-main').addEventListener('click', function () {
+                fetch('/api/shorten', {
+                    method: 'POST',
+                    headers: {'Content-Type': 'application/json'},
+                    body: JSON.stringify({
+                        productId: params.productId || '',
+                        itemId: params.itemId || '',
+                        vendorItemId: params.vendorItemId || ''
+                    })
+                }).then(function (r) { return r.json(); }).then(function (data) {
+                    var target = app.querySelector('.shorten-url-input');
+                    if (target) { target.textContent = data.shortUrl; }
+                });
+            });
+        });
+    }
+
+    function route() {
+        var hash = parseHash();
+        if (hash.path.indexOf('linkgeneration') !== -1) {
+            renderLinkGeneration(hash.params);
+        } else if (hash.path.indexOf('affiliate/ws/search') === 0 && hash.params.keyword) {
+            renderResults(hash.params.keyword);
+        } else {
+            renderWorkspace();
+        }
+    }
+
+    window.addEventListener('hashchange', route);
+    route();
+})();
+</script>
+</body>
+</html>
+"""
+
+PRODUCT_PAGE_HTML = r"""<!DOCTYPE html>
+<html lang="ko">
+<head><meta charset="utf-8"><title>상품 __PRODUCT_ID__ (모의)</title></head>
+<body>
+<img src="/static/product.png" alt="">
+<h3 class="product-name">모의 상품 __PRODUCT_ID__</h3>
+<button class="ant-btn hover-btn btn-generate-link" type="button"
+        onclick="location.href='/#__LINK_HASH__'">링크 생성</button>
+</body>
+</html>
+"""
+
+
+def product_ids(keyword, rank):
+    """키워드와 순위로 정해지는 모의 상품 식별자"""
+    digest = hashlib.sha1(f"{keyword}:{rank}".encode('utf-8')).hexdigest()
+    number = int(digest[:12], 16)
+    return {
+        'productId': str(1000000 + number % 9000000),
+        'itemId': str(10000000 + number % 90000000),
+        'vendorItemId': str(70000000000 + number % 9000000000)
+    }
+
+
+def short_url_for(product_id, item_id='', vendor_item_id=''):
+    """상품 식별자로 정해지는 모의 단축 URL"""
+    digest = hashlib.sha1(f"{product_id}:{item_id}:{vendor_item_id}".encode('utf-8')).hexdigest()
+    return f"https://link.coupang.com/a/{digest[:8]}"
+
+
+def link_generation_hash(ids):
+    return (f"affiliate/ws/linkgeneration?productId={ids['productId']}"
+            f"&itemId={ids['itemId']}&vendorItemId={ids['vendorItemId']}")
+
+
+class MockPartnersHandler(BaseHTTPRequestHandler):
+    """모의 사이트 요청 처리 (설정은 self.server.config)"""
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, body, content_type):
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, data):
+        self._send(200, json.dumps(data, ensure_ascii=False), 'application/json; charset=utf-8')
+
+    def do_GET(self):
+        config = self.server.config
+        parsed = urlparse(self.path)
+        path = parsed.path
+
+        if path in ('/', '/index.html'):
+            html = WORKSPACE_HTML.replace('__CONFIG__', json.dumps(config))
+            self._send(200, html, 'text/html; charset=utf-8')
+        elif path == '/api/search':
+            time.sleep(config['search_delay'])
+            keyword = parse_qs(parsed.query).get('keyword', [''])[0]
+            self._send_json({'products': self.server.search(keyword)})
+        elif path.startswith('/vp/products/'):
+            params = parse_qs(parsed.query)
+            ids = {
+                'productId': path.rsplit('/', 1)[-1],
+                'itemId': params.get('itemId', [''])[0],
+                'vendorItemId': params.get('vendorItemId', [''])[0]
+            }
+            html = (PRODUCT_PAGE_HTML.replace('__PRODUCT_ID__', ids['productId'])
+                    .replace('__LINK_HASH__', link_generation_hash(ids)))
+            self._send(200, html, 'text/html; charset=utf-8')
+        elif path == '/static/product.png':
+            self._send(200, PRODUCT_IMAGE_PNG, 'image/png')
+        else:
+            self._send(404, 'not found', 'text/plain; charset=utf-8')
+
+    def do_POST(self):
+        config = self.server.config
+        if urlparse(self.path).path != '/api/shorten':
+            self._send(404, 'not found', 'text/plain; charset=utf-8')
+            return
+
+        length = int(self.headers.get('Content-Length') or 0)
+        try:
+            payload = json.loads(self.rfile.read(length) or b'{}')
+        except ValueError:
+            payload = {}
+
+        time.sleep(config['api_delay'])
+        self.server.record_shorten()
+        self._send_json({
+            'shortUrl': short_url_for(payload.get('productId', ''), payload.get('itemId', ''),
+                                      payload.get('vendorItemId', ''))
+        })
+
+
+class MockPartnersServer(ThreadingHTTPServer):
+    """
+    모의 제휴 워크스페이스 서버
+
+    start() 로 백그라운드 스레드에서 실행하고 base_url / target_url 을 자동화 클래스에 넘긴다.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, host="127.0.0.1", port=0, render_delay=0.2, search_delay=0.3,
+                 api_delay=0.1, product_count=20):
+        """
+        Args:
+            host (str): 바인드 주소
+            port (int): 포트 (0 이면 빈 포트 자동 선택)
+            render_delay (float): 화면(워크스페이스/검색 결과/링크 생성 페이지) 렌더링 지연(초)
+            search_delay (float): 검색 API 응답 지연(초)
+            api_delay (float): 단축 URL API 응답 지연(초)
+            product_count (int): 검색 결과 상품 수
+        """
+        super().__init__((host, port), MockPartnersHandler)
+        self.config = {
+            'render_delay': render_delay,
+            'search_delay': search_delay,
+            'api_delay': api_delay,
+            'product_count': product_count
+        }
+        self.shorten_calls = 0
+        self._lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def target_url(self):
+        return f"{self.base_url}/#affiliate/ws"
+
+    def search(self, keyword):
+        """키워드 검색 결과 (키워드와 순위로 결정되는 모의 상품)"""
+        products = []
+        for rank in range(1, self.config['product_count'] + 1):
+            ids = product_ids(keyword, rank)
+            products.append({
+                'rank': rank,
+                'name': f"{keyword} 모의 상품 {rank}호 고급형",
+                'price': f"{(rank * 1370 + 9900):,}원",
+                'product_url': (f"{self.base_url}/vp/products/{ids['productId']}"
+                                f"?itemId={ids['itemId']}&vendorItemId={ids['vendorItemId']}"),
+                'link_generation_hash': '#' + link_generation_hash(ids),
+                'short_url': short_url_for(ids['productId'], ids['itemId'], ids['vendorItemId'])
+            })
+        return products
+
+    def record_shorten(self):
+        with self._lock:
+            self.shorten_calls += 1
+
+    def start(self):
+        """백그라운드 스레드에서 서버 시작"""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """서버 종료"""
+        self.shutdown()
+        self.server_close()
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="쿠팡 파트너스 제휴 워크스페이스 모의 사이트")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--render-delay", type=float, default=0.2, help="화면 렌더링 지연(초)")
+    parser.add_argument("--search-delay", type=float, default=0.3, help="검색 API 지연(초)")
+    parser.add_argument("--api-delay", type=float, default=0.1, help="단축 URL API 지연(초)")
+    parser.add_argument("--products", type=int, default=20, help="검색 결과 상품 수")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    server = MockPartnersServer(args.host, args.port, args.render_delay, args.search_delay,
+                                args.api_delay, args.products)
+    print(f"모의 사이트 실행 중: {server.target_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
@@ -0,0 +1,119 @@
+"""
+저장된 HTML 스냅샷으로 추출 규칙 재생 검증
+
+coupang-auto.py 를 --snapshot-dir 옵션으로 실행해 저장한 검색 결과/링크 생성 페이지 HTML 에
+브라우저 없이 lxml 추출 엔진(LxmlExtractor)을 적용하고, 실제 실행에서 얻은 결과와 비교해
+정확도와 처리 속도를 출력한다. 셀렉터나 추출 규칙을 바꾼 뒤 수천 페이지를 몇 초 안에 확인할 수 있다.
+
+사용법:
+    python replay_snapshots.py snapshots
+    python replay_snapshots.py snapshots --show-mismatches 20
+"""
+import argparse
+import time
+
+from benchmark import load_automation_module
+
+
+def compare_products(expected, actual):
+    """
+    상품 목록 비교
+
+    Returns:
+        tuple: (일치한 상품 수, 불일치 설명 리스트)
+    """
+    matched, mismatches = 0, []
+    for index, expected_product in enumerate(expected):
+        actual_product = actual[index] if index < len(actual) else {}
+        diffs = [key for key in ('name', 'product_url', 'price')
+                 if (expected_product.get(key) or '') != (actual_product.get(key) or '')]
+        if diffs:
+            mismatches.append(f"{index + 1}위 {', '.join(diffs)} 불일치: "
+                              f"{expected_product.get('name', '')[:30]!r} / {actual_product.get('name', '')[:30]!r}")
+        else:
+            matched += 1
+    return matched, mismatches
+
+
+def replay(root_dir, module):
+    """
+    스냅샷 전체 재생
+
+    Returns:
+        dict: 재생 결과 통계
+    """
+    extractor = module.LxmlExtractor()
+    stats = {
+        'pages': 0, 'seconds': 0.0,
+        'search_pages': 0, 'products': 0, 'products_matched': 0,
+        'link_pages': 0, 'short_urls_matched': 0,
+        'mismatches': []
+    }
+
+    for record, path in module.SnapshotRecorder.iter_snapshots(root_dir):
+        with open(path, 'r', encoding='utf-8') as f:
+            html_text = f.read()
+
+        expected = record.get('expected')
+        start = time.perf_counter()
+        if record['kind'] == 'search_results':
+            # 이름 없는 카드도 순번을 차지하므로 기대값 개수가 아니라 카드 전체를 추출해 앞에서부터 비교
+            result = extractor.extract_products(html_text, None, base_url=record.get('url'))
+        else:
+            result = extractor.extract_short_url(html_text)
+        stats['seconds'] += time.perf_counter() - start
+        stats['pages'] += 1
+
+        if record['kind'] == 'search_results':
+            stats['search_pages'] += 1
+            if expected:
+                matched, mismatches = compare_products(expected, result['products'])
+                stats['products'] += len(expected)
+                stats['products_matched'] += matched
+                stats['mismatches'].extend(f"{record['file']}: {message}" for message in mismatches)
+        else:
+            stats['link_pages'] += 1
+            actual_url = result['url'] if result else None
+            if actual_url == expected:
+                stats['short_urls_matched'] += 1
+            else:
+                stats['mismatches'].append(f"{record['file']}: 단축 URL {expected!r} / {actual_url!r}")
+
+    return stats
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="저장된 HTML 스냅샷으로 추출 규칙 재생 검증")
+    parser.add_argument("snapshot_dir", help="coupang-auto.py --snapshot-dir 로 저장한 디렉터리")
+    parser.add_argument("--show-mismatches", type=int, default=10, help="출력할 불일치 항목 수")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    module = load_automation_module()
+    if not module.LxmlExtractor.available():
+        print("lxml 라이브러리가 필요합니다: pip install lxml cssselect")
+        return
+
+    stats = replay(args.snapshot_dir, module)
+    if not stats['pages']:
+        print(f"스냅샷이 없습니다: {args.snapshot_dir}")
+        return
+
+    print("\n=== 스냅샷 재생 결과 ===")
+    print(f"  페이지: {stats['pages']}개, 합계 {stats['seconds']:.2f}s "
+          f"({stats['pages'] / stats['seconds']:.0f} 페이지/초)" if stats['seconds'] else f"  페이지: {stats['pages']}개")
+    if stats['products']:
+        print(f"  검색 결과 {stats['search_pages']}페이지: 상품 {stats['products_matched']}/{stats['products']}개 일치")
+    if stats['link_pages']:
+        print(f"  링크 생성 {stats['link_pages']}페이지: 단축 URL {stats['short_urls_matched']}/{stats['link_pages']}개 일치")
+
+    if stats['mismatches']:
+        print(f"\n  불일치 {len(stats['mismatches'])}건 (상위 {args.show_mismatches}건)")
+        for message in stats['mismatches'][:args.show_mismatches]:
+            print(f"    {message}")
+
+
+if __name__ == "__main__":
+    main()
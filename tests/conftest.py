@@ -0,0 +1,73 @@
+import os
+import sys
+
+import pytest
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+
+@pytest.fixture(scope="session")
+def automation_module():
+    """coupang-auto.py 모듈 (selenium/openpyxl 이 없으면 건너뜀)"""
+    for name in ("selenium", "openpyxl"):
+        pytest.importorskip(name)
+    from benchmark import load_automation_module
+    return load_automation_module()
+
+
+class FakeDriver:
+    """current_url 과 page_source 만 있는 WebDriver 대역"""
+
+    def __init__(self, current_url="", page_source=""):
+        self.current_url = current_url
+        self.page_source = page_source
+
+    def find_elements(self, by, value):
+        return []
+
+
+class FakeShortener:
+    """ShortLinkHttpClient 대역 (상품 URL 마다 정해진 단축 URL 반환)"""
+
+    def __init__(self, short_url="https://link.coupang.com/a/test"):
+        self.short_url = short_url
+        self.calls = []
+
+    def shorten(self, product_url):
+        self.calls.append(product_url)
+        return self.short_url
+
+
+class NullWaiter:
+    def pause(self, seconds, label):
+        pass
+
+    def until(self, condition, label, timeout=None, **kwargs):
+        return condition(None)
+
+
+class NullMonitor:
+    def record(self, label):
+        pass
+
+
+def make_automation(module, driver=None, http_shortener=None):
+    """브라우저 없이 CoupangPartnersWebAutomation 메서드를 호출할 수 있는 인스턴스"""
+    automation = module.CoupangPartnersWebAutomation.__new__(module.CoupangPartnersWebAutomation)
+    automation.driver = driver or FakeDriver()
+    automation.http_shortener = http_shortener
+    automation.tracer = module.PhaseTracer()
+    automation.waiter = NullWaiter()
+    automation.profile_monitor = NullMonitor()
+    automation.short_url_cache = None
+    automation.result_sink = None
+    automation.owns_result_sink = True
+    automation.snapshots = None
+    automation.products_data = []
+    automation.products_processed = 0
+    automation.direct_link_generation = False
+    automation.wait_timeout = 1
+    automation.tab_pool_size = 3
+    return automation
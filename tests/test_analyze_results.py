@@ -0,0 +1,70 @@
+"""실행 기록 분석 (두 번의 실행 사이 가격/순위 변동)"""
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from analyze_results import load_history, price_changes, rank_movement, with_previous_run  # noqa: E402
+from coupang_products import Product, ProductStatus, ResultSink  # noqa: E402
+
+KEYWORD = "선풍기"
+FAN_A = "https://www.coupang.com/vp/products/1?itemId=11&vendorItemId=111"
+FAN_B = "https://www.coupang.com/vp/products/2?itemId=22&vendorItemId=222"
+FAN_C = "https://www.coupang.com/vp/products/3?itemId=33&vendorItemId=333"
+
+# (run_id, 기록 시각, [(순위, 이름, 가격 문자열, 상품 URL)])
+RUNS = [
+    ("run-1", "2026-01-01 09:00:00", [
+        (1, "선풍기 A", "10,900원", FAN_A + "&traceid=first"),
+        (2, "선풍기 B", "20,000원", FAN_B + "&traceid=first"),
+    ]),
+    ("run-2", "2026-01-02 09:00:00", [
+        (1, "선풍기 B", "할인 2,000원 18,000원", FAN_B + "&traceid=second"),
+        (2, "선풍기 A", "10,900원", FAN_A + "&traceid=second"),
+        (3, "선풍기 C", "31,500원", FAN_C),
+    ]),
+]
+
+
+@pytest.fixture
+def history_path(tmp_path):
+    path = str(tmp_path / "results.jsonl")
+    for run_id, created_at, rows in RUNS:
+        sink = ResultSink(path, run_id)
+        for rank, name, price_text, product_url in rows:
+            sink.write(Product(rank=rank, name=name, price_text=price_text, product_url=product_url,
+                               short_url=f"https://link.coupang.com/a/{run_id}{rank}",
+                               status=ProductStatus.SUCCESS, created_at=created_at), KEYWORD)
+        sink.close()
+    return path
+
+
+def test_load_history_normalizes_prices_and_keys(history_path):
+    history = load_history([history_path])
+    assert len(history) == 5
+    assert str(history['price'].dtype) == "Int64"
+    assert list(history['price']) == [10900, 20000, 18000, 10900, 31500]
+    # 추적 파라미터가 달라도 같은 상품은 같은 키
+    assert history['product_key'].nunique() == 3
+    assert list(history['run_seq']) == [1, 1, 2, 2, 2]
+
+    assert len(load_history([history_path], since="2026-01-02")) == 3
+    assert load_history([history_path], keyword="제습기").empty
+
+
+def test_price_changes_between_runs(history_path):
+    compared = with_previous_run(load_history([history_path]))
+    latest = compared[compared['run_id'] == "run-2"].set_index('name')
+    assert latest.loc["선풍기 B", 'prev_price'] == 20000
+    assert latest.loc["선풍기 A", 'prev_rank'] == 1
+    assert pd.isna(latest.loc["선풍기 C", 'prev_price'])
+
+    changes = price_changes(compared)
+    assert changes[['name', 'prev_price', 'price', 'change', 'change_pct']].values.tolist() == [
+        ["선풍기 B", 20000, 18000, -2000, -10.0]
+    ]
+
+
+def test_rank_movement_between_runs(history_path):
+    moved, summary = rank_movement(with_previous_run(load_history([history_path])))
+    assert dict(zip(moved['name'], moved['movement'])) == {"선풍기 B": 1, "선풍기 A": -1}
+    assert summary.loc[KEYWORD].to_dict() == {'products': 3, 'new_entries': 1, 'moved_up': 1, 'moved_down': 1}
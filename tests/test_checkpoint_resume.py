@@ -0,0 +1,77 @@
+"""배치가 중간에 중단된 뒤 다시 실행해도 완료된 상품을 다시 만들거나 중복 기록하지 않는지 확인"""
+import pytest
+
+from conftest import make_automation
+
+KEYWORD = "선풍기"
+PRODUCT_COUNT = 5
+INTERRUPT_AFTER = 3
+
+
+def search_results(run):
+    """실행마다 추적 파라미터가 달라지는 검색 결과 (2번째 실행에서는 1, 2위가 바뀜)"""
+    ranks = list(range(1, PRODUCT_COUNT + 1))
+    if run > 1:
+        ranks[0], ranks[1] = ranks[1], ranks[0]
+    return [
+        {'rank': position, 'name': f"선풍기 모의 상품 {number}호", 'price': "10,900원",
+         'product_url': (f"https://www.coupang.com/vp/products/{number}?itemId={number}0"
+                         f"&vendorItemId={number}00&traceid=run{run}&sourceType=search")}
+        for position, number in enumerate(ranks, 1)
+    ]
+
+
+class InterruptingAutomation:
+    """검색/링크 생성을 대신하고 지정한 개수만큼 처리한 뒤 Ctrl-C 를 흉내 내는 설정"""
+
+    def __init__(self, automation, module, run, interrupt_after=None):
+        self.created = []
+        automation.navigate_to_affiliate_ws = lambda: True
+        automation.submit_search = lambda keyword: True
+        automation.wait_for_result_cards = lambda count, *args, **kwargs: count
+        automation.extract_multiple_products_info = lambda count: module.products_from_items(search_results(run))
+
+        def create_short_url_for_card(keyword, product, index, single_pass=True):
+            if interrupt_after is not None and len(self.created) == interrupt_after:
+                raise KeyboardInterrupt
+            self.created.append(product.product_url)
+            product.resolve(f"https://link.coupang.com/a/{module.product_identity_key(product.product_url)}")
+
+        automation.create_short_url_for_card = create_short_url_for_card
+
+
+def test_resume_skips_completed_products_despite_new_tracking_params(automation_module, tmp_path):
+    checkpoint_path = str(tmp_path / "checkpoint.json")
+
+    first = make_automation(automation_module)
+    first.export_formats = ('csv',)
+    first_run = InterruptingAutomation(first, automation_module, run=1, interrupt_after=INTERRUPT_AFTER)
+    runner = automation_module.BatchJobRunner(first, automation_module.CheckpointStore(checkpoint_path),
+                                              count=PRODUCT_COUNT, output_dir=str(tmp_path))
+    with pytest.raises(KeyboardInterrupt):
+        runner.run([KEYWORD])
+    assert len(first_run.created) == INTERRUPT_AFTER
+
+    second = make_automation(automation_module)
+    second.export_formats = ('csv',)
+    second_run = InterruptingAutomation(second, automation_module, run=2)
+    checkpoint = automation_module.CheckpointStore(checkpoint_path)
+    result = automation_module.BatchJobRunner(second, checkpoint, count=PRODUCT_COUNT,
+                                              output_dir=str(tmp_path)).run([KEYWORD])
+    assert result == {'done': 1, 'failed': 0, 'skipped': 0}
+
+    # 중단 전에 끝난 상품은 다시 만들지 않고, 남은 상품만 생성
+    identity = automation_module.product_identity_key
+    first_keys = {identity(url) for url in first_run.created}
+    second_keys = {identity(url) for url in second_run.created}
+    assert len(second_run.created) == PRODUCT_COUNT - INTERRUPT_AFTER
+    assert not first_keys & second_keys
+
+    # 체크포인트에는 상품마다 한 항목만 남음
+    products = checkpoint.data['keywords'][KEYWORD]['products']
+    assert len(products) == PRODUCT_COUNT
+    assert all(product['done'] for product in products.values())
+    assert len(checkpoint.completed_products(KEYWORD)) == PRODUCT_COUNT
+    assert sorted(product.short_url for product in second.products_data) == sorted(
+        f"https://link.coupang.com/a/{key}" for key in first_keys | second_keys
+    )
@@ -0,0 +1,101 @@
+"""coupang_products 의 URL/가격 함수와 결과 기록 저장소 (selenium 없이 실행)"""
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from coupang_products import Product, ResultSink, parse_price, product_identity_key
+
+PRODUCT_URLS = [
+    "https://www.coupang.com/vp/products/111?itemId=222&vendorItemId=333",
+    "https://www.coupang.com/vp/products/111?itemId=222&vendorItemId=333&traceid=abc&src=1042503",
+    "https://partners.coupang.com/#affiliate/ws/linkgeneration?productId=444&itemId=555&vendorItemId=666",
+    "https://www.coupang.com/products/777",
+    "https://www.coupang.com/vp/products/888?productId=999",
+    "https://www.coupang.com/np/search?q=fan&itemId=",
+    "https://example.com/",
+    "",
+]
+
+
+def test_product_identity_key():
+    assert product_identity_key(PRODUCT_URLS[0]) == "111:222:333"
+    assert product_identity_key(PRODUCT_URLS[1]) == product_identity_key(PRODUCT_URLS[0])
+    assert product_identity_key(PRODUCT_URLS[2]) == "444:555:666"
+    assert product_identity_key(PRODUCT_URLS[6]) is None
+
+
+def test_product_keys_match_product_identity_key():
+    pd = pytest.importorskip("pandas")
+    from coupang_products import product_keys
+
+    keys = product_keys(pd.Series(PRODUCT_URLS, index=range(10, 10 + len(PRODUCT_URLS))))
+    assert list(keys.index) == list(range(10, 10 + len(PRODUCT_URLS)))
+    expected = [product_identity_key(url) for url in PRODUCT_URLS]
+    assert [None if pd.isna(key) else key for key in keys] == expected
+
+
+def test_parse_price_basic_forms():
+    assert parse_price("12,900원") == 12900
+    assert parse_price("₩12,900") == 12900
+    assert parse_price("12900") == 12900
+    assert parse_price("가격정보없음") is None
+    assert parse_price("") is None
+
+
+# 할인/쿠폰/적립 금액이 가격보다 앞에 있거나 작아도 최종 가격을 골라야 함
+PRICE_CASES = [
+    ("할인 2,000원 10,900원", 10900),
+    ("즉시할인 3,000원\n정가 15,000원\n12,000원", 12000),
+    ("쿠폰 1,000원 12,900원", 12900),
+    ("할인쿠폰 2,000원 12,900원", 12900),
+    ("캐시적립 500원 9,900원", 9900),
+    ("최대 645원 적립 12,900원", 12900),
+    ("2,000원 할인 12,900원", 12900),
+    ("와우할인 1,000원 12,900원", 12900),
+    ("배송비 2,500원 9,900원", 9900),
+    ("쿠폰할인가 11,610원 12,900원~", 11610),
+    ("12,900원\n쿠폰적용가 11,610원", 11610),
+    ("정가 15,000원 12,900원", 12900),
+    ("42%\n15,000원\n8,700원\n(10g당 870원)", 8700),
+]
+
+
+@pytest.mark.parametrize("text, expected", PRICE_CASES)
+def test_parse_price_discount_forms(text, expected):
+    assert parse_price(text) == expected
+
+
+def test_normalize_prices_matches_parse_price():
+    pd = pytest.importorskip("pandas")
+    from coupang_products import normalize_prices
+
+    texts = [text for text, _ in PRICE_CASES] + ["가격정보없음", None, "12900"]
+    prices = normalize_prices(pd.Series(texts, index=range(100, 100 + len(texts))))
+    assert prices.name == "price"
+    assert str(prices.dtype) == "Int64"
+    assert list(prices.index) == list(range(100, 100 + len(texts)))
+    assert [None if pd.isna(price) else int(price) for price in prices] == [parse_price(text) for text in texts]
+
+
+def test_result_sink_shared_across_threads(tmp_path):
+    path = tmp_path / "results.jsonl"
+    sink = ResultSink(str(path), "run-1")
+
+    def write(index):
+        keyword = "선풍기" if index % 2 else "제습기"
+        sink.write(Product(rank=index, name=f"상품 {index}", price=index * 1000), keyword)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(write, range(1, 41)))
+
+    assert sink.count == 40
+    assert sink.keyword_counts["선풍기"] == 20
+    assert sink.keyword_counts["제습기"] == 20
+    fans = list(sink.records("선풍기"))
+    assert len(fans) == sink.keyword_counts["선풍기"]
+    assert sorted(product.rank for product in fans) == list(range(1, 41, 2))
+    sink.close()
+
+    # 줄이 섞이지 않고 모두 읽힘
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 40
+    assert len(list(ResultSink.read(str(path), "run-1"))) == 40
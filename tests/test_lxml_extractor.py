@@ -0,0 +1,93 @@
+"""저장된 검색 결과 스냅샷에서 LxmlExtractor 가 BATCH_EXTRACT_PRODUCTS_JS 와 같은 상품 레코드를 만드는지 확인
+
+fixtures/search_snapshot 은 SnapshotRecorder 형식이며, manifest 의 expected 는
+같은 HTML 에 BATCH_EXTRACT_PRODUCTS_JS 를 실행한 결과다. (숨김 카드, 이름 없는 광고 카드,
+할인 배지가 첫 줄인 카드, 상대 경로 링크/이미지, data-src 이미지 포함)
+"""
+import os
+import pathlib
+import shutil
+
+import pytest
+
+SNAPSHOT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "search_snapshot")
+FIELDS = ('name', 'price', 'product_url', 'image_url')
+
+
+@pytest.fixture(scope="module")
+def snapshot(automation_module):
+    [(record, path)] = automation_module.SnapshotRecorder.iter_snapshots(SNAPSHOT_DIR)
+    with open(path, 'r', encoding='utf-8') as f:
+        return record, path, f.read()
+
+
+@pytest.fixture(scope="module")
+def lxml_result(automation_module, snapshot):
+    if not automation_module.LxmlExtractor.available():
+        pytest.skip("lxml/cssselect 가 설치되지 않음")
+    record, _, html_text = snapshot
+    return automation_module.LxmlExtractor().extract_products(html_text, 10, base_url=record['url'])
+
+
+def records(products):
+    return [{field: product.get(field) or '' for field in FIELDS} for product in products]
+
+
+def test_lxml_matches_recorded_script_output(snapshot, lxml_result):
+    record, _, _ = snapshot
+    assert lxml_result['selector'] == ".product-item"
+    # 숨김 카드는 빠지고, 이름 없는 광고 카드는 순번만 차지
+    assert lxml_result['total'] == 5
+    assert [product['rank'] for product in lxml_result['products']] == [1, 2, 3, 5]
+    assert records(lxml_result['products']) == record['expected']
+
+
+def test_replay_reports_every_product_matched(automation_module, lxml_result):
+    from replay_snapshots import replay
+    stats = replay(SNAPSHOT_DIR, automation_module)
+    assert stats['search_pages'] == 1
+    assert stats['products_matched'] == stats['products'] == 4
+    assert stats['mismatches'] == []
+
+
+def chrome_binary():
+    for name in ("google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome"):
+        path = shutil.which(name)
+        if path:
+            return path
+    return None
+
+
+@pytest.fixture(scope="module")
+def headless_chrome(automation_module):
+    if not (chrome_binary() and shutil.which("chromedriver")):
+        pytest.skip("Chrome/chromedriver 가 없어 브라우저 비교를 건너뜀")
+    options = automation_module.webdriver.ChromeOptions()
+    options.binary_location = chrome_binary()
+    for argument in ("--headless=new", "--no-sandbox", "--disable-gpu"):
+        options.add_argument(argument)
+    driver = automation_module.webdriver.Chrome(options=options)
+    yield driver
+    driver.quit()
+
+
+def test_script_in_browser_matches_lxml(automation_module, snapshot, lxml_result, headless_chrome):
+    record, path, _ = snapshot
+    headless_chrome.get(pathlib.Path(path).as_uri())
+    # 상대 경로가 스냅샷을 찍은 페이지 기준으로 풀리도록 <base> 지정
+    headless_chrome.execute_script(
+        "var base = document.createElement('base'); base.href = arguments[0]; document.head.prepend(base);",
+        record['url']
+    )
+    script_result = headless_chrome.execute_script(
+        automation_module.BATCH_EXTRACT_PRODUCTS_JS,
+        automation_module.PRODUCT_CARD_SELECTORS,
+        automation_module.PRODUCT_NAME_SELECTORS,
+        automation_module.PRODUCT_LINK_SELECTORS,
+        automation_module.PRODUCT_PRICE_SELECTORS,
+        10
+    )
+    assert script_result['selector'] == lxml_result['selector']
+    assert script_result['total'] == lxml_result['total']
+    assert script_result['products'] == lxml_result['products']
+    assert records(script_result['products']) == record['expected']
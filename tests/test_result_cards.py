@@ -0,0 +1,68 @@
+"""검색 결과 렌더링 확인(count_result_cards)이 실제 상품 카드만 세는지 확인"""
+import pytest
+
+from conftest import make_automation
+
+# 해시가 바뀐 직후 모의 사이트 화면: 검색창과 빈 결과 컨테이너만 있음 (메뉴 항목은 실제 사이트 머리글 흉내)
+EMPTY_RESULTS_HTML = """<html><body><div id="app">
+<ul class="ant-menu"><li class="ant-menu-item"><a href="/#affiliate/ws">제휴 워크스페이스 바로가기</a></li></ul>
+<div class="search-bar"><input class="ant-input ant-input-lg" value="선풍기">
+<button class="ant-btn search-button" type="button">검색</button></div>
+<div class="search-results"></div>
+</div></body></html>"""
+
+CARD_HTML = ('<div class="search-product" data-testid="product-item"><img src="/static/product.png" alt="">'
+             '<div class="product-name">선풍기 모의 상품 {rank}호 고급형</div><div class="price">{price}원</div>'
+             '<a class="product-link" href="/vp/products/{rank}?itemId=1&amp;vendorItemId=2">상품 보기</a></div>')
+
+RENDERED_RESULTS_HTML = EMPTY_RESULTS_HTML.replace(
+    '<div class="search-results"></div>',
+    '<div class="search-results">' + ''.join(CARD_HTML.format(rank=rank, price=f"{rank},900") for rank in (1, 2, 3)) + '</div>'
+)
+
+
+class ScriptDriver:
+    """execute_script 를 LxmlExtractor 로 대신 실행하는 WebDriver 대역 (COUNT_RESULT_CARDS_JS 만 지원)"""
+
+    def __init__(self, module, page_source):
+        self.module = module
+        self.page_source = page_source
+        self.current_url = "https://partners.coupang.com/#affiliate/ws/search?keyword=fan"
+        self.scripts = []
+
+    def execute_script(self, script, *args):
+        assert script == self.module.COUNT_RESULT_CARDS_JS
+        self.scripts.append(args)
+        return self.module.LxmlExtractor().count_cards(self.page_source, args[0])
+
+
+@pytest.fixture
+def extractor_module(automation_module):
+    if not automation_module.LxmlExtractor.available():
+        pytest.skip("lxml/cssselect 필요")
+    return automation_module
+
+
+def test_empty_results_container_is_not_a_card(extractor_module):
+    extractor = extractor_module.LxmlExtractor()
+    assert extractor.count_cards(EMPTY_RESULTS_HTML) == 0
+    # 넓은 폴백 셀렉터까지 쓰면 메뉴 항목이 카드처럼 보이므로 렌더링 확인에는 쓰지 않음
+    assert extractor.count_cards(EMPTY_RESULTS_HTML, extractor_module.PRODUCT_CARD_SELECTORS) > 0
+    assert extractor.count_cards(RENDERED_RESULTS_HTML) == 3
+
+
+def test_count_result_cards_waits_for_product_cards(extractor_module):
+    automation = make_automation(extractor_module, driver=ScriptDriver(extractor_module, EMPTY_RESULTS_HTML))
+    assert automation.count_result_cards() == 0
+
+    automation.driver.page_source = RENDERED_RESULTS_HTML
+    assert automation.count_result_cards() == 3
+    assert all(args == (extractor_module.RESULT_CARD_SELECTORS,) for args in automation.driver.scripts)
+
+
+def test_card_scripts_share_one_collector(automation_module):
+    for script in (automation_module.BATCH_EXTRACT_PRODUCTS_JS, automation_module.CARD_INDEX_JS,
+                   automation_module.COUNT_RESULT_CARDS_JS):
+        assert script.startswith(automation_module.CARD_COLLECT_JS)
+        assert "collectCards(" in script[len(automation_module.CARD_COLLECT_JS):]
+    assert not set(automation_module.RESULT_CARD_SELECTORS) & set(automation_module.LOOSE_CARD_SELECTORS)
@@ -0,0 +1,69 @@
+"""SelectorResolver 가 성공한 셀렉터를 앞으로 올리되 넓은 카드 셀렉터는 학습하지 않는지 확인"""
+import json
+
+import pytest
+
+STRICT = ".product-item"
+OTHER_STRICT = ".search-product"
+LOOSE = "[class*='item']"
+
+
+@pytest.fixture
+def card_selectors(automation_module):
+    return automation_module.PRODUCT_CARD_SELECTORS
+
+
+def make_resolver(module, cache_path):
+    return module.SelectorResolver(str(cache_path), fallback_only={"product_card": module.LOOSE_CARD_SELECTORS})
+
+
+def test_hit_moves_selector_to_front(automation_module, card_selectors, tmp_path):
+    resolver = make_resolver(automation_module, tmp_path / "selectors.json")
+    order = resolver.ordered("product_card", card_selectors)
+    assert order == card_selectors
+
+    resolver.record_hit("product_card", OTHER_STRICT)
+    order = resolver.ordered("product_card", card_selectors)
+    assert order[0] == OTHER_STRICT
+    assert sorted(order) == sorted(card_selectors)
+    # 성공 셀렉터보다 앞에 있던 셀렉터는 실패로 기록
+    assert resolver.stats["product_card"][card_selectors[0]] == {'hits': 0, 'misses': 1}
+
+
+def test_loose_selector_hit_is_counted_but_not_promoted(automation_module, card_selectors, tmp_path):
+    resolver = make_resolver(automation_module, tmp_path / "selectors.json")
+    resolver.record_hit("product_card", STRICT)
+    resolver.ordered("product_card", card_selectors)
+    resolver.record_hit("product_card", LOOSE)
+
+    order = resolver.ordered("product_card", card_selectors)
+    assert order[0] == STRICT
+    assert order.index(LOOSE) == card_selectors.index(LOOSE)
+    assert resolver.stats["product_card"][LOOSE]['hits'] == 1
+    assert LOOSE not in resolver.rankings["product_card"]
+
+
+def test_rankings_persist_across_runs(automation_module, card_selectors, tmp_path):
+    cache_path = tmp_path / "selectors.json"
+    resolver = make_resolver(automation_module, cache_path)
+    resolver.ordered("product_card", card_selectors)
+    resolver.record_hit("product_card", OTHER_STRICT)
+    resolver.save()
+
+    saved = json.loads(cache_path.read_text(encoding='utf-8'))
+    assert saved['rankings'] == {"product_card": [OTHER_STRICT]}
+
+    reloaded = make_resolver(automation_module, cache_path)
+    assert reloaded.ordered("product_card", card_selectors)[0] == OTHER_STRICT
+    assert reloaded.stats["product_card"][OTHER_STRICT]['hits'] == 1
+
+
+def test_previously_learned_loose_selector_is_ignored(automation_module, card_selectors, tmp_path):
+    # 이전 버전이 넓은 셀렉터를 1순위로 저장해 둔 캐시
+    cache_path = tmp_path / "selectors.json"
+    cache_path.write_text(json.dumps({'rankings': {"product_card": [LOOSE, STRICT]}, 'stats': {}}),
+                          encoding='utf-8')
+
+    order = make_resolver(automation_module, cache_path).ordered("product_card", card_selectors)
+    assert order[0] == STRICT
+    assert order.index(LOOSE) == card_selectors.index(LOOSE)
@@ -0,0 +1,83 @@
+"""캡처한 단축 URL API 요청을 새 상품으로 바꿔 모의 사이트의 /api/shorten 으로 보내는지 확인"""
+import json
+
+import pytest
+
+from coupang_products import PRODUCT_ID_PARAMS, parse_product_url
+from mock_partners_site import MockPartnersServer
+
+SOURCE_IDS = {'productId': '111', 'itemId': '222', 'vendorItemId': '333'}
+TARGET_URL = "https://www.coupang.com/vp/products/444?itemId=555&vendorItemId=666"
+
+
+@pytest.fixture
+def http_client_class(automation_module):
+    pytest.importorskip("requests")
+    return automation_module.ShortLinkHttpClient
+
+
+@pytest.fixture
+def mock_server():
+    server = MockPartnersServer(render_delay=0, search_delay=0, api_delay=0, product_count=3).start()
+    yield server
+    server.stop()
+
+
+def captured_endpoint(url, post_data=None, source_ids=SOURCE_IDS):
+    """capture_shorten_endpoint 가 만드는 형태의 요청 정보"""
+    if post_data is None:
+        post_data = json.dumps(source_ids)
+    return {
+        'url': url,
+        'method': 'POST',
+        'headers': {':authority': 'partners.coupang.com', 'Content-Type': 'application/json', 'Cookie': 'a=b'},
+        'post_data': post_data,
+        'source_ids': dict(source_ids)
+    }
+
+
+def test_build_request_substitutes_url_and_body(http_client_class):
+    client = http_client_class(captured_endpoint(
+        "https://partners.coupang.com/api/shorten?productId=111&itemId=222&vendorItemId=333&page=1111"
+    ))
+    url, post_data = client.build_request(TARGET_URL)
+    assert url == "https://partners.coupang.com/api/shorten?productId=444&itemId=555&vendorItemId=666&page=1111"
+    assert json.loads(post_data) == {'productId': '444', 'itemId': '555', 'vendorItemId': '666'}
+    assert 'Cookie' not in client.session.headers
+    assert ':authority' not in client.session.headers
+
+
+def test_build_request_without_placeholder_is_rejected(http_client_class):
+    # 캡처한 요청 어디에도 원래 상품의 식별자가 없으면 새 상품으로 바꿀 수 없음
+    client = http_client_class(captured_endpoint("https://partners.coupang.com/api/shorten", post_data='{}'))
+    assert client.build_request(TARGET_URL) is None
+    assert client.shorten(TARGET_URL) is None
+    assert client.calls == 0
+
+
+def test_build_request_missing_target_id_is_rejected(http_client_class):
+    client = http_client_class(captured_endpoint("https://partners.coupang.com/api/shorten"))
+    assert client.build_request("https://www.coupang.com/vp/products/444") is None
+
+
+def test_shorten_round_trips_through_mock_server(http_client_class, mock_server):
+    source, target = mock_server.search("선풍기")[:2]
+    source_info = parse_product_url(source['product_url'])
+    source_ids = {name: source_info[name] for name in PRODUCT_ID_PARAMS}
+    client = http_client_class(captured_endpoint(f"{mock_server.base_url}/api/shorten", source_ids=source_ids))
+
+    assert client.shorten(target['product_url']) == target['short_url']
+    assert client.shorten(source['product_url']) == source['short_url']
+    assert target['short_url'] != source['short_url']
+    assert mock_server.shorten_calls == 2
+    assert client.calls == 2
+    assert client.failures == 0
+
+
+def test_shorten_counts_failures_until_disabled(http_client_class, mock_server):
+    client = http_client_class(captured_endpoint(f"{mock_server.base_url}/api/missing"), max_failures=2)
+    assert client.shorten(TARGET_URL) is None
+    assert client.shorten(TARGET_URL) is None
+    assert not client.enabled
+    assert client.shorten(TARGET_URL) is None
+    assert client.calls == 2
@@ -0,0 +1,104 @@
+"""ShortUrlCache 의 TTL 만료와 최대 개수(LRU) 정리 확인"""
+import pytest
+
+DAY = 86400
+
+
+def product(number):
+    return f"https://www.coupang.com/vp/products/{number}?itemId={number}0&vendorItemId={number}00"
+
+
+def short(number):
+    return f"https://link.coupang.com/a/p{number}"
+
+
+class FakeClock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def make_cache(automation_module, tmp_path, clock):
+    caches = []
+
+    def make(**kwargs):
+        cache = automation_module.ShortUrlCache(str(tmp_path / "short_urls.sqlite3"), clock=clock, **kwargs)
+        caches.append(cache)
+        return cache
+
+    yield make
+    for cache in caches:
+        cache.close()
+
+
+def test_entry_expires_after_ttl(make_cache, clock):
+    cache = make_cache(ttl_days=1)
+    cache.put(product(1), short(1))
+
+    clock.advance(DAY - 1)
+    # 추적 파라미터가 붙어도 같은 상품이면 적중
+    assert cache.get(product(1) + "&traceid=abc") == short(1)
+
+    clock.advance(2)
+    assert cache.get(product(1)) is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # 만료된 항목은 지워져 시간을 되돌려도 다시 나오지 않음
+    clock.advance(-DAY)
+    assert cache.get(product(1)) is None
+
+
+def test_ttl_counts_from_creation_not_last_use(make_cache, clock):
+    cache = make_cache(ttl_days=1)
+    cache.put(product(1), short(1))
+    clock.advance(DAY / 2)
+    assert cache.get(product(1)) == short(1)
+    clock.advance(DAY / 2 + 1)
+    assert cache.get(product(1)) is None
+
+
+def test_no_ttl_never_expires(make_cache, clock):
+    cache = make_cache(ttl_days=None)
+    cache.put(product(1), short(1))
+    clock.advance(365 * DAY)
+    assert cache.get(product(1)) == short(1)
+
+
+def test_evicts_least_recently_used_at_cap(make_cache, clock):
+    cache = make_cache(max_entries=3)
+    for number in (1, 2, 3):
+        cache.put(product(number), short(number))
+        clock.advance(1)
+
+    # 1번을 조회해 최근 사용으로 만들면 4번을 넣을 때 2번이 지워짐
+    assert cache.get(product(1)) == short(1)
+    clock.advance(1)
+    cache.put(product(4), short(4))
+
+    assert cache.conn.execute("SELECT COUNT(*) FROM short_urls").fetchone()[0] == 3
+    assert cache.get(product(2)) is None
+    assert [cache.get(product(number)) for number in (1, 3, 4)] == [short(1), short(3), short(4)]
+
+
+def test_cache_persists_across_instances(make_cache, clock):
+    make_cache().put(product(1), short(1))
+    clock.advance(1)
+    assert make_cache().get(product(1)) == short(1)
+
+
+def test_put_ignores_non_short_urls(make_cache):
+    cache = make_cache()
+    cache.put(product(1), "https://www.coupang.com/vp/products/1")
+    cache.put("https://example.com/", short(2))
+    assert cache.conn.execute("SELECT COUNT(*) FROM short_urls").fetchone()[0] == 0
@@ -0,0 +1,192 @@
+"""단축 URL 생성 성공 경로가 (상품 식별 정보, 단축 URL, 실패 사유) 를 돌려주고 Product 에 기록되는지 확인"""
+import json
+
+import pytest
+
+from conftest import FakeDriver, FakeShortener, make_automation
+
+LINK_GENERATION_URL = ("https://partners.coupang.com/#affiliate/ws/linkgeneration"
+                       "?productId=111&itemId=222&vendorItemId=333")
+PRODUCT_URL = "https://www.coupang.com/vp/products/111?itemId=222&vendorItemId=333"
+SHORT_URL = "https://link.coupang.com/a/abc123"
+
+
+def link_generation_automation(module):
+    automation = make_automation(module, driver=FakeDriver(LINK_GENERATION_URL))
+    automation.learn_link_generation_template = lambda url: None
+    automation.read_short_url_from_dom = lambda: SHORT_URL
+    automation.capture_snapshot = lambda kind, expected=None: None
+    automation.capture_shorten_endpoint = lambda: None
+    return automation
+
+
+def test_current_tab_success_returns_three_values(automation_module):
+    automation = link_generation_automation(automation_module)
+    product_info, short_url, error = automation.generate_short_url_in_current_tab(PRODUCT_URL, preloaded=True)
+    assert product_info['productId'] == '111'
+    assert short_url == SHORT_URL
+    assert error == ""
+
+
+class CapturingDriver(FakeDriver):
+    """단축 URL API 응답 하나가 성능 로그에 남아 있는 WebDriver 대역"""
+
+    def get_log(self, kind):
+        events = [
+            ('Network.requestWillBeSent', {'requestId': '1', 'request': {
+                'url': "https://partners.coupang.com/api/shorten", 'method': 'POST',
+                'headers': {}, 'postData': '{"productId": "111"}'}}),
+            ('Network.responseReceived', {'requestId': '1', 'type': 'XHR'}),
+        ]
+        return [{'message': json.dumps({'message': {'method': method, 'params': params}})}
+                for method, params in events]
+
+    def execute_cdp_cmd(self, command, params):
+        return {'body': json.dumps({'shortUrl': SHORT_URL})}
+
+    def get_cookies(self):
+        return []
+
+
+def test_current_tab_capture_uses_this_products_ids(automation_module):
+    pytest.importorskip("requests")
+    automation = link_generation_automation(automation_module)
+    automation.driver = CapturingDriver(LINK_GENERATION_URL)
+    del automation.capture_shorten_endpoint
+    automation.http_shortening = True
+    # 이전 상품에서 남은 링크 생성 페이지 URL
+    automation.last_link_generation_url = LINK_GENERATION_URL.replace("111", "999")
+
+    automation.generate_short_url_in_current_tab(PRODUCT_URL, preloaded=True)
+    assert automation.last_link_generation_url == LINK_GENERATION_URL
+    assert automation.shorten_endpoint['source_ids'] == {'productId': '111', 'itemId': '222', 'vendorItemId': '333'}
+
+
+def test_extract_short_url_falls_back_to_page_source(automation_module):
+    page_source = f'<html><body><script>window.__STATE__ = {{"shortUrl": "{SHORT_URL}"}}</script></body></html>'
+    automation = make_automation(automation_module, driver=FakeDriver(LINK_GENERATION_URL, page_source))
+    automation.read_short_url_from_dom = lambda: None
+    automation.find_first_element = lambda *args, **kwargs: None
+    automation.capture_snapshot = lambda kind, expected=None: None
+    assert automation.extract_short_url_from_page() == SHORT_URL
+
+
+def test_single_http_success_returns_three_values(automation_module):
+    automation = make_automation(automation_module, http_shortener=FakeShortener(SHORT_URL))
+    product_info, short_url, error = automation.generate_single_short_url_with_info(PRODUCT_URL)
+    assert product_info['itemId'] == '222'
+    assert short_url == SHORT_URL
+    assert error == ""
+
+
+def test_generate_for_all_records_success(automation_module):
+    automation = make_automation(automation_module, http_shortener=FakeShortener(SHORT_URL))
+    product = automation_module.Product(rank=1, name="상품", product_url=PRODUCT_URL)
+    automation.products_data = [product]
+    automation.generate_short_urls_for_all()
+    assert product.status is automation_module.ProductStatus.SUCCESS
+    assert product.short_url == SHORT_URL
+
+
+class FakeTabPool:
+    """탭을 열지 않고 어떤 탭에 어떤 URL 을 로드했는지 기록하는 TabPool 대역"""
+
+    instances = []
+
+    def __init__(self, driver, size):
+        self.handles = [f"tab-{i}" for i in range(size)]
+        self.loads = []
+        self.opened = self.closed = 0
+        FakeTabPool.instances.append(self)
+
+    def open(self):
+        self.opened += 1
+
+    def switch(self, handle):
+        pass
+
+    def load(self, handle, url):
+        self.loads.append((handle, url))
+
+    def wait_for_ready(self, handles, waiter, timeout=None):
+        return handles[0]
+
+    def close(self):
+        self.closed += 1
+
+
+@pytest.fixture
+def fake_tab_pool(automation_module, monkeypatch):
+    FakeTabPool.instances = []
+    monkeypatch.setattr(automation_module, "TabPool", FakeTabPool)
+    return FakeTabPool
+
+
+def test_tab_pool_records_success(automation_module, fake_tab_pool):
+    automation = link_generation_automation(automation_module)
+    automation.apply_resource_blocking = lambda: None
+    products = [automation_module.Product(rank=rank, name="상품", product_url=PRODUCT_URL) for rank in (1, 2)]
+    automation.generate_short_urls_with_tab_pool(products, size=2)
+    assert all(product.ok and product.short_url == SHORT_URL for product in products)
+
+
+def test_tab_pool_reuses_tabs_across_products(automation_module, fake_tab_pool):
+    automation = link_generation_automation(automation_module)
+    automation.apply_resource_blocking = lambda: None
+    automation.products_data = [
+        automation_module.Product(rank=rank, name=f"상품 {rank}", product_url=f"{PRODUCT_URL}&rank={rank}")
+        for rank in range(1, 8)
+    ]
+    automation.generate_short_urls_for_all()
+
+    [tabs] = fake_tab_pool.instances
+    assert (tabs.opened, tabs.closed) == (1, 1)
+    assert len(tabs.handles) == automation.tab_pool_size == 3
+    assert len(tabs.loads) == 7
+    assert {handle for handle, _ in tabs.loads} == set(tabs.handles)
+    assert all(product.ok for product in automation.products_data)
+
+
+def test_worker_pool_product_urls_use_tab_pool(automation_module, fake_tab_pool):
+    pool = automation_module.CoupangWorkerPool(1, "", "", tab_pool_size=2)
+    worker = link_generation_automation(automation_module)
+    worker.apply_resource_blocking = lambda: None
+    worker.tab_pool_size = 2
+    pool.workers = [worker]
+    product_urls = [f"{PRODUCT_URL}&rank={rank}" for rank in range(1, 11)]
+
+    products = pool.run_product_urls(product_urls)
+    assert [product.rank for product in products] == list(range(1, 11))
+    assert all(product.ok for product in products)
+    # 8개씩 묶은 작업마다 탭 2개를 열어 여러 상품에 재사용
+    assert [len(tabs.loads) for tabs in fake_tab_pool.instances] == [8, 2]
+    assert all(len(tabs.handles) <= 2 for tabs in fake_tab_pool.instances)
+
+
+def test_worker_pool_product_urls_keeps_successes(automation_module):
+    pool = automation_module.CoupangWorkerPool(1, "", "")
+    pool.workers = [make_automation(automation_module, http_shortener=FakeShortener(SHORT_URL))]
+    products = pool.run_product_urls([PRODUCT_URL, PRODUCT_URL])
+    assert [product.rank for product in products] == [1, 2]
+    assert all(product.ok for product in products)
+
+
+def test_save_results_names_file_with_logged_row_count(automation_module, tmp_path):
+    automation = make_automation(automation_module)
+    automation.result_sink = automation_module.ResultSink(str(tmp_path / "results.jsonl"), "run-1")
+    for rank in range(1, 4):
+        automation.result_sink.write(automation_module.Product(rank=rank, name=f"상품 {rank}"), "선풍기")
+    filenames = automation.save_results("선풍기", formats=('csv',), output_dir=str(tmp_path))
+    automation.result_sink.close()
+    assert len(filenames) == 1
+    assert "_TOP3_선풍기_" in filenames[0]
+
+
+def test_save_results_records_a_trace_span(automation_module, tmp_path):
+    automation = make_automation(automation_module)
+    automation.products_data = [automation_module.Product(rank=1, name="상품 1", keyword="선풍기")]
+    automation.save_results("선풍기", formats=('csv',), output_dir=str(tmp_path))
+    assert automation.tracer.summary()["save_results"]["count"] == 1
+
+    automation.save_results_to_excel("선풍기", output_dir=str(tmp_path))
+    assert automation.tracer.summary()["save_results"]["count"] == 2
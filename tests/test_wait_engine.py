@@ -0,0 +1,68 @@
+"""WaitEngine 의 조건 폴링/시간 초과와 검색 결과 렌더링 대기"""
+import pytest
+
+from conftest import FakeDriver, make_automation
+
+SEARCH_URL = "https://partners.coupang.com/#affiliate/ws/search?keyword=fan"
+LINK_GENERATION_URL = "https://partners.coupang.com/#affiliate/ws/linkgeneration?productId=111"
+
+
+def sequence_condition(values):
+    """호출할 때마다 values 를 차례로 돌려주는 조건 (호출 횟수는 calls 에 기록)"""
+    calls = []
+
+    def condition(driver):
+        calls.append(driver)
+        value = values[min(len(calls), len(values)) - 1]
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+    return condition, calls
+
+
+def test_until_polls_until_condition_is_met(automation_module):
+    driver = FakeDriver(SEARCH_URL)
+    waiter = automation_module.WaitEngine(driver, timeout=2, poll_frequency=0.01)
+    condition, calls = sequence_condition([None, RuntimeError("not yet"), 0, "ready"])
+
+    assert waiter.until(condition, "search_results") == "ready"
+    assert len(calls) == 4
+    assert all(called is driver for called in calls)
+    assert [(record['label'], record['ok']) for record in waiter.records] == [("search_results", True)]
+
+
+def test_until_times_out(automation_module):
+    waiter = automation_module.WaitEngine(FakeDriver(), timeout=2, poll_frequency=0.01)
+    condition, calls = sequence_condition([None])
+
+    assert waiter.until(condition, "history_restore", timeout=0.05) is None
+    assert len(calls) > 1
+    record = waiter.records[-1]
+    assert record['ok'] is False
+    assert record['timeout'] == 0.05
+    assert record['seconds'] >= 0.05
+
+    with pytest.raises(automation_module.TimeoutException):
+        waiter.until(condition, "history_restore", timeout=0.02, raise_on_timeout=True)
+    assert waiter.summary()['history_restore']['timeouts'] == 2
+
+
+def test_wait_for_result_cards_waits_for_enough_cards(automation_module):
+    automation = make_automation(automation_module, driver=FakeDriver(SEARCH_URL))
+    automation.waiter = automation_module.WaitEngine(automation.driver, timeout=2, poll_frequency=0.01)
+    counts = iter([0, 1, 1, 3])
+    automation.count_result_cards = lambda: next(counts, 3)
+
+    assert automation.wait_for_result_cards(2) == 3
+    assert automation.waiter.records[-1]['label'] == "search_results"
+
+
+def test_wait_for_result_cards_ignores_link_generation_page(automation_module):
+    automation = make_automation(automation_module, driver=FakeDriver(LINK_GENERATION_URL))
+    automation.waiter = automation_module.WaitEngine(automation.driver, timeout=2, poll_frequency=0.01)
+    automation.count_result_cards = lambda: 20
+
+    assert automation.wait_for_result_cards(1, "history_restore", timeout=0.05) is None
+    with pytest.raises(automation_module.TimeoutException):
+        automation.wait_for_result_cards(1, "history_restore", timeout=0.02, raise_on_timeout=True)